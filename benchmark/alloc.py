@@ -0,0 +1,65 @@
+"""
+transient memory of a single next() call, the calendar state is one list
+moved in place so the peak stays flat however deep the tree is,
+side by side with a baseline checkout when given one, the state cursor
+against the tree before it with
+
+    python -m benchmark.alloc
+    git worktree add /tmp/base 4688d44^
+    git worktree add /tmp/head 4688d44
+    python -m benchmark.alloc /tmp/base /tmp/head
+"""
+
+import sys
+import tracemalloc
+from datetime import datetime
+from typing import List
+
+from xchronos import ChronoX
+
+CASES = (
+    ("* * * 0 0 0 ; c", datetime(2003, 1, 31, 23, 59, 59)),
+    ("* * 1 0 0 0 ; c", datetime(2003, 1, 31, 23, 59, 59)),
+    ("* 1,3 L1 0 0 0 ; c", datetime(2003, 1, 31, 23, 59, 59)),
+    ("* * 1 1 0 0 0 ; m", datetime(2003, 1, 31, 23, 59, 59)),
+    ("* 1 1 0 0 0 ; w", datetime(2003, 12, 28, 23, 59, 59)),
+)
+NUMBER = 1000
+
+
+def bench(chronos, now: datetime) -> float:
+    # warm up lazy caches, only the call itself is measured
+    chronos.next(now, 1000)
+    tracemalloc.start()
+    peak = 0
+    for _ in range(NUMBER):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        chronos.next(now, 1000)
+        _, top = tracemalloc.get_traced_memory()
+        peak += top - base
+    tracemalloc.stop()
+    return peak / NUMBER
+
+
+def measure() -> List[float]:
+    """peak bytes of next() per case"""
+    return [bench(ChronoX(cron), now) for cron, now in CASES]
+
+
+def main():
+    # imported here, the baseline run loads this file alone under the other tree
+    from benchmark.baseline import columns
+
+    res, base = columns(__file__, measure, sys.argv)
+    head = f"{'expression':>20} {'peak bytes per next':>20}"
+    print(head + (f" {'base bytes':>11} {'ratio':>6}" if base else ""))
+    for k, ((cron, _), size) in enumerate(zip(CASES, res)):
+        row = f"{cron:>20} {size:>20.0f}"
+        if base:
+            row += f" {base[k]:>11.0f} {size / base[k]:>6.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
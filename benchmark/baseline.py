@@ -0,0 +1,45 @@
+"""
+numbers of a benchmark measured on other checkouts of xchronos, e.g. the trees
+before and after a change, to compare them side by side
+
+    git worktree add /tmp/base <commit>^
+    git worktree add /tmp/head <commit>
+    python -m benchmark.boundary /tmp/base /tmp/head
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Callable, List, Tuple, Union
+
+# load the benchmark file alone, its xchronos import resolves in the other tree
+_CHILD = (
+    "import json, runpy, sys; sys.path.insert(0, sys.argv[1]); "
+    "print(json.dumps(runpy.run_path(sys.argv[2])['measure']()))"
+)
+
+
+def against(script: str, tree: str) -> List[float]:
+    """measure() of script run on the checkout at tree"""
+    tree = os.path.abspath(tree)
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, tree, os.path.abspath(script)],
+        cwd=tree,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def columns(
+    script: str, measure: Callable[[], List[float]], argv: List[str]
+) -> Tuple[List[float], Union[List[float], None]]:
+    """
+    numbers of the checkout argv[2] (of the working tree without it),
+    and of the baseline checkout argv[1], None without one
+    """
+    base = against(script, argv[1]) if len(argv) > 1 else None
+    head = against(script, argv[2]) if len(argv) > 2 else measure()
+    return head, base
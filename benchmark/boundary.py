@@ -0,0 +1,55 @@
+"""
+latency of next() at boundaries, where resetting rolls over to the next
+parent mark (the last second of a month, a year, past the last mark of a day),
+side by side with a baseline checkout when given one, the exception-free reset
+against the tree before it with
+
+    python -m benchmark.boundary
+    git worktree add /tmp/base a5ef26c^
+    git worktree add /tmp/head a5ef26c
+    python -m benchmark.boundary /tmp/base /tmp/head
+"""
+
+import sys
+from datetime import datetime
+from timeit import repeat
+from typing import List
+
+from xchronos import ChronoX
+
+CASES = (
+    ("* * 1 0 0 0 ; c", datetime(2003, 1, 31, 23, 59, 59)),
+    ("* 1 1 0 0 0 ; c", datetime(2003, 12, 31, 23, 59, 59)),
+    ("* * 15 12 0 0 ; c", datetime(2003, 1, 20, 0, 0, 0)),
+    ("* * 1 1 0 0 0 ; m", datetime(2003, 1, 31, 23, 59, 59)),
+    ("* 1 1 0 0 0 ; w", datetime(2003, 12, 28, 23, 59, 59)),
+)
+NUMBER = 5000
+
+
+def measure() -> List[float]:
+    """best us of next() per case"""
+    res = []
+    for cron, now in CASES:
+        chronos = ChronoX(cron)
+        best = min(repeat(lambda: chronos.next(now), number=NUMBER, repeat=5))
+        res.append(best / NUMBER * 1e6)
+    return res
+
+
+def main():
+    # imported here, the baseline run loads this file alone under the other tree
+    from benchmark.baseline import columns
+
+    res, base = columns(__file__, measure, sys.argv)
+    head = f"{'expression':>20} {'now':>20} {'next (us)':>10}"
+    print(head + (f" {'base (us)':>10} {'speedup':>8}" if base else ""))
+    for k, ((cron, now), us) in enumerate(zip(CASES, res)):
+        row = f"{cron:>20} {now.isoformat():>20} {us:>10.2f}"
+        if base:
+            row += f" {base[k]:>10.2f} {base[k] / us:>8.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+latency of intra-day clock queries on the hand chain against the SecondTable,
+and the memory the table holds
+
+    python -m benchmark.clock_table
+"""
+
+from timeit import repeat
+
+from xchronos.clock.clock import Clock, TableClock
+
+CASES = (
+    ([1, 3, 5, 7, 9, 20, 23], [0, 15, 30, 45], [0, 20, 40]),
+    ((9, 17, 1), [7, 13, 29, 41, 53], None),
+    (None, [0, 5, 11, 19, 23, 31, 37, 43, 47, 59], [3, 17]),
+)
+NOW = (12, 34, 56)
+NUMBER = 20000
+
+
+def bench(clock) -> float:
+    now = tuple(clock.reset_next(NOW)[0])
+
+    def query():
+        clock.reset_next(NOW)
+        clock.next(now, 3)
+        clock.prev(now, 3)
+
+    return min(repeat(query, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main():
+    print(f"{'case':>5} {'hands (us)':>11} {'table (us)':>11} {'table bytes':>12}")
+    for x, specs in enumerate(CASES):
+        table = TableClock(*specs)
+        print(
+            f"{x:>5} {bench(Clock(*specs)):>11.2f} {bench(table):>11.2f}"
+            f" {table.table.nbytes:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+latency of the time a span covers over a year, counted on the patterns
+of covered seconds against summing the clipped windows
+
+    python -m benchmark.coverage
+"""
+from datetime import datetime, timedelta
+from timeit import repeat
+
+from xchronos import ChronoXSpan
+
+CASES = (
+    "* * * * 0..15; d",
+    "* * 1..L1 22..2 .. ..",
+    "* 1,3,5 3..5 0 0 0; w",
+)
+A, B = datetime(2003, 1, 1), datetime(2004, 1, 1)
+
+
+def counted(span: ChronoXSpan):
+    span.coverage(A, B)
+
+
+def walked(span: ChronoXSpan):
+    total = timedelta()
+    for st, end in span.iter_intervals(A, B):
+        total += min(end, B) - max(st, A)
+
+
+def main():
+    print(f"{'expression':>24} {'counted (us)':>13} {'walked (us)':>12}")
+    for cron in CASES:
+        span = ChronoXSpan(cron)
+        a = min(repeat(lambda: counted(span), number=100, repeat=5)) / 100 * 1e6
+        b = min(repeat(lambda: walked(span), number=1, repeat=3)) * 1e6
+        print(f"{cron:>24} {a:>13.2f} {b:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
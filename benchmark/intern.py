@@ -0,0 +1,36 @@
+"""
+memory of loading many expressions that differ only in their clock,
+calendar subtrees and marks are interned so they are built once
+
+    python -m benchmark.intern
+"""
+import gc
+import tracemalloc
+
+from xchronos import ChronoX
+
+COUNTS = (100, 1000, 10000)
+
+
+def bench(count: int):
+    gc.collect()
+    tracemalloc.start()
+    jobs = []
+    for x in range(count):
+        job = ChronoX(f"* * * {x // 60 % 24} {x % 60} 0")
+        # touch the cached tables, they are shared along with the trees
+        job.total_count
+        jobs.append(job)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / count
+
+
+def main():
+    print(f"{'jobs':>8} {'bytes per job':>14}")
+    for count in COUNTS:
+        print(f"{count:>8} {bench(count):>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+latency of listing span windows, iter_intervals walks starts and ends
+incrementally against a next_interval call per window
+
+    python -m benchmark.intervals
+"""
+from datetime import datetime
+from itertools import islice
+from timeit import repeat
+
+from xchronos import ChronoXSpan
+
+CASES = (
+    "* * * 1,3,5 * .. ; c",
+    "* * 1..L1 22..2 .. ..",
+    "* 1,3,5 3..5 0 0 0; w",
+)
+A, B = datetime(2003, 1, 1), datetime(2100, 1, 1)
+COUNT = 1000
+
+
+def searched(span: ChronoXSpan):
+    now = A
+    for _ in range(COUNT):
+        now, _ = span.next_interval(now)
+
+
+def walked(span: ChronoXSpan):
+    for _ in islice(span.iter_intervals(A, B), COUNT):
+        pass
+
+
+def main():
+    print(f"{'expression':>24} {'searched (us)':>14} {'walked (us)':>12}")
+    for cron in CASES:
+        span = ChronoXSpan(cron)
+        a = min(repeat(lambda: searched(span), number=1, repeat=5)) / COUNT * 1e6
+        b = min(repeat(lambda: walked(span), number=1, repeat=5)) / COUNT * 1e6
+        print(f"{cron:>24} {a:>14.2f} {b:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+latency of finding every rule that contains a time, one MatchIndex query
+against a contains call on each rule
+
+    python -m benchmark.match
+"""
+
+from datetime import datetime, timedelta
+from itertools import product
+from timeit import repeat
+
+from xchronos import ChronoX, ChronoXSpan
+from xchronos.match import MatchIndex
+
+RULES = [
+    ChronoX.compile(f"* * {d} {h} {m} *")
+    for d, h, m in product(("*", "1", "L1", "1-15"), range(24), range(0, 60, 2))
+] + [
+    ChronoXSpan.compile(f"* * {d} {h}..{h + 1} .. ..; w")
+    for d, h in product(range(1, 8), range(0, 22))
+]
+COUNT = 100
+EVENTS = [datetime(2003, 1, 1) + timedelta(seconds=7919 * i) for i in range(COUNT)]
+
+
+def each():
+    for now in EVENTS:
+        [i for i, rule in enumerate(RULES) if rule.contains(now)]
+
+
+def indexed(index: MatchIndex):
+    for now in EVENTS:
+        index.match(now)
+
+
+def main():
+    index = MatchIndex()
+    for i, rule in enumerate(RULES):
+        index.add(i, rule)
+    a = min(repeat(each, number=1, repeat=3)) / COUNT * 1e6
+    b = min(repeat(lambda: indexed(index), number=1, repeat=3)) / COUNT * 1e6
+    print(f"{len(RULES)} rules, each (us) {a:.2f}, indexed (us) {b:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+latency of calendar cost_ahead/cost_behind as the year span grows,
+the prefix index behind Node.nodes_behind keeps it flat
+
+    python -m benchmark.node_index
+"""
+from timeit import repeat
+
+from xchronos.calendar.calendar import Calendar, CMode
+
+SPANS = (10, 100, 1000, 5000, 9999)
+NUMBER = 2000
+
+
+def bench(span: int):
+    calendar = Calendar([None, None, (0, span - 1, 1)], CMode.M)
+    # last mark of the span, the worst case for a linear walk
+    now = [span - 1, 5, 14]
+    # warm up lazy caches, only query time is measured
+    calendar.cost_ahead(now.copy())
+    ahead = min(
+        repeat(lambda: calendar.cost_ahead(now.copy()), number=NUMBER, repeat=5)
+    )
+    behind = min(
+        repeat(lambda: calendar.cost_behind(now.copy()), number=NUMBER, repeat=5)
+    )
+    return ahead / NUMBER * 1e6, behind / NUMBER * 1e6
+
+
+def main():
+    print(f"{'year span':>10} {'ahead (us)':>11} {'behind (us)':>12}")
+    for span in SPANS:
+        ahead, behind = bench(span)
+        print(f"{span:>10} {ahead:>11.2f} {behind:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
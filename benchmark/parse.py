@@ -0,0 +1,83 @@
+"""
+parse throughput of cronx expressions with the parsers of the tree, side by side
+with a baseline checkout when given one, e.g. the single pass lexer against the
+regex decoders it replaced
+
+    python -m benchmark.parse
+    git worktree add /tmp/base 0a8ddfa^
+    python -m benchmark.parse /tmp/base
+"""
+
+import sys
+from timeit import repeat
+from typing import Callable, List, Tuple
+
+from xchronos.calendar.calendar import CMode
+
+POINTS = (
+    "* * * 1,3,5 0 0",
+    "* * * */2 30 0",
+    "2000-2100/4 1-6 L1 9 0 0",
+    "* */3 1,15,L1 8-18/2 0,30 0",
+    "* * 1-10,20,*/7 * * 0",
+)
+PERIODS = (
+    "* * * 9..17 .. ..",
+    "* 1..6 .. .. 10 ..",
+    "* * 1,15 8..L2 .. ..",
+)
+NUMBER = 2000
+
+DecodeT = Callable[[str, CMode], object]
+
+
+def _parsers() -> Tuple[DecodeT, DecodeT]:
+    """decode of points and periods, the regex decoders on trees before the lexer"""
+    try:
+        from xchronos.parser.specs.lexer import CronLexer, PeriodLexer
+
+        return CronLexer.decode, PeriodLexer.decode
+    except ImportError:
+        from xchronos.parser.specs.period import PeriodDecoder
+        from xchronos.parser.specs.point import CronDecoder
+
+        # the expression was rewritten to their syntax before decoding
+        def legacy(decode: DecodeT) -> DecodeT:
+            return lambda cron, mode: decode(
+                cron.replace("-", "~").replace("L", "-"), mode
+            )
+
+        return legacy(CronDecoder.decode), legacy(PeriodDecoder.decode)
+
+
+def bench(decode: DecodeT, crons) -> float:
+    def run():
+        for cron in crons:
+            decode(cron, CMode.M)
+
+    best = min(repeat(run, number=NUMBER, repeat=5))
+    return len(crons) * NUMBER / best
+
+
+def measure() -> List[float]:
+    """expressions per second of points and periods"""
+    point, period = _parsers()
+    return [bench(point, POINTS), bench(period, PERIODS)]
+
+
+def main():
+    # imported here, the baseline run loads this file alone under the other tree
+    from benchmark.baseline import columns
+
+    res, base = columns(__file__, measure, sys.argv)
+    head = f"{'kind':>8} {'expr/s':>10}"
+    print(head + (f" {'base expr/s':>12} {'speedup':>8}" if base else ""))
+    for k, (kind, rate) in enumerate(zip(("point", "period"), res)):
+        row = f"{kind:>8} {rate:>10.0f}"
+        if base:
+            row += f" {base[k]:>12.0f} {rate / base[k]:>8.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
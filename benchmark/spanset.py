@@ -0,0 +1,41 @@
+"""
+latency of checking a stream of events against a union of many spans,
+one SpanSet against a contains call on every member
+
+    python -m benchmark.spanset
+"""
+
+from datetime import datetime, timedelta
+from timeit import repeat
+
+from xchronos import ChronoXSpan
+from xchronos.spanset import union
+
+SPANS = [
+    ChronoXSpan(f"* * {d} {h}..{h + 1} .. ..; w")
+    for d in (1, 3, 5)
+    for h in range(2, 22, 2)
+]
+COUNT = 10000
+EVENTS = [datetime(2003, 1, 1) + timedelta(seconds=7 * i) for i in range(COUNT)]
+
+
+def each():
+    for now in EVENTS:
+        any(span.contains(now) for span in SPANS)
+
+
+def swept(spans):
+    for now in EVENTS:
+        spans.contains(now)
+
+
+def main():
+    spans = union(*SPANS)
+    a = min(repeat(each, number=1, repeat=3)) / COUNT * 1e6
+    b = min(repeat(lambda: swept(spans), number=1, repeat=3)) / COUNT * 1e6
+    print(f"{len(SPANS)} spans, each (us) {a:.2f}, swept (us) {b:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,4 +16,5 @@ setup(
     python_requires=">=3.8",
     keywords="cron, chronos, period, time, date, datetime, chronox",
     package_dir={"chronox": "xchronos"},
+    extras_require={"numpy": ["numpy"]},
 )
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta
+import unittest
+
+from xchronos.aio import AsyncScheduler, aiter_next, sleep_until
+from xchronos.chronos import ChronoX
+from xchronos.scheduler import Scheduler
+
+
+class PopLatestTest(unittest.TestCase):
+    def test_pop_latest(self):
+        s = Scheduler()
+        now = datetime(2003, 11, 10, 5, 59, 58)
+        s.add("sec", ChronoX("* * * * * *"), now)
+        s.add("odd_hour", ChronoX("* * * 1,3,5 0 0 ; c"), now)
+        self.assertEqual(
+            s.pop_latest(datetime(2003, 11, 11, 3, 30, 0)),
+            [
+                (datetime(2003, 11, 11, 3, 30, 0), "sec", 77401),
+                (datetime(2003, 11, 11, 3, 0, 0), "odd_hour", 1),
+            ],
+        )
+        self.assertEqual(s.when("sec"), datetime(2003, 11, 11, 3, 30, 1))
+        self.assertEqual(s.when("odd_hour"), datetime(2003, 11, 11, 5, 0, 0))
+        self.assertEqual(
+            s.pop_latest(datetime(2003, 11, 11, 3, 30, 1)),
+            [(datetime(2003, 11, 11, 3, 30, 1), "sec", 0)],
+        )
+
+
+class AioTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.every_sec = ChronoX("* * * * * *")
+
+    def test_sleep_until(self):
+        async def main():
+            when = datetime.now() + timedelta(seconds=0.05)
+            await sleep_until(when)
+            return datetime.now()
+
+        self.assertGreaterEqual(asyncio.run(main()), datetime.now() - timedelta(1))
+
+    def test_aiter(self):
+        async def main():
+            fires = []
+            start = datetime.now() - timedelta(seconds=10)
+            async for fire in self.every_sec.aiter(start):
+                fires.append((fire, datetime.now()))
+                if len(fires) == 2:
+                    return fires
+
+        fires = asyncio.run(main())
+        # the first one catches up to the latest due firing, skipping the others
+        self.assertLessEqual(fires[0][1] - fires[0][0], timedelta(seconds=1))
+        self.assertEqual(fires[1][0] - fires[0][0], timedelta(seconds=1))
+        self.assertGreaterEqual(fires[1][1], fires[1][0])
+
+    def test_aiter_exhausted(self):
+        async def main():
+            return [x async for x in aiter_next(ChronoX("2000 * * * *"))]
+
+        self.assertEqual(asyncio.run(main()), [])
+
+    def test_scheduler(self):
+        calls = []
+
+        async def on_fire(fire, missed):
+            calls.append(("async", fire, missed))
+
+        async def main():
+            s = AsyncScheduler()
+            start = datetime.now() - timedelta(seconds=100)
+            s.add(
+                "late", self.every_sec, lambda f, m: calls.append(("late", f, m)), start
+            )
+            s.add("never", ChronoX("2000 * * * *"), on_fire)
+            runner = asyncio.ensure_future(s.run())
+            await asyncio.sleep(0.01)
+            s.add("async", self.every_sec, on_fire)
+            await sleep_until(s.when("async") + timedelta(seconds=0.05))
+            runner.cancel()
+            self.assertNotIn("never", s)
+            self.assertEqual(len(s), 2)
+
+        asyncio.run(main())
+        self.assertEqual(calls[0][0], "late")
+        self.assertGreaterEqual(calls[0][2], 98)
+        self.assertIn("async", [c[0] for c in calls])
+        self.assertTrue(all(c[2] == 0 for c in calls[1:]))
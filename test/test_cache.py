@@ -0,0 +1,60 @@
+from datetime import datetime
+from threading import Thread
+import unittest
+
+from xchronos.cache import CompileCache, compile_cache
+from xchronos.chronos import ChronoX, ChronoXSpan, CMode
+
+
+class CompileCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.size = compile_cache.maxsize
+        compile_cache.clear()
+
+    def tearDown(self) -> None:
+        compile_cache.resize(self.size)
+        compile_cache.clear()
+
+    def test_compile(self):
+        c = ChronoX.compile("* * * 1,3,5 * * ; c")
+        self.assertIs(c, ChronoX.compile("*  * *   1,3,5 * *;c"))
+        self.assertIs(c, ChronoX.compile("* * * 1,3,5 * *", CMode.M))
+        self.assertIsNot(c, ChronoX.compile("* * * 1,3,5 * * ; w"))
+        self.assertEqual(
+            c.next(datetime(2003, 11, 10, 5, 59, 59)), datetime(2003, 11, 11, 1, 0, 0)
+        )
+        s = ChronoXSpan.compile("* * * 1,3,5 * .. ; c")
+        self.assertIsInstance(s, ChronoXSpan)
+        self.assertIs(s, ChronoXSpan.compile("* * * 1,3,5 * ..", CMode.M))
+        self.assertEqual(compile_cache.info(), (3, 3, self.size, 3))
+
+    def test_lru(self):
+        cache = CompileCache(2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 3)
+        cache.get("c", lambda: 4)
+        self.assertEqual(cache.get("a", lambda: 5), 1)
+        self.assertEqual(cache.get("b", lambda: 6), 6)
+        self.assertEqual(cache.info(), (2, 4, 2, 2))
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+
+    def test_disable(self):
+        compile_cache.resize(0)
+        c = ChronoX.compile("* * * * *; d")
+        self.assertIsNot(c, ChronoX.compile("* * * * *; d"))
+        self.assertEqual(compile_cache.info(), (0, 2, 0, 0))
+
+    def test_threads(self):
+        res = []
+
+        def compile():
+            res.extend(ChronoX.compile("* * 3 0 0 0; w") for _ in range(50))
+
+        threads = [Thread(target=compile) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(map(id, res))), 1)
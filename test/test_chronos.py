@@ -1,8 +1,15 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from itertools import islice
 import unittest
 from xchronos.calendar.calendar import CMode
 
-from xchronos.chronos import ChronoXSpan as OPeriod, ChronoX
+from xchronos.chronos import MIN_DT_UNIT, ChronoXSpan as OPeriod, ChronoX
+from xchronos.exceptions import Inadequate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class ChronoPeriod(OPeriod):
@@ -26,6 +33,23 @@ class ChronosTest(unittest.TestCase):
         self.c1 = ChronoX("* * * 1,3,5 * * ; c")
         self.cmw = ChronoX("* 1,3,5 * 3 0 0 0; m")
         self.cw = ChronoX("* 1,3,5 3 0 0 0; w")
+        self.cl = ChronoX("* * * 1-10/2,20,L1 0 0 ; c")
+
+    def test_composite_list(self):
+        hours = (1, 3, 5, 7, 9, 20, 23)
+        for h in range(24):
+            self.assertEqual(self.cl.contains(datetime(2003, 1, 15, h, 0, 0)), h in hours)
+        self.assertEqual(
+            self.cl.next(datetime(2003, 1, 15, 9, 0, 0)), datetime(2003, 1, 15, 20, 0, 0)
+        )
+        self.assertEqual(
+            self.cl.next(datetime(2003, 1, 15, 9, 0, 0), 3),
+            datetime(2003, 1, 16, 1, 0, 0),
+        )
+        self.assertEqual(
+            self.cl.prev(datetime(2003, 1, 15, 0, 0, 0), 8),
+            datetime(2003, 1, 13, 23, 0, 0),
+        )
 
     def test_prev(self):
         self.assertEqual(
@@ -106,6 +130,110 @@ class ChronosTest(unittest.TestCase):
             datetime(2005, 1, 19, 0, 0, 0),
         )
 
+    def test_cross_base(self):
+        # day and month fields wrapping around their base, as before the state cursor
+        now = datetime(2012, 4, 16, 1, 17, 38)
+        cases = (
+            (
+                "* 5 25-2/1 3 28-17 *; c",
+                ["2012-05-25 03:28:00", "2012-05-02 03:28:01", "2012-05-02 03:28:02"],
+                ["2011-05-02 03:17:59", "2011-05-25 03:17:58", "2011-05-25 03:17:57"],
+            ),
+            (
+                "* * 6-4 L2 * L1; w",
+                ["2012-04-16 22:00:59", "2012-04-16 22:01:59", "2012-04-16 22:02:59"],
+                ["2012-04-12 22:59:59", "2012-04-14 22:58:59", "2012-04-14 22:57:59"],
+            ),
+            (
+                "* 334-90 8-0/4 * *; d",
+                ["2012-11-29 08:00:00", "2012-03-30 08:00:01", "2012-03-30 08:00:02"],
+                ["2012-03-30 00:59:59", "2012-11-29 00:59:58", "2012-11-29 00:59:57"],
+            ),
+        )
+        for cron, nexts, prevs in cases:
+            c = ChronoX(cron)
+            for leap, (n, p) in enumerate(zip(nexts, prevs), 1):
+                self.assertEqual(str(c.next(now, leap)), n)
+                self.assertEqual(str(c.prev(now, leap)), p)
+
+    def test_iter(self):
+        now = datetime(2003, 11, 10, 5, 59, 58)
+        for c in (self.c, self.c1, self.cmw, self.cw, self.cl):
+            self.assertEqual(
+                list(islice(c.iter_next(now), 50)),
+                [c.next(now, k) for k in range(1, 51)],
+            )
+            self.assertEqual(
+                list(islice(c.iter_prev(now), 50)),
+                [c.prev(now, k) for k in range(1, 51)],
+            )
+        self.assertEqual(
+            list(ChronoX("9999 12 L1 23 59 58,59").iter_next(datetime(9999, 12, 31))),
+            [datetime(9999, 12, 31, 23, 59, 58), datetime(9999, 12, 31, 23, 59, 59)],
+        )
+
+    def test_count(self):
+        now = datetime(2003, 11, 10, 5, 59, 58)
+        for c in (self.c, self.c1, self.cmw, self.cw, self.cl):
+            ends = list(islice(c.iter_next(now), 100))
+            for k in (0, 1, 9, 99):
+                self.assertEqual(c.count(now, ends[k]), k + int(now in c))
+        self.assertEqual(
+            self.c1.count(datetime(2003, 1, 1), datetime(2004, 1, 1)), 365 * 3 * 3600
+        )
+        self.assertEqual(
+            self.c.count(datetime(2000, 1, 1), datetime(2400, 1, 1)), 146097 * 86400
+        )
+        self.assertEqual(self.cw.count(datetime(2004, 1, 1), datetime(2003, 1, 1)), 0)
+
+    def test_rank(self):
+        self.assertEqual(self.c.rank(datetime(1, 1, 1)), 0)
+        self.assertEqual(self.c.rank(datetime(1, 1, 2)), 86400)
+        self.assertEqual(self.c.unrank(86400), datetime(1, 1, 2))
+        self.assertEqual(self.c.total_count, 9999 * 365 * 86400 + 2424 * 86400)
+        now = datetime(2003, 3, 16, 0, 1, 0)
+        for c in (self.c1, self.cmw, self.cw, self.cl):
+            idx = c.rank(now)
+            self.assertEqual(c.unrank(idx), c.next(now - MIN_DT_UNIT))
+            self.assertEqual(c.unrank(idx - 1), c.prev(now))
+            self.assertEqual(c.rank(c.unrank(idx + 1000)), idx + 1000)
+        self.assertRaises(Inadequate, self.c.unrank, self.c.total_count)
+
+    def test_gaps(self):
+        day = timedelta(days=1)
+        self.assertEqual(self.c.gaps, (MIN_DT_UNIT, MIN_DT_UNIT))
+        self.assertEqual(self.cl.gaps, (timedelta(hours=2), timedelta(hours=11)))
+        self.assertEqual(self.cw.gaps, (14 * day, 343 * day))
+        self.assertEqual(ChronoX("* 2 L1 12 0 0").gaps, (365 * day, 366 * day))
+        self.assertIsNone(ChronoX("2003 2 L1 12 0 0").gaps)
+        now = datetime(2003, 3, 16, 0, 1, 0)
+        for c in (self.c1, self.cmw, self.cw, self.cl):
+            lo, hi = c.gaps
+            for a, b in zip(
+                islice(c.iter_next(now), 1000), islice(c.iter_next(now), 1, 1000)
+            ):
+                self.assertTrue(lo <= b - a <= hi)
+
+    def test_ts(self):
+        epoch, sec = datetime(1970, 1, 1), timedelta(seconds=1)
+        for now in (
+            datetime(2003, 11, 10, 5, 59, 58),
+            datetime(1969, 12, 31, 23, 59, 59),
+            datetime(2004, 12, 27, 3, 0, 0),
+            datetime(1900, 3, 1, 0, 0, 0),
+        ):
+            ts = (now - epoch) // sec
+            for c in (self.c, self.c1, self.cmw, self.cw, self.cl):
+                for leap in (1, 3, 1000):
+                    self.assertEqual(
+                        c.next_ts(ts, leap), (c.next(now, leap) - epoch) // sec
+                    )
+                    self.assertEqual(
+                        c.prev_ts(ts, leap), (c.prev(now, leap) - epoch) // sec
+                    )
+                self.assertEqual(c.contains_ts(ts), c.contains(now))
+        self.assertRaises(ValueError, self.c.next_ts, 10**12)
+
     def test_contain(self):
         self.assertTrue(self.c.contains(datetime.now()))
         self.assertTrue(self.c1.contains(datetime(2003, 1, 15, 3, 0, 0)))
@@ -117,6 +245,63 @@ class ChronosTest(unittest.TestCase):
         self.assertFalse(self.cw.contains(datetime(2005, 3, 19, 0, 0, 0)))
 
 
+@unittest.skipIf(np is None, "numpy is not installed")
+class ChronosBatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.crons = [
+            ChronoX("* * * * *", CMode.D),
+            ChronoX("* * * 1,3,5 * * ; c"),
+            ChronoX("* 1,3,5 * 3 0 0 0; m"),
+            ChronoX("* 1,3,5 3 0 0 0; w"),
+            ChronoX("* 2 L1 9-17 */15 0; c"),
+        ]
+        self.dts = [
+            datetime(2003, 11, 10, 6, 0, 6),
+            datetime(2003, 11, 10, 0, 0, 0),
+            datetime(2004, 2, 29, 23, 59, 59),
+            datetime(2003, 3, 16, 0, 1, 0),
+            datetime(2005, 1, 19, 0, 0, 0),
+            datetime(2020, 12, 31, 12, 30, 0),
+        ]
+        self.arr = np.array(self.dts, dtype="datetime64[s]").reshape(2, 3)
+
+    def test_next_many(self):
+        for c in self.crons:
+            for leap in (1, 3, 3601):
+                expected = np.array(
+                    [c.next(dt, leap) for dt in self.dts], dtype="datetime64[s]"
+                ).reshape(2, 3)
+                self.assertTrue((c.next_many(self.arr, leap) == expected).all())
+                self.assertTrue(
+                    (
+                        c.next_many(self.arr.astype(np.int64), leap)
+                        == expected.astype(np.int64)
+                    ).all()
+                )
+
+    def test_prev_many(self):
+        for c in self.crons:
+            for leap in (1, 3, 3601):
+                expected = np.array(
+                    [c.prev(dt, leap) for dt in self.dts], dtype="datetime64[s]"
+                ).reshape(2, 3)
+                self.assertTrue((c.prev_many(self.arr, leap) == expected).all())
+
+    def test_contains_many(self):
+        for c in self.crons:
+            expected = np.array([c.contains(dt) for dt in self.dts]).reshape(2, 3)
+            self.assertTrue((c.contains_many(self.arr) == expected).all())
+        self.assertEqual(
+            self.crons[4].contains_many(self.arr.astype(np.int64)).sum(), 0
+        )
+        wrap = ChronoX("* * * 20-11 23 12; c")
+        dts = [datetime(2003, 3, 16, h, 23, 12) for h in range(24)]
+        self.assertEqual(
+            wrap.contains_many(np.array(dts, dtype="datetime64[s]")).tolist(),
+            [wrap.contains(dt) for dt in dts],
+        )
+
+
 class ChronoPeriodTest(unittest.TestCase):
     def setUp(self) -> None:
         self.c = ChronoPeriod("* * * * ..", CMode.D)
@@ -195,6 +380,145 @@ class ChronoPeriodTest(unittest.TestCase):
             datetime(2005, 1, 21, 0, 0, 0),
         )
 
+    def test_intervals(self):
+        now = datetime(2003, 3, 16, 0, 1, 0)
+        self.assertEqual(
+            self.cmw.next_interval(now),
+            (datetime(2003, 3, 19, 0, 0, 0), datetime(2003, 3, 21, 0, 0, 1)),
+        )
+        self.assertEqual(
+            self.cmw.prev_interval(now),
+            (datetime(2003, 3, 12, 0, 0, 0), datetime(2003, 3, 14, 0, 0, 1)),
+        )
+        self.assertEqual(
+            list(
+                self.c1.iter_intervals(
+                    datetime(2003, 11, 6, 1, 58, 30), datetime(2003, 11, 6, 3, 1, 0)
+                )
+            ),
+            [
+                (datetime(2003, 11, 6, 1, 58, 0), datetime(2003, 11, 6, 1, 59, 0)),
+                (datetime(2003, 11, 6, 1, 59, 0), datetime(2003, 11, 6, 2, 0, 0)),
+                (datetime(2003, 11, 6, 3, 0, 0), datetime(2003, 11, 6, 3, 1, 0)),
+            ],
+        )
+        a, b = datetime(2003, 1, 1), datetime(2004, 1, 1)
+        for c in (self.cmw, self.cw):
+            intervals = list(c.iter_intervals(a, b))
+            for st, end in intervals:
+                self.assertEqual(c.next_interval(st - MIN_DT_UNIT), (st, end))
+                self.assertTrue(c.contains(st) and c.contains(end - MIN_DT_UNIT))
+                self.assertFalse(c.contains(end))
+            self.assertTrue(intervals[0][1] > a and intervals[-1][0] < b)
+        self.assertEqual(list(self.cw.iter_intervals(b, a)), [])
+
+        # at the edges of the years the pieces hold what contains accepts
+        last = OPeriod("2003 * * 22..2 .. ..")
+        end = datetime(2003, 12, 31, 23, 0, 0)
+        self.assertFalse(last.contains(end))
+        self.assertEqual(
+            last.prev_interval(end),
+            (datetime(2003, 12, 30, 22, 0, 0), datetime(2003, 12, 31, 3, 0, 0)),
+        )
+        self.assertEqual(list(last.iter_intervals(end, datetime(2005, 1, 1))), [])
+        self.assertEqual(
+            next(last.iter_intervals(datetime(2002, 1, 1), b)),
+            (datetime.min, datetime(2003, 1, 1, 3, 0, 0)),
+        )
+        edges = (
+            ("1996-1996 28..1 .. .. ..16 51; w", datetime(1996, 1, 7, 22)),
+            ("1996-1996 28..1 .. .. ..16 51; w", datetime(1996, 7, 7, 23)),
+            ("2007-2009 * 7 7,16,22 L2..49 1; w", datetime(2007, 1, 7, 7)),
+            ("2007-2009 * 7 7,16,22 L2..49 1; w", datetime(2010, 1, 3, 22)),
+            ("2000-2003 198-345 * 50..5 43..; d", datetime(2003, 12, 11, 22)),
+        )
+        for cron, a in edges:
+            c = OPeriod(cron)
+            b = a + timedelta(hours=3)
+            intervals = list(c.iter_intervals(a, b))
+            for x in range(0, 3 * 3600, 7):
+                now = a + timedelta(seconds=x)
+                inside = any(st <= now < end for st, end in intervals)
+                self.assertEqual(c.contains(now), inside)
+
+    def test_coverage(self):
+        a, b = datetime(2003, 1, 1), datetime(2004, 1, 1)
+        self.assertEqual(
+            ChronoPeriod("* * * * 0..15; d").coverage(a, b),
+            timedelta(seconds=16 * 60 * 24 * 365),
+        )
+        epoch = datetime(1970, 1, 1)
+        ta, tb = (int((x - epoch).total_seconds()) for x in (a, b))
+        spans = (
+            self.c1,
+            self.cmw,
+            self.cw,
+            ChronoPeriod("* * * 22..2 .. .."),
+            ChronoPeriod("* 2 L3..L1 8..17 .. .."),
+            # mixed numbers and L numbers walk the windows
+            ChronoPeriod("* * 2..L3 0 0 0"),
+        )
+        for c in spans:
+            expected = sum(
+                (min(end, b) - max(st, a) for st, end in c.iter_intervals(a, b)),
+                timedelta(),
+            )
+            self.assertEqual(c.coverage(a, b), expected)
+            self.assertEqual(c.coverage_ts(ta, tb), expected // MIN_DT_UNIT)
+        self.assertEqual(self.cw.coverage(b, a), timedelta())
+        # windows of starts before an earlier end overlap, seconds count once
+        self.assertEqual(
+            ChronoPeriod("* * 28..L3 0 0 0; c").coverage(a, datetime(2003, 6, 1)),
+            timedelta(days=31, seconds=4),
+        )
+        # the years of the span end inside [a, b), seconds after them are not covered
+        for cron, a in (
+            ("1996-1996 28..1 .. .. ..16 51; w", datetime(1996, 1, 7, 22, 30)),
+            ("2000-2003 198-345 * 50..5 43..; d", datetime(2003, 12, 11, 22, 30)),
+        ):
+            c = ChronoPeriod(cron)
+            b = a + timedelta(hours=2)
+            seconds = int((b - a).total_seconds())
+            covered = sum(c.contains(a + timedelta(seconds=x)) for x in range(seconds))
+            self.assertEqual(c.coverage(a, b), timedelta(seconds=covered))
+            self.assertEqual(c.coverage(b, b + timedelta(days=400)), timedelta())
+        # a box out of range under some cap walks the windows
+        self.assertEqual(
+            ChronoPeriod("* 12-12/3 2..3 7 23 56..3 ..; m").coverage(
+                datetime(2014, 5, 8), datetime(2015, 6, 12)
+            ),
+            timedelta(days=6, hours=23, minutes=8),
+        )
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_contains_many(self):
+        dts = [
+            datetime(2003, 11, 6, 6, 0, 0),
+            datetime(2003, 11, 6, 0, 0, 0),
+            datetime(2003, 11, 6, 1, 0, 0),
+            datetime(2003, 5, 16, 0, 0, 0),
+            datetime(2003, 5, 15, 0, 0, 0),
+            datetime(2003, 6, 16, 0, 0, 1),
+            datetime(2003, 1, 15, 0, 0, 0),
+            datetime(2003, 1, 16, 0, 0, 0),
+        ]
+        arr = np.array(dts, dtype="datetime64[s]")
+        for c in (self.c, self.c1, self.cmw, self.cw):
+            expected = np.array([c.contains(dt) for dt in dts])
+            self.assertTrue((c.contains_many(arr) == expected).all())
+        # elements past the years of the span are not in it, as for contains
+        bounded = ChronoPeriod("2091 78,195,17,204,72 .. .. ..; d")
+        dts = [datetime(2095, 1, 1), datetime(2091, 3, 19, 5), datetime(2091, 1, 1)]
+        arr = np.array(dts, dtype="datetime64[s]")
+        self.assertEqual(bounded.contains_many(arr).tolist(), [False, True, False])
+        self.assertEqual([bounded.contains(dt) for dt in dts], [False, True, False])
+        # a wrapping span past its years, its starts and ends are all lost
+        wrap = ChronoPeriod("1996-1996 28..1 .. .. ..16 51; w")
+        dts = [datetime(1996, 3, 1), datetime(1996, 7, 8, 1), datetime(2003, 12, 31, 23)]
+        arr = np.array(dts, dtype="datetime64[s]")
+        expected = [wrap.contains(dt) for dt in dts]
+        self.assertEqual(wrap.contains_many(arr).tolist(), expected)
+
     def test_contains(self):
         self.assertTrue(self.c.contains(datetime.now()))
         self.assertTrue(self.c0.contains(datetime.now()))
@@ -207,3 +531,17 @@ class ChronoPeriodTest(unittest.TestCase):
         self.assertTrue(self.cw.contains(datetime(2003, 1, 15, 0, 0, 0)))
         self.assertTrue(self.cw.contains(datetime(2003, 1, 16, 0, 0, 0)))
         self.assertFalse(self.cw.contains(datetime(2003, 6, 16, 0, 0, 1)))
+
+    def test_contains_fields(self):
+        wrap = ChronoPeriod("* * * 22..2 .. ..")
+        # the field comparison agrees with the search, wrapping spans still search
+        self.assertIsNone(wrap._lower)
+        spans = (self.c1, self.cmw, self.cw, ChronoPeriod("* 2 L3..L1 8..17 .. .."))
+        for c in spans:
+            self.assertIsNotNone(c._lower)
+        now = datetime(2003, 1, 27, 1, 59, 58)
+        for x in range(2000):
+            now += timedelta(hours=x % 5 * 7, seconds=x % 3)
+            for c in spans + (wrap,):
+                expected = c.next_start(now) > c.next_end(now - MIN_DT_UNIT)
+                self.assertEqual(c.contains(now), expected)
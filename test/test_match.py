@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+import unittest
+
+from xchronos.chronos import ChronoX, ChronoXSpan
+from xchronos.match import MatchIndex
+
+
+class MatchIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rules = {
+            "sec": ChronoX("* * * * * *"),
+            "odd_hour": ChronoX("* * * 1,3,5 * * ; c"),
+            "last_day": ChronoX("* * L1 * * *"),
+            "wed": ChronoX("* * 3 * * *; w"),
+            "doy": ChronoX("* 60-L1 * */5 0; d"),
+            "business": ChronoXSpan("* * 1-5 9..17 .. ..; w"),
+            "feb_end": ChronoXSpan("* 2 L3..L1 8..17 .. .."),
+            "night": ChronoXSpan("* * * 22..2 .. .."),
+            "weeknight": ChronoXSpan("* * 1-5 22..2 .. ..; w"),
+            "morning": ChronoXSpan("* * * 9..11 30..45 ..; c"),
+        }
+        self.index = MatchIndex()
+        for key, rule in self.rules.items():
+            self.index.add(key, rule)
+
+    def expected(self, now: datetime):
+        return sorted(k for k, rule in self.rules.items() if rule.contains(now))
+
+    def test_match(self):
+        self.assertEqual(len(self.index), 10)
+        self.assertEqual(
+            sorted(self.index.match(datetime(2003, 2, 26, 23, 0, 0))),
+            ["feb_end", "night", "sec", "wed", "weeknight"],
+        )
+        # the window of a friday night runs on to the monday
+        self.assertEqual(
+            sorted(self.index.match(datetime(2003, 3, 22, 1, 0, 0))),
+            ["doy", "night", "odd_hour", "sec", "weeknight"],
+        )
+        self.assertEqual(
+            sorted(self.index.match(datetime(2004, 2, 29, 3, 5, 0))),
+            ["doy", "feb_end", "last_day", "odd_hour", "sec", "weeknight"],
+        )
+        epoch = datetime(1970, 1, 1)
+        now = datetime(2003, 1, 27, 1, 59, 58)
+        for x in range(3000):
+            now += timedelta(hours=x % 5 * 7, minutes=x % 7 * 13, seconds=x % 3)
+            self.assertEqual(sorted(self.index.match(now)), self.expected(now))
+            ts = int((now - epoch).total_seconds())
+            self.assertEqual(sorted(self.index.match_ts(ts)), self.expected(now))
+
+    def test_add_remove(self):
+        now = datetime(2003, 11, 5, 9, 40)
+        self.assertTrue(self.index.remove("sec"))
+        self.assertFalse(self.index.remove("sec"))
+        self.assertNotIn("sec", self.index)
+        self.assertEqual(
+            sorted(self.index.match(now)), ["business", "doy", "morning", "wed"]
+        )
+
+        # ids are reused, replacing a key drops its old rule
+        self.index.add("late", ChronoX("* * * 23 * *"))
+        self.index.add("wed", ChronoX("* * 4 * * *; w"))
+        self.assertEqual(len(self.index), 10)
+        self.assertEqual(sorted(self.index.match(now)), ["business", "doy", "morning"])
+        self.assertEqual(
+            sorted(self.index.match(datetime(2003, 11, 6, 23, 30))),
+            ["doy", "late", "night", "wed", "weeknight"],
+        )
+
+    def test_past_years(self):
+        # a rule with no occurrence left does not match, the others still do
+        self.index.add("2032", ChronoXSpan("2032 * 21,27 22..5 .. 52..33; c"))
+        now = datetime(2033, 5, 21, 23, 0, 0)
+        self.assertEqual(sorted(self.index.match(now)), self.expected(now))
+        self.assertNotIn("2032", self.index.match(now))
+        self.assertIn("night", self.index.match(now))
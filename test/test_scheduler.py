@@ -0,0 +1,65 @@
+from datetime import datetime
+import unittest
+
+from xchronos.chronos import ChronoX
+from xchronos.scheduler import Scheduler
+
+
+class SchedulerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = datetime(2003, 11, 10, 5, 59, 58)
+        self.crons = {
+            "sec": ChronoX("* * * * * *"),
+            "odd_hour": ChronoX("* * * 1,3,5 0 0 ; c"),
+            "wed": ChronoX("* * 3 0 0 0; w"),
+            "once": ChronoX("2003 11 10 6 0 0"),
+        }
+        self.s = Scheduler()
+        for key, c in self.crons.items():
+            self.s.add(key, c, self.now)
+
+    def test_add(self):
+        self.assertEqual(len(self.s), 4)
+        self.assertEqual(self.s.peek(), (datetime(2003, 11, 10, 5, 59, 59), "sec"))
+        self.assertEqual(self.s.when("wed"), datetime(2003, 11, 12))
+        self.assertIsNone(self.s.add("never", ChronoX("2000 * * * *"), self.now))
+        self.assertNotIn("never", self.s)
+
+    def test_pop_due(self):
+        due = self.s.pop_due(datetime(2003, 11, 10, 6, 0, 1))
+        self.assertEqual(
+            due,
+            [
+                (datetime(2003, 11, 10, 5, 59, 59), "sec"),
+                (datetime(2003, 11, 10, 6, 0, 0), "once"),
+                (datetime(2003, 11, 10, 6, 0, 0), "sec"),
+                (datetime(2003, 11, 10, 6, 0, 1), "sec"),
+            ],
+        )
+        self.assertNotIn("once", self.s)
+        self.assertEqual(self.s.when("sec"), datetime(2003, 11, 10, 6, 0, 2))
+        self.assertEqual(self.s.pop_due(datetime(2003, 11, 10, 6, 0, 1)), [])
+
+    def test_remove(self):
+        self.assertTrue(self.s.remove("sec"))
+        self.assertFalse(self.s.remove("sec"))
+        self.assertEqual(self.s.peek(), (datetime(2003, 11, 10, 6, 0, 0), "once"))
+        due = self.s.pop_due(datetime(2003, 11, 11, 3, 0, 0))
+        self.assertEqual([key for _, key in due], ["once", "odd_hour", "odd_hour"])
+        for x in range(1000):
+            self.s.add(x, self.crons["wed"], self.now)
+            self.s.remove(x)
+        self.assertEqual(len(self.s), 2)
+        self.assertLess(len(self.s._heap), 100)
+
+    def test_reschedule(self):
+        later = datetime(2010, 1, 1)
+        self.assertEqual(
+            self.s.reschedule("odd_hour", self.crons["odd_hour"], later),
+            datetime(2010, 1, 1, 1, 0, 0),
+        )
+        self.s.remove("sec")
+        self.assertEqual(
+            [key for _, key in self.s.pop_due(datetime(2009, 12, 31))],
+            ["once"] + ["wed"] * 321,
+        )
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+import unittest
+
+from xchronos.chronos import MIN_DT_UNIT, ChronoXSpan
+from xchronos.spanset import SpanLeaf, SpanSet, difference, intersection, union
+
+
+class SpanSetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.business = ChronoXSpan("* * 1-5 9..17 .. ..; w")
+        self.lunch = ChronoXSpan("* * * 12 .. ..")
+        self.weekend = ChronoXSpan("* * 6,7 1..3 .. ..; w")
+        self.night = ChronoXSpan("* * * 22..2 .. ..")
+        self.sets = {
+            "policy": (
+                union(self.business, self.weekend) - self.lunch,
+                lambda t: (self.business.contains(t) or self.weekend.contains(t))
+                and not self.lunch.contains(t),
+            ),
+            "overlap": (
+                intersection(self.business | SpanLeaf(self.night), self.lunch),
+                lambda t: self.business.contains(t) and self.lunch.contains(t),
+            ),
+            "wrap": (
+                difference(self.night, union(self.weekend)),
+                lambda t: self.night.contains(t) and not self.weekend.contains(t),
+            ),
+        }
+
+    def test_flatten(self):
+        u = union(self.business, self.lunch) | self.night
+        self.assertEqual(len(u._members), 3)
+        i = self.night & intersection(self.business, self.lunch)
+        self.assertEqual(len(i._members), 3)
+        self.assertRaises(TypeError, SpanSet)
+
+    def test_contains(self):
+        policy = self.sets["policy"][0]
+        self.assertTrue(policy.contains(datetime(2003, 3, 19, 11, 59, 59)))
+        self.assertFalse(policy.contains(datetime(2003, 3, 19, 12, 30)))
+        self.assertIn(datetime(2003, 3, 22, 3, 59, 59), policy)
+        self.assertNotIn(datetime(2003, 3, 22, 4, 0, 0), policy)
+
+        # events mostly in time order, sometimes going back
+        for s, f in self.sets.values():
+            now = datetime(2003, 1, 1)
+            for x in range(3000):
+                now += timedelta(seconds=(x % 7) * 613 + 1)
+                if x % 101 == 0:
+                    now -= timedelta(hours=3)
+                self.assertEqual(s.contains(now), f(now))
+
+    def test_iter_intervals(self):
+        a, b = datetime(2003, 3, 14, 10, 30), datetime(2003, 3, 18)
+        policy = self.sets["policy"][0]
+        self.assertEqual(
+            list(policy.iter_intervals(a, b))[:3],
+            [
+                (a, datetime(2003, 3, 14, 12)),
+                (datetime(2003, 3, 14, 13), datetime(2003, 3, 14, 18)),
+                (datetime(2003, 3, 15, 1), datetime(2003, 3, 15, 4)),
+            ],
+        )
+        for s, f in self.sets.values():
+            prev = None
+            for st, end in s.iter_intervals(a, b):
+                self.assertTrue(a <= st < end <= b)
+                self.assertTrue(prev is None or prev < st)
+                self.assertTrue(f(st) and f(end - MIN_DT_UNIT))
+                self.assertTrue(st == a or not f(st - MIN_DT_UNIT))
+                self.assertTrue(end == b or not f(end))
+                prev = end
+
+    def test_coverage(self):
+        a, b = datetime(2003, 1, 1), datetime(2004, 1, 1)
+        self.assertEqual(SpanLeaf(self.lunch).coverage(a, b), timedelta(hours=365))
+        self.assertEqual(
+            self.sets["overlap"][0].coverage(a, b),
+            timedelta(hours=261),
+        )
+        self.assertEqual(
+            union(self.lunch, self.lunch).coverage(a, b), timedelta(hours=365)
+        )
+        self.assertEqual(self.sets["policy"][0].coverage(b, a), timedelta())
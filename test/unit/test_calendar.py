@@ -1,8 +1,33 @@
+from calendar import isleap
+from datetime import date, timedelta
 import unittest
-from xchronos.exceptions import Inadequate, Indecisive
+from xchronos.exceptions import Inadequate
 from xchronos.calendar.calendar import CMode, Calendar
+from xchronos.mark import load_mark
 
 from xchronos.calendar.week import WOLYear
+from xchronos.calendar.year import (
+    MONTH_WEEKS,
+    TABLE_YEARS,
+    WEEK_OFFSETS,
+    YEAR_PATTERN,
+    YEARS,
+    d1_year,
+    weeks_in_year,
+    year_pattern_of,
+)
+
+
+def _reset(fn, s, *args):
+    """reset s in place, (s, ch) after it, None if no mark is left"""
+    ch = fn(s, *args)
+    return None if ch is None else (s, ch)
+
+
+def _move(fn, s, *args):
+    """move s in place, s after it as a tuple"""
+    fn(s, *args)
+    return tuple(s)
 
 
 class WeekTest(unittest.TestCase):
@@ -13,49 +38,49 @@ class WeekTest(unittest.TestCase):
         self.w_5_6_e3d1 = WOLYear([(1, -3, 3), [5, 6]])
 
     def test_reset_prev(self):
-        self.assertEqual(self.w_e2_d0.reset_prev([0, 0], False), ([0, 0], 0, 0))
-        self.assertEqual(self.w_e2_d0.reset_prev([0, 0], True), ([0, 52], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_prev([1, 0], True), ([0, 52], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_prev([1, 0], False), ([0, 0], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_prev([0, 1], False), ([0, 0], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_prev([0, 51], False), ([0, 50], 1, 0))
-        self.assertEqual(self.w_e_e3d.reset_prev([1, 51], True), ([6, 52], 1, 0))
-        self.assertEqual(self.w_e_e3d.reset_prev([5, 51], False), ([3, 51], 1, 0))
-        self.assertEqual(self.w_5_e3d1.reset_prev([0, 51], False), ([4, 5], 1, 0))
-        self.assertRaises(Indecisive, self.w_5_e3d1.reset_prev, [0, 5], False)
-        self.assertEqual(self.w_5_6_e3d1.reset_prev([0, 6], False), ([4, 5], 1, 0))
+        self.assertEqual(_reset(self.w_e2_d0.reset_prev, [0, 0], 0, False), ([0, 0], 0))
+        self.assertEqual(_reset(self.w_e2_d0.reset_prev, [0, 0], 0, True), ([52, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_prev, [0, 1], 0, True), ([52, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_prev, [0, 1], 0, False), ([0, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_prev, [1, 0], 0, False), ([0, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_prev, [51, 0], 0, False), ([50, 0], 1))
+        self.assertEqual(_reset(self.w_e_e3d.reset_prev, [51, 1], 0, True), ([52, 6], 1))
+        self.assertEqual(_reset(self.w_e_e3d.reset_prev, [51, 5], 0, False), ([51, 3], 1))
+        self.assertEqual(_reset(self.w_5_e3d1.reset_prev, [51, 0], 0, False), ([5, 4], 1))
+        self.assertIsNone(_reset(self.w_5_e3d1.reset_prev, [5, 0], 0, False))
+        self.assertEqual(_reset(self.w_5_6_e3d1.reset_prev, [6, 0], 0, False), ([5, 4], 1))
 
     def test_reset_next(self):
-        self.assertEqual(self.w_e2_d0.reset_next([0, 0], False), ([0, 0], 0, 0))
-        self.assertEqual(self.w_e2_d0.reset_next([0, 0], True), ([0, 0], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_next([1, 0], True), ([0, 0], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_next([1, 0], False), ([0, 2], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_next([0, 1], False), ([0, 2], 1, 0))
-        self.assertEqual(self.w_e2_d0.reset_next([0, 51], False), ([0, 52], 1, 0))
-        self.assertEqual(self.w_e_e3d.reset_next([1, 51], True), ([0, 0], 1, 0))
-        self.assertEqual(self.w_e_e3d.reset_next([5, 51], False), ([6, 51], 1, 0))
-        self.assertRaises(Indecisive, self.w_5_e3d1.reset_next, [0, 51], False)
-        self.assertEqual(self.w_5_6_e3d1.reset_next([5, 5], False), ([1, 6], 1, 0))
+        self.assertEqual(_reset(self.w_e2_d0.reset_next, [0, 0], 0, False), ([0, 0], 0))
+        self.assertEqual(_reset(self.w_e2_d0.reset_next, [0, 0], 0, True), ([0, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_next, [0, 1], 0, True), ([0, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_next, [0, 1], 0, False), ([2, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_next, [1, 0], 0, False), ([2, 0], 1))
+        self.assertEqual(_reset(self.w_e2_d0.reset_next, [51, 0], 0, False), ([52, 0], 1))
+        self.assertEqual(_reset(self.w_e_e3d.reset_next, [51, 1], 0, True), ([0, 0], 1))
+        self.assertEqual(_reset(self.w_e_e3d.reset_next, [51, 5], 0, False), ([51, 6], 1))
+        self.assertIsNone(_reset(self.w_5_e3d1.reset_next, [51, 0], 0, False))
+        self.assertEqual(_reset(self.w_5_6_e3d1.reset_next, [5, 5], 0, False), ([6, 1], 1))
 
     def test_prev(self):
-        self.assertEqual(self.w_e2_d0.prev([0, 1], 1), (0, 0))
-        self.assertEqual(self.w_e2_d0.prev([0, 50], 10), (0, 30))
-        self.assertEqual(self.w_e2_d0.prev([0, 36], 1), (0, 34))
-        self.assertEqual(self.w_e_e3d.prev([0, 50], 10), (6, 46))
-        self.assertEqual(self.w_e_e3d.prev([3, 36], 1), (0, 36))
-        self.assertEqual(self.w_e_e3d.prev([6, 36], 2), (0, 36))
-        self.assertEqual(self.w_e_e3d.prev([6, 36], 3), (6, 35))
-        self.assertEqual(self.w_e_e3d.prev([3, 36], 6), (3, 34))
+        self.assertEqual(_move(self.w_e2_d0.prev, [1, 0], 0, 1), (0, 0))
+        self.assertEqual(_move(self.w_e2_d0.prev, [50, 0], 0, 10), (30, 0))
+        self.assertEqual(_move(self.w_e2_d0.prev, [36, 0], 0, 1), (34, 0))
+        self.assertEqual(_move(self.w_e_e3d.prev, [50, 0], 0, 10), (46, 6))
+        self.assertEqual(_move(self.w_e_e3d.prev, [36, 3], 0, 1), (36, 0))
+        self.assertEqual(_move(self.w_e_e3d.prev, [36, 6], 0, 2), (36, 0))
+        self.assertEqual(_move(self.w_e_e3d.prev, [36, 6], 0, 3), (35, 6))
+        self.assertEqual(_move(self.w_e_e3d.prev, [36, 3], 0, 6), (34, 3))
 
     def test_next(self):
-        self.assertEqual(self.w_e2_d0.next([0, 1], 1), (0, 2))
-        self.assertEqual(self.w_e2_d0.next([0, 30], 10), (0, 50))
-        self.assertEqual(self.w_e2_d0.next([0, 34], 1), (0, 36))
-        self.assertEqual(self.w_e_e3d.next([6, 46], 10), (0, 50))
-        self.assertEqual(self.w_e_e3d.next([0, 36], 1), (3, 36))
-        self.assertEqual(self.w_e_e3d.next([0, 36], 2), (6, 36))
-        self.assertEqual(self.w_e_e3d.next([6, 35], 3), (6, 36))
-        self.assertEqual(self.w_e_e3d.next([3, 34], 6), (3, 36))
+        self.assertEqual(_move(self.w_e2_d0.next, [1, 0], 0, 1), (2, 0))
+        self.assertEqual(_move(self.w_e2_d0.next, [30, 0], 0, 10), (50, 0))
+        self.assertEqual(_move(self.w_e2_d0.next, [34, 0], 0, 1), (36, 0))
+        self.assertEqual(_move(self.w_e_e3d.next, [46, 6], 0, 10), (50, 0))
+        self.assertEqual(_move(self.w_e_e3d.next, [36, 0], 0, 1), (36, 3))
+        self.assertEqual(_move(self.w_e_e3d.next, [36, 0], 0, 2), (36, 6))
+        self.assertEqual(_move(self.w_e_e3d.next, [35, 6], 0, 3), (36, 6))
+        self.assertEqual(_move(self.w_e_e3d.next, [34, 3], 0, 6), (36, 3))
 
 
 class CalendarTest(unittest.TestCase):
@@ -67,67 +92,188 @@ class CalendarTest(unittest.TestCase):
         self.w0 = Calendar([3, None, (2000, 3000, 3)], CMode.W)
 
     def test_reset_prev(self):
-        self.assertEqual(self.d0.reset_prev([5, 2003]), ([5, 2003], 0, 0))
-        self.assertEqual(self.d0.reset_prev([6, 2003]), ([5, 2003], 1, 0))
-        self.assertRaises(Indecisive, self.d0.reset_prev, [0, 2000])
-        self.assertEqual(self.m0.reset_prev([0, 3, 2003]), ([5, 1, 2003], 1, 0))
-        self.assertEqual(self.m0.reset_prev([0, 1, 2003]), ([5, 1, 2000], 1, 0))
-        self.assertRaises(Indecisive, self.m0.reset_prev, [0, 1, 2000])
-        self.assertEqual(self.m1.reset_prev([0, 1, 2004]), ([28, 1, 2003], 1, 0))
-        self.assertEqual(self.m1.reset_prev([0, 1, 2001]), ([27, 1, 2000], 1, 0))
-        self.assertEqual(self.mw0.reset_prev([0, 0, 1, 2001]), ([5, 3, 5, 2000], 1, 0))
-        self.assertEqual(self.mw0.reset_prev([0, 0, 1, 2018]), ([5, 4, 5, 2015], 1, 0))
-        self.assertEqual(self.mw0.reset_prev([0, 0, 6, 2018]), ([5, 3, 5, 2018], 1, 0))
-        self.assertEqual(self.w0.reset_prev([0, 1, 2003]), ([3, 0, 2003], 1, 0))
-        self.assertEqual(self.w0.reset_prev([0, 0, 2003]), ([3, 51, 2000], 1, 0))
-        self.assertEqual(self.w0.reset_prev([0, 0, 2004]), ([3, 52, 2003], 1, 0))
+        self.assertEqual(_reset(self.d0.reset_prev, [2003, 5]), ([2003, 5], 0))
+        self.assertEqual(_reset(self.d0.reset_prev, [2003, 6]), ([2003, 5], 1))
+        self.assertIsNone(_reset(self.d0.reset_prev, [2000, 0]))
+        self.assertEqual(_reset(self.m0.reset_prev, [2003, 3, 0]), ([2003, 1, 5], 1))
+        self.assertEqual(_reset(self.m0.reset_prev, [2003, 1, 0]), ([2000, 1, 5], 1))
+        self.assertIsNone(_reset(self.m0.reset_prev, [2000, 1, 0]))
+        self.assertEqual(_reset(self.m1.reset_prev, [2004, 1, 0]), ([2003, 1, 28], 1))
+        self.assertEqual(_reset(self.m1.reset_prev, [2001, 1, 0]), ([2000, 1, 27], 1))
+        self.assertEqual(_reset(self.mw0.reset_prev, [2001, 1, 0, 0]), ([2000, 5, 3, 5], 1))
+        self.assertEqual(_reset(self.mw0.reset_prev, [2018, 1, 0, 0]), ([2015, 5, 4, 5], 1))
+        self.assertEqual(_reset(self.mw0.reset_prev, [2018, 6, 0, 0]), ([2018, 5, 3, 5], 1))
+        self.assertEqual(_reset(self.w0.reset_prev, [2003, 1, 0]), ([2003, 0, 3], 1))
+        self.assertEqual(_reset(self.w0.reset_prev, [2003, 0, 0]), ([2000, 51, 3], 1))
+        self.assertEqual(_reset(self.w0.reset_prev, [2004, 0, 0]), ([2003, 52, 3], 1))
 
     def test_reset_next(self):
-        self.assertEqual(self.d0.reset_next([5, 2003]), ([5, 2003], 0, 0))
-        self.assertEqual(self.d0.reset_next([4, 2003]), ([5, 2003], 1, 0))
-        self.assertRaises(Indecisive, self.d0.reset_next, [6, 2999])
-        self.assertEqual(self.m0.reset_next([0, 3, 2003]), ([1, 1, 2006], 1, 0))
-        self.assertEqual(self.m0.reset_next([0, 3, 2003], True), ([1, 1, 2000], 1, 0))
-        self.assertEqual(self.m0.reset_next([6, 1, 2003]), ([1, 1, 2006], 1, 0))
-        self.assertRaises(Indecisive, self.m0.reset_next, [6, 1, 2999])
-        self.assertEqual(self.mw0.reset_next([0, 0, 6, 2015]), ([1, 0, 5, 2018], 1, 0))
-        self.assertEqual(self.mw0.reset_next([0, 3, 5, 2014]), ([1, 0, 5, 2015], 1, 0))
-        self.assertRaises(Indecisive, self.mw0.reset_next, [6, 4, 11, 2999])
-        self.assertEqual(self.w0.reset_next([0, 1, 2003]), ([3, 1, 2003], 1, 0))
-        self.assertEqual(self.w0.reset_next([5, 0, 2003]), ([3, 1, 2003], 1, 0))
-        self.assertEqual(self.w0.reset_next([0, 0, 2004]), ([3, 0, 2006], 1, 0))
+        self.assertEqual(_reset(self.d0.reset_next, [2003, 5]), ([2003, 5], 0))
+        self.assertEqual(_reset(self.d0.reset_next, [2003, 4]), ([2003, 5], 1))
+        self.assertIsNone(_reset(self.d0.reset_next, [2999, 6]))
+        self.assertEqual(_reset(self.m0.reset_next, [2003, 3, 0]), ([2006, 1, 1], 1))
+        self.assertEqual(_reset(self.m0.reset_next, [2003, 3, 0], True), ([2000, 1, 1], 1))
+        self.assertEqual(_reset(self.m0.reset_next, [2003, 1, 6]), ([2006, 1, 1], 1))
+        self.assertIsNone(_reset(self.m0.reset_next, [2999, 1, 6]))
+        self.assertEqual(_reset(self.mw0.reset_next, [2015, 6, 0, 0]), ([2018, 5, 0, 1], 1))
+        self.assertEqual(_reset(self.mw0.reset_next, [2014, 5, 3, 0]), ([2015, 5, 0, 1], 1))
+        self.assertIsNone(_reset(self.mw0.reset_next, [2999, 11, 4, 6]))
+        self.assertEqual(_reset(self.w0.reset_next, [2003, 1, 0]), ([2003, 1, 3], 1))
+        self.assertEqual(_reset(self.w0.reset_next, [2003, 0, 5]), ([2003, 1, 3], 1))
+        self.assertEqual(_reset(self.w0.reset_next, [2004, 0, 0]), ([2006, 0, 3], 1))
 
     def test_prev(self):
-        self.assertEqual(self.d0.prev([5, 2003], 1), (3, 2003))
-        self.assertEqual(self.d0.prev([1, 2003], 1), (5, 2000))
-        self.assertEqual(self.d0.prev([1, 2012], 10), (5, 2000))
-        self.assertEqual(self.m0.prev([1, 1, 2012], 10), (5, 1, 2000))
-        self.assertEqual(self.m0.prev([3, 1, 2012], 1), (1, 1, 2012))
-        self.assertEqual(self.m1.prev([3, 1, 2012], 10), (21, 1, 2009))
-        self.assertEqual(self.m1.prev([3, 1, 2006], 28), (4, 1, 2003))
-        self.assertEqual(self.m1.prev([3, 1, 2006], 57), (3, 1, 2000))
-        self.assertEqual(self.mw0.prev([3, 0, 5, 2003], 1), (1, 0, 5, 2003))
-        self.assertEqual(self.mw0.prev([3, 1, 5, 2003], 10), (1, 2, 5, 2000))
-        self.assertEqual(self.w0.prev([3, 0, 2006], 1), (3, 52, 2003))
-        self.assertEqual(self.w0.prev([3, 0, 2006], 10), (3, 43, 2003))
-        self.assertEqual(self.w0.prev([3, 0, 2006], 105), (3, 0, 2000))
-        self.assertRaises(Inadequate, self.w0.prev, [3, 0, 2006], 106)
+        self.assertEqual(_move(self.d0.prev, [2003, 5], 1), (2003, 3))
+        self.assertEqual(_move(self.d0.prev, [2003, 1], 1), (2000, 5))
+        self.assertEqual(_move(self.d0.prev, [2012, 1], 10), (2000, 5))
+        self.assertEqual(_move(self.m0.prev, [2012, 1, 1], 10), (2000, 1, 5))
+        self.assertEqual(_move(self.m0.prev, [2012, 1, 3], 1), (2012, 1, 1))
+        self.assertEqual(_move(self.m1.prev, [2012, 1, 3], 10), (2009, 1, 21))
+        self.assertEqual(_move(self.m1.prev, [2006, 1, 3], 28), (2003, 1, 4))
+        self.assertEqual(_move(self.m1.prev, [2006, 1, 3], 57), (2000, 1, 3))
+        self.assertEqual(_move(self.mw0.prev, [2003, 5, 0, 3], 1), (2003, 5, 0, 1))
+        self.assertEqual(_move(self.mw0.prev, [2003, 5, 1, 3], 10), (2000, 5, 2, 1))
+        self.assertEqual(_move(self.w0.prev, [2006, 0, 3], 1), (2003, 52, 3))
+        self.assertEqual(_move(self.w0.prev, [2006, 0, 3], 10), (2003, 43, 3))
+        self.assertEqual(_move(self.w0.prev, [2006, 0, 3], 105), (2000, 0, 3))
+        self.assertRaises(Inadequate, self.w0.prev, [2006, 0, 3], 106)
 
     def test_next(self):
-        self.assertEqual(self.d0.next([3, 2003], 1), (5, 2003))
-        self.assertEqual(self.d0.next([5, 2000], 1), (1, 2003))
-        self.assertEqual(self.d0.next([5, 2000], 10), (1, 2012))
-        self.assertEqual(self.m0.next([5, 1, 2000], 10), (1, 1, 2012))
-        self.assertEqual(self.m0.next([1, 1, 2012], 1), (3, 1, 2012))
-        self.assertEqual(self.m1.next([21, 1, 2009], 10), (3, 1, 2012))
-        self.assertEqual(self.m1.next([4, 1, 2003], 28), (3, 1, 2006))
-        self.assertEqual(self.m1.next([3, 1, 2000], 57), (3, 1, 2006))
-        self.assertEqual(self.mw0.next([1, 0, 5, 2003], 1), (3, 0, 5, 2003))
-        self.assertEqual(self.mw0.next([1, 2, 5, 2000], 10), (3, 1, 5, 2003))
-        self.assertEqual(self.w0.next([3, 52, 2003], 1), (3, 0, 2006))
-        self.assertEqual(self.w0.next([3, 51, 2003], 1), (3, 52, 2003))
-        self.assertEqual(self.w0.next([3, 52, 2003], 1), (3, 0, 2006))
-        self.assertEqual(self.w0.next([3, 43, 2003], 10), (3, 0, 2006))
-        self.assertEqual(self.w0.next([3, 0, 2000], 105), (3, 0, 2006))
-        self.assertEqual(self.w0.next([3, 0, 2993], 155), (3, 51, 2999))
-        self.assertRaises(Inadequate, self.w0.next, [3, 0, 2993], 156)
\ No newline at end of file
+        self.assertEqual(_move(self.d0.next, [2003, 3], 1), (2003, 5))
+        self.assertEqual(_move(self.d0.next, [2000, 5], 1), (2003, 1))
+        self.assertEqual(_move(self.d0.next, [2000, 5], 10), (2012, 1))
+        self.assertEqual(_move(self.m0.next, [2000, 1, 5], 10), (2012, 1, 1))
+        self.assertEqual(_move(self.m0.next, [2012, 1, 1], 1), (2012, 1, 3))
+        self.assertEqual(_move(self.m1.next, [2009, 1, 21], 10), (2012, 1, 3))
+        self.assertEqual(_move(self.m1.next, [2003, 1, 4], 28), (2006, 1, 3))
+        self.assertEqual(_move(self.m1.next, [2000, 1, 3], 57), (2006, 1, 3))
+        self.assertEqual(_move(self.mw0.next, [2003, 5, 0, 1], 1), (2003, 5, 0, 3))
+        self.assertEqual(_move(self.mw0.next, [2000, 5, 2, 1], 10), (2003, 5, 1, 3))
+        self.assertEqual(_move(self.w0.next, [2003, 52, 3], 1), (2006, 0, 3))
+        self.assertEqual(_move(self.w0.next, [2003, 51, 3], 1), (2003, 52, 3))
+        self.assertEqual(_move(self.w0.next, [2003, 52, 3], 1), (2006, 0, 3))
+        self.assertEqual(_move(self.w0.next, [2003, 43, 3], 10), (2006, 0, 3))
+        self.assertEqual(_move(self.w0.next, [2000, 0, 3], 105), (2006, 0, 3))
+        self.assertEqual(_move(self.w0.next, [2993, 0, 3], 155), (2999, 51, 3))
+        self.assertRaises(Inadequate, self.w0.next, [2993, 0, 3], 156)
+
+
+class GregorianCycleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.m = Calendar([None, None, None], CMode.M)
+        self.d = Calendar([None, None], CMode.D)
+        self.w = Calendar([3, None, None], CMode.W)
+        self.s = Calendar([0, 1, (0, -1, 3)], CMode.M)
+
+    def test_cycle(self):
+        self.assertEqual(self.m._node.cycle, (400, 146097))
+        self.assertEqual(self.d._node.cycle, (400, 146097))
+        self.assertEqual(self.w._node.cycle, (400, 20871))
+        self.assertEqual(self.s._node.cycle, (400, 400))
+
+    def test_next(self):
+        d0 = date(2000, 3, 1)
+        for leap in (1, 146097, 146098, 10**6, 2 * 10**6 + 3):
+            d1 = d0 + timedelta(leap)
+            self.assertEqual(
+                _move(self.m.next, [1999, 2, 0], leap),
+                (d1.year - 1, d1.month - 1, d1.day - 1),
+            )
+            self.assertEqual(
+                _move(self.d.next, [1999, 60], leap),
+                (d1.year - 1, d1.timetuple().tm_yday - 1),
+            )
+        self.assertEqual(_move(self.w.next, [2000, 0, 3], 20871 * 10), (6000, 0, 3))
+        self.assertEqual(_move(self.s.next, [0, 1, 0], 3000), (9000, 1, 0))
+        self.assertRaises(Inadequate, self.m.next, [1999, 2, 0], 10**7)
+
+    def test_prev(self):
+        d0 = date(9000, 3, 1)
+        for leap in (1, 146097, 146098, 10**6, 2 * 10**6 + 3):
+            d1 = d0 - timedelta(leap)
+            self.assertEqual(
+                _move(self.m.prev, [8999, 2, 0], leap),
+                (d1.year - 1, d1.month - 1, d1.day - 1),
+            )
+            self.assertEqual(
+                _move(self.d.prev, [8999, 59], leap),
+                (d1.year - 1, d1.timetuple().tm_yday - 1),
+            )
+        self.assertEqual(_move(self.w.prev, [6000, 0, 3], 20871 * 10), (2000, 0, 3))
+        self.assertEqual(_move(self.s.prev, [9000, 1, 0], 3000), (0, 1, 0))
+        self.assertRaises(Inadequate, self.m.prev, [8999, 2, 0], 10**7)
+
+
+class NodesIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.m = Calendar([None, None, (2000, 3000, 3)], CMode.M)._node
+        self.mw = Calendar([None, None, 5, [1, 3, 2021, 4095]], CMode.MW)._node
+
+    def test_nodes_behind(self):
+        for node in (self.m, self.mw):
+            counts = [0] * len(node.nodes)
+            for m in node.marks:
+                counts[node.which_node(m)[1]] += 1
+                self.assertEqual(node.nodes_behind(m), tuple(counts))
+            self.assertEqual(node.total_nodes_count, tuple(counts))
+
+    def test_cost(self):
+        self.assertEqual(self.m.cost_behind([2000, 0, 0], 0), 0)
+        self.assertEqual(self.m.cost_ahead([3000, 11, 30], 0), 0)
+        self.assertEqual(
+            self.m.cost_behind([3000, 11, 30], 0) + 1, self.m.total_count
+        )
+
+
+class LayoutTest(unittest.TestCase):
+    def test_layout(self):
+        feb1 = Calendar([0, 1, None], CMode.M)
+        self.assertEqual(feb1.layout.first, (date(1, 2, 1) - date(1970, 1, 1)).days)
+        self.assertEqual(feb1.layout[2:], (365, 366))
+        # sundays of iso week 52, 53 weeks years leave a gap of 371 days
+        self.assertEqual(Calendar([6, 51, None], CMode.W).layout[2:], (364, 371))
+        self.assertEqual(Calendar([None, None], CMode.D).layout[2:], (1, 1))
+        # monday of the 2nd week of each month, 4 or 5 weeks apart
+        self.assertEqual(Calendar([0, 1, None, None], CMode.MW).layout[2:], (28, 35))
+        self.assertIsNone(Calendar([0, 1, 2003], CMode.M).layout.min_gap)
+
+
+class InternTest(unittest.TestCase):
+    def test_shared(self):
+        a = Calendar([[1, 15], (0, 11, 3), None], CMode.M)
+        b = Calendar([[1, 15], (0, 11, 3), None], CMode.M)
+        self.assertIs(a._node, b._node)
+        # lists and sequences of the same numbers are different specs
+        c = Calendar([[1, 15], [0, 11, 3], None], CMode.M)
+        self.assertIsNot(a._node, c._node)
+
+    def test_subtree(self):
+        a = Calendar([[1, 15], (0, 11, 3), None], CMode.M)._node
+        b = Calendar([[1, 15], (0, 11, 3), (2000, 2100, 1)], CMode.M)._node
+        self.assertIsNot(a, b)
+        for x, y in zip(a.nodes, b.nodes):
+            self.assertIs(x, y)
+        # marks are shared by spec and cap
+        day = a.nodes[0].nodes[0]
+        self.assertIs(day.mark, load_mark([1, 15], cap=29))
+        self.assertIsNot(day.mark, load_mark([1, 15], cap=30))
+
+
+class YearTableTest(unittest.TestCase):
+    def test_tables(self):
+        for y in range(1, 10000):
+            self.assertEqual(YEARS.leap[y], isleap(y))
+            self.assertEqual(YEARS.weeks[y], weeks_in_year(y))
+            x = 2 * d1_year(y - 1) + int(isleap(y))
+            self.assertEqual(year_pattern_of(y, 1), YEAR_PATTERN[x])
+            self.assertEqual(year_pattern_of(y - 1), YEAR_PATTERN[x])
+        self.assertEqual(len(YEARS.pattern), TABLE_YEARS)
+
+    def test_week_tables(self):
+        for x, pt in enumerate(YEAR_PATTERN):
+            offsets, weeks = WEEK_OFFSETS[x], MONTH_WEEKS[x]
+            self.assertEqual(offsets[-1], 48 + bin(pt).count("1") - 1)
+            self.assertEqual(len(weeks), offsets[-1] + 1)
+            for woy in range(1, len(weeks)):
+                m, wom = weeks[woy]
+                self.assertEqual(offsets[m - 1] + wom, woy)
@@ -1,10 +1,10 @@
 import unittest
 from xchronos.clock.clock import TimeT
 
-from xchronos.clock.clock import Clock as OClock
+from xchronos.clock.clock import Clock as OClock, TableClock as OTableClock, load_clock
 
 
-class Clock(OClock):
+class ResetMixin:
     def prev(self, now: TimeT, leap: int = 1):
         marks, reset, bo = self.reset_prev(now)
 
@@ -24,6 +24,14 @@ class Clock(OClock):
         return nums, carry + bo
 
 
+class Clock(ResetMixin, OClock):
+    ...
+
+
+class TableClock(ResetMixin, OTableClock):
+    ...
+
+
 class ClockTest(unittest.TestCase):
     def setUp(self) -> None:
         self.clock0 = Clock((1, 21, 4), 0, (0, -1, 10))
@@ -93,3 +101,44 @@ class ClockTest(unittest.TestCase):
         self.assertEqual(self.clock2.next((4, 55, 9), 14), ((6, 10, 10), 0))
         self.assertEqual(self.clock3.next((23, 59, 9), 6), ((0, 5, 0), 1))
         self.assertEqual(self.clock4.next((6, 0, 11), 6), ((9, 0, 0), 5))
+
+
+class TableClockTest(ClockTest):
+    """same cases on the second table"""
+
+    def setUp(self) -> None:
+        self.clock0 = TableClock((1, 21, 4), 0, (0, -1, 10))
+        self.clock1 = TableClock([4, 6, 10, 12], None, 10)
+        self.clock2 = TableClock(None, (5, -5, 5), 10)
+        self.clock3 = TableClock(None, None, 0)
+        self.clock4 = TableClock(9, 0, 0)
+
+    def test_cost(self):
+        for clock in (self.clock0, self.clock1, self.clock2):
+            hands = Clock(*(list(hand.marks) for hand in clock.hands))
+            self.assertEqual(clock.total_count, hands.total_count)
+            for now in ((4, 0, 10), (12, 55, 10), (21, 0, 50)):
+                if now in clock:
+                    self.assertEqual(clock.cost_behind(now), hands.cost_behind(now))
+                    self.assertEqual(clock.cost_ahead(now), hands.cost_ahead(now))
+
+    def test_load(self):
+        self.assertIsInstance(load_clock([4, 6, 10, 12], None, 10), OTableClock)
+        self.assertNotIsInstance(load_clock(None, (5, -5, 5), 10), OTableClock)
+        self.assertNotIsInstance(load_clock([4], 0, 0), OTableClock)
+        self.assertEqual(self.clock1.table.nbytes, 8 * 1350 + 4 * 1351)
+
+    def test_load_wrap(self):
+        # whichever clock is loaded answers as the hand chain does
+        for specs in (
+            ((20, 11, 1), 23, [12, 39]),
+            ([1, 5, 9], (50, 10, 3), 0),
+            ([4, 6, 10, 12], None, (40, 5, 7)),
+            ([3, 15], 30, [0, 30]),
+        ):
+            loaded, hands = load_clock(*specs), OClock(*specs)
+            for x in range(0, 86400, 97):
+                now = (x // 3600, x // 60 % 60, x % 60)
+                self.assertEqual(loaded.contains(now), hands.contains(now))
+                self.assertEqual(loaded.reset_next(now), hands.reset_next(now))
+                self.assertEqual(loaded.reset_prev(now), hands.reset_prev(now))
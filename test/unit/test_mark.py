@@ -1,7 +1,7 @@
 import random
 import unittest
 
-from xchronos.mark import EnumM, Every, Seq, Solo, _fmt_mark_num
+from xchronos.mark import BitsetM, EnumM, Every, Seq, Solo, _fmt_mark_num, load_mark
 
 _CAPS = [3, 4, 6, 11, 23, 27, 28, 29, 30, 51, 52, 59, 364, 365]
 
@@ -266,3 +266,36 @@ class EnumTest(SeqTest):
         self.assertEqual(self.mark59_3_43_3.last_nth(15), 42)
         self.assertEqual(self.mark59_1_10_3.last_nth(5), 10)
         self.assertEqual(self.mark3_1_3_4.last_nth(1), 1)
+
+
+class BitsetTest(EnumTest):
+    def setUp(self) -> None:
+        self.mark59_all = BitsetM(list(range(60)), 59)
+        self.mark59_3_43_3 = BitsetM(list(range(3, 44, 3)), 59)
+        self.mark59_1_10_3 = BitsetM(list(range(1, 11, 3)), 59)
+        self.mark3_1_3_4 = BitsetM(list(range(1, 4, 4)), 3)
+        self.mark30_26_10_3 = BitsetM([26, 29, 1, 4, 7, 10], 30)
+
+    def test_load_mark(self):
+        self.assertIsInstance(load_mark([1, 3, 5], cap=59), EnumM)
+        self.assertNotIsInstance(load_mark([1, 3, 5], cap=59), BitsetM)
+        self.assertIsInstance(load_mark([1, 3, 5], cap=6), BitsetM)
+        self.assertIsInstance(load_mark(list(range(0, 9998, 7)), cap=9998), BitsetM)
+
+    def test_load_composite(self):
+        mark = load_mark([(1, 10, 2), 20, -1], cap=23)
+        self.assertEqual(mark.marks, (1, 3, 5, 7, 9, 20, 23))
+        mark = load_mark([(0, -1, 15), (-5, 1, 2), 30], cap=59)
+        self.assertEqual(mark.marks, (0, 1, 15, 30, 45, 55, 57, 59))
+
+    def test_against_enum(self):
+        for cap in _CAPS + [9998]:
+            marks = random.sample(range(cap + 1), random.randint(1, cap))
+            bits, enum = BitsetM(marks, cap), EnumM(marks, cap)
+            for n in range(cap + 1):
+                leap = random.randint(1, 3 * cap)
+                self.assertEqual(bits.contains(n), enum.contains(n))
+                self.assertEqual(bits.cost_ahead(n), enum.cost_ahead(n))
+                self.assertEqual(bits.cost_behind(n), enum.cost_behind(n))
+                self.assertEqual(bits.next(n, leap), enum.next(n, leap))
+                self.assertEqual(bits.prev(n, leap), enum.prev(n, leap))
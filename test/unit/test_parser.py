@@ -1,12 +1,17 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import unittest
 from xchronos.calendar.calendar import CMode
 from xchronos.exceptions import ModeMismatch, NoMatch
 from xchronos.parser.calc import CalcDecM, CalcDecMW, CalcDecD, CalcDecW
 
+from xchronos.parser.civil import (
+    civil_from_days,
+    days_from_civil,
+    days_from_iso,
+    iso_from_days,
+)
 from xchronos.parser.datetime import DTEncM, DTEncMW, DTEncW, DTEncD
-from xchronos.parser.specs.period import PeriodDecoder
-from xchronos.parser.specs.point import CronDecoder
+from xchronos.parser.specs.lexer import CronLexer, PeriodLexer
 from xchronos.parser.specs.scope import (
     ScopeType,
     SoloDecoder,
@@ -117,6 +122,8 @@ class ScopeTest(unittest.TestCase):
                 ("5,-6,", [5, -6]),
                 ("-6,-10,30", [-6, -10, 30]),
                 ("-6,-10,30,1,4,11,25,10", [-6, -10, 30, 1, 4, 11, 25, 10]),
+                ("1~10/2,20,30~40/5", [(1, 10, 2), 20, (30, 40, 5)]),
+                ("*/15,-1~-3,", [(0, -1, 15), (-1, -3, 1)]),
             ],
             ScopeType.SPAN: [
                 ("..", (0, -1)),
@@ -153,6 +160,9 @@ class ScopeTest(unittest.TestCase):
         self.assertEqual(SoloDecoder.decode("10", base=1), 9)
         self.assertEqual(SoloDecoder.decode("-10", base=1), -10)
         self.assertEqual(EnumDecoder.decode("-10,10", base=1), [-10, 9])
+        self.assertEqual(
+            EnumDecoder.decode("1~10/2,20,-1", base=1), [(0, 9, 2), 19, -1]
+        )
         self.assertEqual(SeqDecoder.decode("-10~10", base=1), (-10, 9, 1))
         self.assertEqual(SeqDecoder.decode("10~-10", base=1), (9, -10, 1))
         self.assertEqual(SeqDecoder.decode("10~10", base=1), (9, 9, 1))
@@ -164,48 +174,91 @@ class ScopeTest(unittest.TestCase):
 class PointTest(unittest.TestCase):
     def test_decode(self):
         self.assertEqual(
-            CronDecoder.decode("* * * * 1", CMode.D), ([None, None], [None, None, 1])
+            CronLexer.decode("* * * * 1", CMode.D), ([None, None], [None, None, 1])
         )
         self.assertEqual(
-            CronDecoder.decode("2000~3000/3 */5 1,3,20 * 0", CMode.D),
+            CronLexer.decode("2000-3000/3 */5 1,3,20 * 0", CMode.D),
             ([(0, -1, 5), (1999, 2999, 3)], [[1, 3, 20], None, 0]),
         )
         self.assertEqual(
-            CronDecoder.decode("* */5 1,3,20, * */3 0", CMode.M),
+            CronLexer.decode("* */5 1,3,20, * */3 0", CMode.M),
             ([[0, 2, 19], (0, -1, 5), None], [None, (0, -1, 3), 0]),
         )
 
         self.assertEqual(
-            CronDecoder.decode("* */5 1,3,20, * */3 0", CMode.W),
+            CronLexer.decode("* */5 1,3,20, * */3 0", CMode.W),
             ([[0, 2, 19], (0, -1, 5), None], [None, (0, -1, 3), 0]),
         )
 
         self.assertEqual(
-            CronDecoder.decode("* */5 1,3,20, 1 * */3 0", CMode.MW),
+            CronLexer.decode("* */5 1,3,20, 1 * */3 0", CMode.MW),
             ([0, [0, 2, 19], (0, -1, 5), None], [None, (0, -1, 3), 0]),
         )
+        self.assertEqual(
+            CronLexer.decode("* L1 1-L1/2,L3,*/7 * 5-10 0", CMode.W),
+            ([[(0, -1, 2), -3, (0, -1, 7)], -1, None], [None, (5, 10, 1), 0]),
+        )
 
 
 class PeriodTest(unittest.TestCase):
     def test_decode(self):
         self.assertEqual(
-            PeriodDecoder.decode("* * * * ..", CMode.D),
+            PeriodLexer.decode("* * * * ..", CMode.D),
             (([None, None], [None, None]), ([None, None, 0], [None, None, -1])),
         )
-        self.assertRaises(NoMatch, PeriodDecoder.decode, "* * 1..6 * ..", CMode.D)
+        self.assertRaises(NoMatch, PeriodLexer.decode, "* * 1..6 * ..", CMode.D)
         self.assertEqual(
-            PeriodDecoder.decode("* 1..6 .. .. ..", CMode.D),
+            PeriodLexer.decode("* 1..6 .. .. ..", CMode.D),
             (([0, None], [5, None]), ([0, 0, 0], [-1, -1, -1])),
         )
         self.assertEqual(
-            PeriodDecoder.decode("* 1..6 .. .. 10 ..", CMode.M),
+            PeriodLexer.decode("* 1..6 .. .. 10 ..", CMode.M),
             (([0, 0, None], [-1, 5, None]), ([0, 10, 0], [-1, 10, -1])),
         )
         self.assertEqual(
-            PeriodDecoder.decode("* 1..6 .. .. 10 ..", CMode.W),
+            PeriodLexer.decode("* 1..6 .. .. 10 ..", CMode.W),
             (([0, 0, None], [-1, 5, None]), ([0, 10, 0], [-1, 10, -1])),
         )
         self.assertEqual(
-            PeriodDecoder.decode("* 1.. .. 6 .. 10 ..", CMode.MW),
+            PeriodLexer.decode("* 1.. .. 6 .. 10 ..", CMode.MW),
             (([5, 0, 0, None], [5, -1, -1, None]), ([0, 10, 0], [-1, 10, -1])),
         )
+        self.assertEqual(
+            PeriodLexer.decode("* 1..L2 .. .. 10 ..", CMode.M),
+            (([0, 0, None], [-1, -2, None]), ([0, 10, 0], [-1, 10, -1])),
+        )
+
+
+class LexerTest(unittest.TestCase):
+    def test_no_match(self):
+        for field in ("L", "-1", "1-", "*/", "1/2", "1,", ",1", "1,,2", "**", ".."):
+            self.assertRaises(NoMatch, CronLexer.decode, f"* * {field} * *", CMode.D)
+        for field in ("1..2..3", "L..", "1...2"):
+            self.assertRaises(NoMatch, PeriodLexer.decode, f"* {field} * *", CMode.D)
+        self.assertRaises(NoMatch, PeriodLexer.decode, "* * 1..6 * ..", CMode.D)
+        self.assertRaises(ModeMismatch, CronLexer.decode, "* * *", CMode.D)
+
+
+class CivilTest(unittest.TestCase):
+    def test_days(self):
+        epoch = date(1970, 1, 1)
+        for z in list(range(-800, 800)) + list(range(-719162, 2932897, 997)):
+            d = epoch + timedelta(z)
+            self.assertEqual(civil_from_days(z), (d.year, d.month, d.day))
+            self.assertEqual(days_from_civil(d.year, d.month, d.day), z)
+            self.assertEqual(iso_from_days(z), tuple(d.isocalendar()))
+            self.assertEqual(days_from_iso(*d.isocalendar()), z)
+
+    def test_encode_ts(self):
+        epoch = datetime(1970, 1, 1)
+        for enc, dec in (
+            (DTEncM, CalcDecM),
+            (DTEncMW, CalcDecMW),
+            (DTEncW, CalcDecW),
+            (DTEncD, CalcDecD),
+        ):
+            for ts in (0, -1, 951782400, 1104451199, 1735603200, 32503680000):
+                now = epoch + timedelta(seconds=ts)
+                encs = enc.encode_ts(ts)
+                self.assertEqual(encs, enc.encode(now))
+                self.assertEqual(dec.decode_ts(encs[:-3], encs[-3:]), ts)
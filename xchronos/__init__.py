@@ -1,3 +1,5 @@
+from .cache import compile_cache
 from .chronos import ChronoX, ChronoXSpan, CMode
+from .scheduler import Scheduler
 
-__all__ = ["ChronoX", "ChronoXSpan", "CMode"]
+__all__ = ["ChronoX", "ChronoXSpan", "CMode", "Scheduler", "compile_cache"]
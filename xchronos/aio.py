@@ -0,0 +1,141 @@
+import asyncio
+from datetime import datetime
+from inspect import isawaitable
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Set,
+    Union,
+)
+
+from .chronos import MIN_DT_UNIT, ChronosT
+from .scheduler import Scheduler
+
+NowF = Callable[[], datetime]
+# callback(fire time, # of firings missed before it)
+CallbackF = Callable[[datetime, int], Union[Awaitable[None], None]]
+
+
+def _set_done(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+async def sleep_until(when: datetime, now: NowF = datetime.now) -> None:
+    """
+    sleep on the loop's monotonic clock until the wall clock reaches when,
+    the delay is recomputed from the wall clock on every wake up so drift never accumulates
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        delay = (when - now()).total_seconds()
+        if delay <= 0:
+            return
+        fut = loop.create_future()
+        handle = loop.call_at(loop.time() + delay, _set_done, fut)
+        try:
+            await fut
+        finally:
+            handle.cancel()
+
+
+async def aiter_next(
+    chronos: ChronosT, start: Union[datetime, None] = None, now: NowF = datetime.now
+) -> AsyncIterator[datetime]:
+    """
+    yield fire times after start as the wall clock reaches them,
+    when woken late, firings missed in between are skipped in one jump to the latest due one
+    """
+    occurs = chronos.iter_next(start or now())
+    fire = next(occurs, None)
+    while fire is not None:
+        await sleep_until(fire, now)
+        latest = chronos.prev(now() + MIN_DT_UNIT)
+        if latest > fire:
+            fire = latest
+            occurs = chronos.iter_next(latest)
+        yield fire
+        fire = next(occurs, None)
+
+
+class AsyncScheduler:
+    """
+    run callbacks of many ChronosT on one event loop, sleeping until the earliest fire time,
+    missed firings are counted and passed to the callback instead of being replayed
+    """
+
+    __slots__ = ("_scheduler", "_callbacks", "_now", "_wakeup", "_tasks")
+
+    def __init__(self, now: NowF = datetime.now) -> None:
+        self._scheduler = Scheduler()
+        self._callbacks: Dict[Hashable, CallbackF] = {}
+        self._now = now
+        self._wakeup: Union[asyncio.Future, None] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._scheduler)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._scheduler
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            _set_done(self._wakeup)
+
+    def add(
+        self,
+        key: Hashable,
+        chronos: ChronosT,
+        callback: CallbackF,
+        start: Union[datetime, None] = None,
+    ) -> Union[datetime, None]:
+        """schedule callback under key, return the first fire time, None if it never fires"""
+        fire = self._scheduler.add(key, chronos, start or self._now())
+        if fire is None:
+            self._callbacks.pop(key, None)
+        else:
+            self._callbacks[key] = callback
+        self._notify()
+        return fire
+
+    def remove(self, key: Hashable) -> bool:
+        self._callbacks.pop(key, None)
+        return self._scheduler.remove(key)
+
+    def when(self, key: Hashable) -> datetime:
+        return self._scheduler.when(key)
+
+    def _dispatch(self, fire: datetime, key: Hashable, missed: int) -> None:
+        res = self._callbacks[key](fire, missed)
+        if isawaitable(res):
+            task = asyncio.ensure_future(res)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def run(self) -> None:
+        """run until cancelled"""
+        loop = asyncio.get_running_loop()
+        while True:
+            nxt = self._scheduler.peek()
+            handle = None
+            if nxt is not None:
+                delay = (nxt[0] - self._now()).total_seconds()
+                if delay <= 0:
+                    for fire, key, missed in self._scheduler.pop_latest(self._now()):
+                        self._dispatch(fire, key, missed)
+                    continue
+
+            # woken by the timer, or by add for a possibly earlier job
+            self._wakeup = loop.create_future()
+            if nxt is not None:
+                handle = loop.call_at(loop.time() + delay, _set_done, self._wakeup)
+            try:
+                await self._wakeup
+            finally:
+                self._wakeup = None
+                if handle is not None:
+                    handle.cancel()
@@ -0,0 +1,181 @@
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .calendar.calendar import Calendar
+from .clock.clock import Clock
+from .exceptions import Inadequate
+from .parser.calc import CalcP
+from .parser.civil import DAY_SECONDS
+from .parser.datetime import DTE
+
+
+def to_seconds(arr) -> Tuple["np.ndarray", bool]:
+    """datetime64 or int epoch seconds array to int64 epoch seconds, and if it was datetime64"""
+    arr = np.asarray(arr)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return arr.astype("datetime64[s]").astype(np.int64), True
+    return arr.astype(np.int64), False
+
+
+def lost_day() -> int:
+    """
+    epoch day standing for no occurrence left in a non strict query,
+    its seconds compare greater than every real timestamp,
+    and adding a second of the day to them does not overflow
+    """
+    return np.iinfo(np.int64).max // DAY_SECONDS - 1
+
+
+def from_seconds(secs: "np.ndarray", is_dt: bool) -> "np.ndarray":
+    return secs.astype("datetime64[s]") if is_dt else secs
+
+
+class Batch:
+    """
+    vectorized queries over numpy arrays of timestamps,
+    clock arithmetic runs on arrays, the calendar tree is only consulted
+    once per distinct day (and # of days to leap) of a call
+    """
+
+    __slots__ = (
+        "_calendar",
+        "_clock",
+        "_dt_enc",
+        "_calc_dec",
+        "_hands",
+        "_secs",
+    )
+
+    def __init__(
+        self, calendar: Calendar, clock: Clock, dt_enc: DTE, calc_dec: CalcP
+    ) -> None:
+        if np is None:
+            raise ImportError("numpy is required for batch queries")
+
+        self._calendar = calendar
+        self._clock = clock
+        self._dt_enc = dt_enc
+        self._calc_dec = calc_dec
+
+        # per hand lookup table, if the hand contains a number, which is not
+        # always one of its marks for a Seq across the base
+        self._hands = tuple(
+            np.fromiter((n in hand for n in range(hand.cap + 1)), bool, hand.cap + 1)
+            for hand in clock.hands
+        )
+
+        hour, minute, second = (
+            np.asarray(hand.marks, dtype=np.int64) for hand in clock.hands
+        )
+        # seconds of the day of every clock occurrence, sorted
+        self._secs = (
+            hour[:, None, None] * 3600 + minute[None, :, None] * 60 + second
+        ).ravel()
+
+    @property
+    def day_seconds(self) -> "np.ndarray":
+        return self._secs
+
+    def _day_fields(self, day: int) -> List[int]:
+        """calendar state of day, the clock numbers it runs on with are left as 0"""
+        return list(self._dt_enc.encode_ts(day * DAY_SECONDS))
+
+    def _to_day(self, s: List[int]) -> int:
+        return self._calc_dec.decode_ts(s, (0, 0, 0)) // DAY_SECONDS
+
+    def is_day(self, day: int) -> bool:
+        return self._calendar.contains(self._day_fields(day))
+
+    def is_days(self, days: "np.ndarray") -> "np.ndarray":
+        uniq, inv = np.unique(days, return_inverse=True)
+        ok = np.fromiter((self.is_day(d) for d in uniq.tolist()), bool, len(uniq))
+        return ok[inv.reshape(-1)]
+
+    def shift_day(self, day: int, shift: int) -> int:
+        """the |shift|th calendar day after (shift > 0) or before (shift < 0) day"""
+        s = self._day_fields(day)
+        leap = abs(shift)
+        fn, reset = ("next", "reset_next") if shift > 0 else ("prev", "reset_prev")
+        if not self.is_day(day):
+            if getattr(self._calendar, reset)(s) is None:
+                raise Inadequate
+            leap -= 1
+        if leap > 0:
+            getattr(self._calendar, fn)(s, leap)
+        return self._to_day(s)
+
+    def _try_shift_day(self, day: int, shift: int, strict: bool) -> int:
+        try:
+            return self.shift_day(day, shift)
+        except Inadequate:
+            if strict:
+                raise
+            return lost_day()
+
+    def _shift_days(
+        self, days: "np.ndarray", shift: "np.ndarray", strict: bool = True
+    ) -> "np.ndarray":
+        days = days.copy()
+        moved = shift != 0
+        if not moved.any():
+            return days
+        pairs, inv = np.unique(
+            np.stack((days[moved], shift[moved]), axis=1), axis=0, return_inverse=True
+        )
+        shifted = np.fromiter(
+            (self._try_shift_day(d, s, strict) for d, s in pairs.tolist()),
+            np.int64,
+            len(pairs),
+        )
+        days[moved] = shifted[inv.reshape(-1)]
+        return days
+
+    def next_many(self, arr, leap: int = 1, strict: bool = True) -> "np.ndarray":
+        """
+        strict raises Inadequate when an element has no occurrence left,
+        otherwise it gets the first second of lost_day()
+        """
+        secs, is_dt = to_seconds(arr)
+        days, tod = np.divmod(secs.ravel(), DAY_SECONDS)
+        count = len(self._secs)
+
+        # clock occurrences passed in the day, all of them if not a calendar day
+        pos = np.searchsorted(self._secs, tod, side="right")
+        pos[~self.is_days(days)] = count
+        shift, idx = np.divmod(pos + (leap - 1), count)
+
+        days = self._shift_days(days, shift, strict)
+        res = days * DAY_SECONDS + self._secs[idx]
+        if not strict:
+            # the same second for every element lost, so that two of them compare equal
+            res[days == lost_day()] = lost_day() * DAY_SECONDS
+        return from_seconds(res.reshape(secs.shape), is_dt)
+
+    def prev_many(self, arr, leap: int = 1) -> "np.ndarray":
+        secs, is_dt = to_seconds(arr)
+        days, tod = np.divmod(secs.ravel(), DAY_SECONDS)
+        count = len(self._secs)
+
+        # clock occurrences before now in the day, none of them if not a calendar day
+        pos = np.searchsorted(self._secs, tod, side="left")
+        pos[~self.is_days(days)] = 0
+        shift, idx = np.divmod(pos - leap, count)
+
+        days = self._shift_days(days, shift)
+        res = days * DAY_SECONDS + self._secs[idx]
+        return from_seconds(res.reshape(secs.shape), is_dt)
+
+    def contains_many(self, arr) -> "np.ndarray":
+        secs, _ = to_seconds(arr)
+        days, tod = np.divmod(secs, DAY_SECONDS)
+        hour, tod = np.divmod(tod, 3600)
+        minute, second = np.divmod(tod, 60)
+
+        mask = self._hands[0][hour] & self._hands[1][minute] & self._hands[2][second]
+        # calendar is only consulted for timestamps the clock contains
+        mask[mask] = self.is_days(days[mask])
+        return mask
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Hashable, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompileCache:
+    """
+    bounded, thread-safe LRU cache of compiled expressions,
+    maxsize 0 disables caching
+    """
+
+    __slots__ = ("_data", "_lock", "_maxsize", "_hits", "_misses")
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        assert maxsize >= 0, "maxsize cannot be negative"
+        self._data: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        """cached value of key, built by build on miss"""
+        with self._lock:
+            val = self._data.get(key)
+            if val is not None:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return val
+            self._misses += 1
+
+        # build outside the lock, a concurrent build of the same key keeps the first
+        val = build()
+        if self._maxsize == 0:
+            return val
+
+        with self._lock:
+            val = self._data.setdefault(key, val)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return val
+
+    def resize(self, maxsize: int) -> None:
+        """set the max # of entries, 0 disables the cache"""
+        assert maxsize >= 0, "maxsize cannot be negative"
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+
+compile_cache = CompileCache()
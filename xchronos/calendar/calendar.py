@@ -1,8 +1,10 @@
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Union
+from .node import ResetT, StateT
 from .year import YT, YTC, DYear, WMYear, WYear, Year
 
 from ..mark import SpecT
+from ..utils import Layout
 
 
 class CMode(str, Enum):
@@ -32,20 +34,46 @@ class Calendar:
     def mode(self):
         return self._mode
 
-    def reset_prev(self, num: List[int], reset: bool = False):
-        return self._node.reset_prev(num, reset)
+    @property
+    def node(self) -> YT:
+        return self._node
+
+    @property
+    def total_count(self) -> int:
+        return self._node.total_count
+
+    @property
+    def layout(self) -> Union[Layout, None]:
+        """layout of all dates in days since the epoch, None if empty"""
+        return self._node.layout
+
+    def reset_prev(self, s: StateT, reset: bool = False) -> ResetT:
+        """
+        s: state from the top level down, reset in place,
+        it may run on with other numbers (the clock) which are left untouched,
+        None if no date is left before s
+        """
+        return self._node.reset_prev(s, 0, reset)
+
+    def reset_next(self, s: StateT, reset: bool = False) -> ResetT:
+        """None if no date is left after s"""
+        return self._node.reset_next(s, 0, reset)
+
+    def prev(self, s: StateT, leap=1) -> None:
+        """s: reset, moved in place"""
+        self._node.prev(s, 0, leap)
 
-    def reset_next(self, num: List[int], reset: bool = False):
-        return self._node.reset_next(num, reset)
+    def next(self, s: StateT, leap=1) -> None:
+        self._node.next(s, 0, leap)
 
-    def prev(self, num: List[int], leap=1):
-        """ "num: reverse order and reset"""
-        return self._node.prev(num, leap)
+    def cost_ahead(self, s: StateT) -> int:
+        """s: reset"""
+        return self._node.cost_ahead(s, 0)
 
-    def next(self, num: List[int], leap=1):
-        return self._node.next(num, leap)
+    def cost_behind(self, s: StateT) -> int:
+        return self._node.cost_behind(s, 0)
 
-    def contains(self, num: List[int]) -> bool:
-        return self._node.contains(num)
+    def contains(self, s: StateT) -> bool:
+        return self._node.contains(s, 0)
 
     __contains__ = contains
@@ -1,11 +1,15 @@
-from typing import List, Tuple
-from ..exceptions import Indecisive
-from .node import LinkMarkT
+try:
+    from functools import cached_property
+except ImportError:
+    from ..utils import cached_property
+
+from typing import Tuple, Union
+from .node import LinkMarkT, ResetT, StateT
 from ..mark import MarkT, SpecT, load_mark
-from ..utils import Meta
+from ..utils import POINT, InternMeta, Layout, Meta, join_layout
 
 
-class Day(LinkMarkT, metaclass=Meta, cap=30):
+class Day(LinkMarkT, metaclass=InternMeta, cap=30):
     __slots__ = "_mark"
 
     def __init__(self, spec: SpecT) -> None:
@@ -17,6 +21,11 @@ class Day(LinkMarkT, metaclass=Meta, cap=30):
 
     total_count = count
 
+    @cached_property
+    def layout(self) -> Union[Layout, None]:
+        """day marks are offsets in days already"""
+        return join_layout((m, POINT) for m in self._mark.marks)
+
     @property
     def cap(self) -> int:
         return self._mark.cap
@@ -29,50 +38,52 @@ class Day(LinkMarkT, metaclass=Meta, cap=30):
     def mark(self) -> MarkT:
         return self._mark
 
-    def contains(self, n: List[int]) -> bool:
-        return self._mark.contains(n.pop())
+    def contains(self, s: StateT, d: int) -> bool:
+        return self._mark.contains(s[d])
 
-    def prev(self, n: List[int], leap: int) -> Tuple[int, ...]:
-        num, _ = self._mark.prev(n.pop(), leap)
-        return (num,)
+    def prev(self, s: StateT, d: int, leap: int) -> None:
+        s[d], _ = self._mark.prev(s[d], leap)
 
-    def next(self, n: List[int], leap: int) -> Tuple[int, ...]:
-        num, _ = self._mark.next(n.pop(), leap)
-        return (num,)
+    def next(self, s: StateT, d: int, leap: int) -> None:
+        s[d], _ = self._mark.next(s[d], leap)
 
-    def cost_ahead(self, n: List[int]) -> int:
-        return self._mark.cost_ahead(n.pop())
+    def cost_ahead(self, s: StateT, d: int) -> int:
+        return self._mark.cost_ahead(s[d])
 
-    def cost_behind(self, n: List[int]) -> int:
-        return self._mark.cost_behind(n.pop())
+    def cost_behind(self, s: StateT, d: int) -> int:
+        return self._mark.cost_behind(s[d])
 
-    def reset_prev(self, n: List[int], reset: bool) -> Tuple[List[int], int, int]:
-        curr = n.pop()
+    def reset_prev(self, s: StateT, d: int, reset: bool) -> ResetT:
         if reset:
-            return [self.mark.last], 1, 0
+            s[d] = self.mark.last
+            return 1
 
+        curr = s[d]
         if curr in self.mark:
-            return [curr], 0, 0
+            return 0
 
         curr, borrow = self.mark.prev(curr, 1)
         if borrow > 0:
-            raise Indecisive
+            return None
 
-        return [curr], 1, borrow
+        s[d] = curr
+        return 1
 
-    def reset_next(self, n: List[int], reset: bool) -> Tuple[List[int], int, int]:
-        curr = n.pop()
+    def reset_next(self, s: StateT, d: int, reset: bool) -> ResetT:
         if reset:
-            return [self.mark.start], 1, 0
+            s[d] = self.mark.start
+            return 1
 
+        curr = s[d]
         if curr in self.mark:
-            return [curr], 0, 0
+            return 0
 
         curr, carry = self.mark.next(curr, 1)
         if carry > 0:
-            raise Indecisive
+            return None
 
-        return [curr], 1, carry
+        s[d] = curr
+        return 1
 
 
 class DOMonth(Day, metaclass=Meta, cap=29):
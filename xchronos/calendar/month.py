@@ -1,3 +1,4 @@
+from itertools import accumulate
 from typing import List, Tuple, Type
 from .day import Day, DOLeapFeb, DOFeb, DOMonth, DOLongM
 from .node import Node
@@ -7,6 +8,10 @@ from ..utils import Meta
 
 LONG_MONTH = (1, 0, 1, 0, 1, 0, 1, 1, 0, 1, 0, 1)
 
+# days before each month (0 base) of a common year and of a leap year
+MONTH_STARTS = tuple(accumulate((0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30)))
+LEAP_MONTH_STARTS = MONTH_STARTS[:2] + tuple(x + 1 for x in MONTH_STARTS[2:])
+
 
 class Month(Node[Day], metaclass=Meta, cap=11):
     def load_nodes(self, specs: List[SpecT]) -> Tuple[Day, ...]:
@@ -23,6 +28,9 @@ class Month(Node[Day], metaclass=Meta, cap=11):
             return self.nodes[0], 0
         return self.nodes[-1], 2
 
+    def offset(self, n: int) -> int:
+        return MONTH_STARTS[n]
+
 
 class MonthLY(Month):
     def load_nodes(self, specs: List[SpecT]) -> Tuple[Day, ...]:
@@ -32,6 +40,9 @@ class MonthLY(Month):
             DOLeapFeb(specs[0]),
         )
 
+    def offset(self, n: int) -> int:
+        return LEAP_MONTH_STARTS[n]
+
 
 WMC = Type[Node[Week]]
 WM = Node[Week]
@@ -46,4 +57,9 @@ def week_month_cls(patterns: Tuple[int, ...]) -> WMC:
             x = getattr(self, Meta.field_name("month_pattern"))[n]
             return self.nodes[x], x
 
+        def offset(self, n: int) -> int:
+            # months of 4 weeks, plus one for each long month before n
+            pattern = getattr(self, Meta.field_name("month_pattern"))
+            return 7 * (4 * n + sum(pattern[:n]))
+
     return WMonth
@@ -5,11 +5,22 @@ try:
 except ImportError:
     from ..utils import cached_property
 
-from typing import Generic, List, Tuple, TypeVar, Protocol
-from ..exceptions import Inadequate, NoShortcut, Indecisive
+from array import array
+from bisect import bisect_left
+from typing import Generic, List, Tuple, TypeVar, Protocol, Union
+from ..exceptions import Inadequate
 
 from ..mark import MarkC, MarkT, SpecT, load_mark
-from ..utils import Meta
+from ..utils import InternMeta, Layout, Meta, join_layout
+
+
+# calendar state is one mutable list of numbers from the top level down,
+# e.g. [year, month, day], a node at depth d owns s[d] and its children s[d + 1:],
+# queries write their result into it in place
+StateT = List[int]
+
+# ch of a reset, None if no mark is left before/after s under the current parent mark
+ResetT = Union[int, None]
 
 
 class LinkMarkT(Protocol):
@@ -25,39 +36,44 @@ class LinkMarkT(Protocol):
     def total_count(self) -> int:
         ...
 
-    def prev(self, n: List[int], leap: int) -> Tuple[int, ...]:
+    @property
+    def layout(self) -> Union[Layout, None]:
+        """layout of all dates in days, None if empty"""
+        ...
+
+    def prev(self, s: StateT, d: int, leap: int) -> None:
         ...
 
-    def next(self, n: List[int], leap: int) -> Tuple[int, ...]:
+    def next(self, s: StateT, d: int, leap: int) -> None:
         ...
 
-    def cost_ahead(self, n: List[int]) -> int:
+    def cost_ahead(self, s: StateT, d: int) -> int:
         ...
 
-    def cost_behind(self, n: List[int]) -> int:
+    def cost_behind(self, s: StateT, d: int) -> int:
         ...
 
-    def contains(self, n: List[int]) -> bool:
+    def contains(self, s: StateT, d: int) -> bool:
         ...
 
-    def __contains__(self, n: List[int]) -> bool:
+    def __contains__(self, s: StateT) -> bool:
         try:
-            assert isinstance(n, list)
+            assert isinstance(s, list)
         except:
             raise TypeError
-        return self.contains(n)
+        return self.contains(s, 0)
 
-    def reset_prev(self, n: List[int], reset: bool) -> Tuple[List[int], int, int]:
+    def reset_prev(self, s: StateT, d: int, reset: bool) -> ResetT:
         ...
 
-    def reset_next(self, n: List[int], reset: bool) -> Tuple[List[int], int, int]:
+    def reset_next(self, s: StateT, d: int, reset: bool) -> ResetT:
         ...
 
 
 NodeT = TypeVar("NodeT", bound=LinkMarkT)
 
 
-class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
+class Node(LinkMarkT, Generic[NodeT], metaclass=InternMeta, cap=9999):
     __slots__ = ("_nodes", "_mark")
 
     def __init__(self, specs: List[SpecT]) -> None:
@@ -92,6 +108,11 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
     def which_node(self, n: int) -> Tuple[NodeT, int]:
         ...
 
+    @abstractmethod
+    def offset(self, n: int) -> int:
+        """days from the start of this node to the start of mark n, from the epoch at year level"""
+        ...
+
     @cached_property
     def total_count(self) -> int:
         return sum(
@@ -99,22 +120,45 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
             for n in range(len(self._nodes))
         )
 
+    @cached_property
+    def layout(self) -> Union[Layout, None]:
+        parts = []
+        for m in self.marks:
+            layout = self.which_node(m)[0].layout
+            if layout is not None:
+                parts.append((self.offset(m), layout))
+        return join_layout(parts)
+
     def shortcut_next(self, n: int, leap: int) -> MarkC:
-        raise NoShortcut
+        """jump ahead by whole nodes, n and leap are returned as is without a shortcut"""
+        return n, leap
 
     def shortcut_prev(self, n: int, leap: int) -> MarkC:
         """make sure leap_left never 0"""
-        raise NoShortcut
+        return n, leap
 
-    def nodes_behind(self, n: int) -> Tuple[int, ...]:
-        """inclusive"""
+    @cached_property
+    def nodes_index(self) -> Tuple[array, ...]:
+        """
+        cumulative count of each kind of node by mark position (inclusive),
+        one column per node kind
+        """
+        columns = tuple(array("I") for _ in self._nodes)
         counts = [0] * len(self._nodes)
         for m in self.marks:
             _, idx = self.which_node(m)
             counts[idx] += 1
-            if m == n:
-                break
-        return tuple(counts)
+            for x in range(len(columns)):
+                columns[x].append(counts[x])
+        return columns
+
+    def nodes_behind(self, n: int) -> Tuple[int, ...]:
+        """inclusive"""
+        marks = self.marks
+        pos = bisect_left(marks, n)
+        if pos == len(marks) or marks[pos] != n:
+            pos = len(marks) - 1
+        return tuple(col[pos] for col in self.nodes_index)
 
     def nodes_ahead(self, n: int) -> Tuple[int, ...]:
         totals = self.total_nodes_count
@@ -125,12 +169,12 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
     def total_nodes_count(self) -> Tuple[int, ...]:
         return self.nodes_behind(self.marks[-1])
 
-    def cost_ahead(self, n: List[int]) -> int:
-        """n must have reset"""
-        curr = n.pop()
+    def cost_ahead(self, s: StateT, d: int) -> int:
+        """s must have reset"""
+        curr = s[d]
 
         node, _ = self.which_node(curr)
-        amount = node.cost_ahead(n)
+        amount = node.cost_ahead(s, d + 1)
         nodes_ahead = self.nodes_ahead(curr)
 
         return amount + sum(
@@ -138,12 +182,12 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
             for n in range(len(nodes_ahead))
         )
 
-    def cost_behind(self, n: List[int]) -> int:
-        curr = n.pop()
+    def cost_behind(self, s: StateT, d: int) -> int:
+        curr = s[d]
 
         node, _ = self.which_node(curr)
         nodes_behind = self.nodes_behind(curr)
-        amount = node.cost_behind(n)
+        amount = node.cost_behind(s, d + 1)
         return (
             sum(
                 nodes_behind[n] * (self._nodes[n].total_count)
@@ -153,77 +197,73 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
             + amount
         )
 
-    def reset_prev(self, n: List[int], reset: bool) -> Tuple[List[int], int, int]:
-        """the number list will be modified, if reset, ch will return 1"""
-        curr = n.pop()
+    def reset_prev(self, s: StateT, d: int, reset: bool) -> ResetT:
+        """s[d:] is modified in place, if reset, ch will return 1, see ResetT"""
         if reset:
-            curr = self.mark.last
+            curr = s[d] = self.mark.last
             node, _ = self.which_node(curr)
-            pts, _, _ = node.reset_prev(n.copy(), True)
-            pts.append(curr)
-            return pts, 1, 0
+            node.reset_prev(s, d + 1, True)
+            return 1
 
+        curr = s[d]
         if curr not in self.mark:
             curr, borrow = self.mark.prev(curr, 1)
             if borrow > 0:
-                raise Indecisive
+                return None
+            s[d] = curr
             node, _ = self.which_node(curr)
-            pts, _, _ = node.reset_prev(n.copy(), True)
-            pts.append(curr)
-            return pts, 1, borrow
+            node.reset_prev(s, d + 1, True)
+            return 1
 
         node, _ = self.which_node(curr)
-        try:
-            pts, ch, borrow = node.reset_prev(n.copy(), False)
-            assert borrow == 0
-        except Indecisive:
+        ch = node.reset_prev(s, d + 1, False)
+        if ch is None:
+            # children may be partly written, a reset overwrites all of them
             curr, borrow = self.mark.prev(curr, 1)
             if borrow > 0:
-                raise Indecisive
+                return None
+            s[d] = curr
             node, _ = self.which_node(curr)
-            pts, ch, _ = node.reset_prev(n.copy(), True)
-        pts.append(curr)
-        return pts, ch, borrow
+            ch = node.reset_prev(s, d + 1, True)
+        return ch
 
-    def reset_next(self, n: List[int], reset: bool) -> Tuple[List[int], int, int]:
-        curr = n.pop()
+    def reset_next(self, s: StateT, d: int, reset: bool) -> ResetT:
         if reset:
-            curr = self.mark.start
+            curr = s[d] = self.mark.start
             node, _ = self.which_node(curr)
-            pts, _, _ = node.reset_next(n.copy(), True)
-            pts.append(curr)
-            return pts, 1, 0
+            node.reset_next(s, d + 1, True)
+            return 1
 
+        curr = s[d]
         if curr not in self.mark:
             curr, carry = self.mark.next(curr, 1)
             if carry > 0:
-                raise Indecisive
+                return None
+            s[d] = curr
             node, _ = self.which_node(curr)
-            pts, _, _ = node.reset_next(n.copy(), True)
-            pts.append(curr)
-            return pts, 1, carry
+            node.reset_next(s, d + 1, True)
+            return 1
 
         node, _ = self.which_node(curr)
-        try:
-            pts, ch, carry = node.reset_next(n.copy(), False)
-            assert carry == 0
-        except Indecisive:
+        ch = node.reset_next(s, d + 1, False)
+        if ch is None:
             curr, carry = self.mark.next(curr, 1)
             if carry > 0:
-                raise Indecisive
+                return None
+            s[d] = curr
             node, _ = self.which_node(curr)
-            pts, ch, _ = node.reset_next(n.copy(), True)
-        pts.append(curr)
-        return pts, ch, carry
+            ch = node.reset_next(s, d + 1, True)
+        return ch
 
-    def prev(self, n: List[int], leap: int) -> Tuple[int, ...]:
-        """n has reset"""
-        curr = n.pop()
+    def prev(self, s: StateT, d: int, leap: int) -> None:
+        """s has reset"""
+        curr = s[d]
         node, _ = self.which_node(curr)
         # must have, make sure curr is final after calculation at the end
-        leap_left = leap - node.cost_behind(n.copy())
+        leap_left = leap - node.cost_behind(s, d + 1)
         if leap_left <= 0:
-            return node.prev(n, leap) + (curr,)
+            node.prev(s, d + 1, leap)
+            return
 
         curr, borrow = self.mark.prev(curr, 1)
         if borrow > 0:
@@ -231,15 +271,12 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
 
         leap_left -= 1
         if leap_left == 0:
+            s[d] = curr
             node, _ = self.which_node(curr)
-            n, _, _ = node.reset_prev(n, True)
-            n.append(curr)
-            return tuple(n)
+            node.reset_prev(s, d + 1, True)
+            return
 
-        try:
-            curr, leap_left = self.shortcut_prev(curr, leap_left)
-        except NoShortcut:
-            pass
+        curr, leap_left = self.shortcut_prev(curr, leap_left)
 
         node, _ = self.which_node(curr)
         total_count = node.total_count
@@ -251,33 +288,30 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
             node, _ = self.which_node(curr)
             total_count = node.total_count
 
-        n, _, _ = node.reset_prev(n, True)
-        if leap_left == 0:
-            n.append(curr)
-            return tuple(n)
-        return node.prev(n, leap_left) + (curr,)
+        s[d] = curr
+        node.reset_prev(s, d + 1, True)
+        if leap_left > 0:
+            node.prev(s, d + 1, leap_left)
 
-    def next(self, n: List[int], leap: int) -> Tuple[int, ...]:
-        curr = n.pop()
+    def next(self, s: StateT, d: int, leap: int) -> None:
+        curr = s[d]
 
         node, _ = self.which_node(curr)
-        leap_left = leap - node.cost_ahead(n.copy())
+        leap_left = leap - node.cost_ahead(s, d + 1)
         if leap_left <= 0:
-            return node.next(n, leap) + (curr,)
+            node.next(s, d + 1, leap)
+            return
 
         curr, carry = self.mark.next(curr, 1)
         if carry > 0:
             raise Inadequate
         leap_left -= 1
         if leap_left == 0:
+            s[d] = curr
             node, _ = self.which_node(curr)
-            n, _, _ = node.reset_next(n, True)
-            n.append(curr)
-            return tuple(n)
-        try:
-            curr, leap_left = self.shortcut_next(curr, leap_left)
-        except NoShortcut:
-            pass
+            node.reset_next(s, d + 1, True)
+            return
+        curr, leap_left = self.shortcut_next(curr, leap_left)
 
         node, _ = self.which_node(curr)
         total_count = node.total_count
@@ -289,14 +323,13 @@ class Node(LinkMarkT, Generic[NodeT], metaclass=Meta, cap=9999):
             node, _ = self.which_node(curr)
             total_count = node.total_count
 
-        n, _, _ = node.reset_next(n, True)
-        if leap_left == 0:
-            n.append(curr)
-            return tuple(n)
-        return node.next(n, leap_left) + (curr,)
+        s[d] = curr
+        node.reset_next(s, d + 1, True)
+        if leap_left > 0:
+            node.next(s, d + 1, leap_left)
 
-    def contains(self, n: List[int]) -> bool:
-        if n[-1] not in self.mark:
+    def contains(self, s: StateT, d: int) -> bool:
+        if s[d] not in self.mark:
             return False
-        node, _ = self.which_node(n[-1])
-        return node.contains(n[:-1])
+        node, _ = self.which_node(s[d])
+        return node.contains(s, d + 1)
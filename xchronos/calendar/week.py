@@ -18,6 +18,9 @@ class Week(Node[Day], metaclass=Meta, cap=3):
     def which_node(self, n: int) -> Tuple[Day, int]:
         return self.nodes[0], 0
 
+    def offset(self, n: int) -> int:
+        return 7 * n
+
     def nodes_behind(self, n: int) -> Tuple[int, ...]:
         return (self.mark.cost_behind(n) + 1,)
 
@@ -1,12 +1,23 @@
+try:
+    from functools import cached_property
+except ImportError:
+    from ..utils import cached_property
+
 from datetime import date
+from math import gcd
 from typing import Dict, List, Tuple, Type, Union
 from .day import DOLeapY, DOYear, Day
 from .month import WM, WMC, Month, MonthLY, week_month_cls
 from .node import Node, NodeT
 from .week import WOLYear, WOYear, Week
-from ..mark import SpecT
+from ..exceptions import Inadequate
+from ..mark import Every, MarkC, Seq, SpecT
+from ..parser.civil import days_from_civil, days_from_iso
 from calendar import isleap
 
+# the gregorian calendar repeats itself (leap years and weekdays) every 400 years
+GREGORIAN_CYCLE = 400
+
 
 def leap_years_behind(year: int) -> int:
     return year // 4 - year // 100 + year // 400
@@ -29,11 +40,101 @@ def d1_year(y: int) -> int:
     return (y * 365 + y // 4 - y // 100 + y // 400) % 7
 
 
-class LeapYearPattern(Node[NodeT]):
+# years covered by the lookup tables, 0 to 10000 (1 base)
+TABLE_YEARS = 10001
+
+
+class YearTable:
+    """
+    per year lookup tables indexed by the 1 base year, each built on first use,
+    which_node runs inside per year loops so calendar arithmetic is done once
+    """
+
+    @cached_property
+    def leap(self) -> bytes:
+        """1 if leap year"""
+        return bytes(isleap(y) for y in range(TABLE_YEARS))
+
+    @cached_property
+    def weeks(self) -> bytes:
+        """weeks_in_year"""
+        return bytes(
+            weeks_in_year(y) if 0 < y < TABLE_YEARS - 1 else 0
+            for y in range(TABLE_YEARS)
+        )
+
+    @cached_property
+    def pattern(self) -> bytes:
+        """index into YEAR_PATTERN"""
+        return bytes(2 * d1_year(y - 1) + isleap(y) for y in range(TABLE_YEARS))
+
+
+YEARS = YearTable()
+
+
+class GregorianCycle(Node[NodeT]):
+    """
+    year level node, which_node is periodic with GREGORIAN_CYCLE,
+    leaps across many years jump by whole cycles instead of year by year
+    """
+
+    @cached_property
+    def cycle(self) -> Tuple[int, int]:
+        """(# of marks, # of leaps) in a full cycle, (0, 0) if mark is not periodic"""
+        if isinstance(self.mark, Every):
+            itv = 1
+        elif isinstance(self.mark, Seq) and not self.mark.cross_base:
+            itv = self.mark.itv
+        else:
+            return 0, 0
+
+        span = GREGORIAN_CYCLE // gcd(itv, GREGORIAN_CYCLE)
+        count = sum(
+            self.which_node((self.mark.start + x * itv) % GREGORIAN_CYCLE)[0].total_count
+            for x in range(span)
+        )
+        return span, count
+
+    def shortcut_next(self, n: int, leap: int) -> MarkC:
+        span, count = self.cycle
+        if count == 0:
+            return n, leap
+        stride = (leap - 1) // count
+        if stride == 0:
+            return n, leap
+        num, carry = self.mark.next(n, stride * span)
+        if carry > 0:
+            raise Inadequate
+        return num, leap - count * stride
+
+    def shortcut_prev(self, n: int, leap: int) -> MarkC:
+        span, count = self.cycle
+        if count == 0:
+            return n, leap
+        stride = (leap - 1) // count
+        if stride == 0:
+            return n, leap
+        num, borrow = self.mark.prev(n, stride * span)
+        if borrow > 0:
+            raise Inadequate
+        return num, leap - count * stride
+
+
+class LeapYearPattern(GregorianCycle[NodeT]):
     def which_node(self, n: int) -> Tuple[NodeT, int]:
-        idx = int(isleap(n + 1))
+        idx = YEARS.leap[n + 1]
         return self.nodes[idx], idx
 
+    def offset(self, n: int) -> int:
+        return days_from_civil(n + 1, 1, 1)
+
+
+class ISOYear(GregorianCycle[NodeT]):
+    """years of iso weeks, starting on the monday of week 1"""
+
+    def offset(self, n: int) -> int:
+        return days_from_iso(n + 1, 1, 1)
+
 
 class Year(LeapYearPattern[Month], cap=9998):
     def load_nodes(self, specs: List[SpecT]) -> Tuple[Month, ...]:
@@ -51,7 +152,7 @@ class DYear(LeapYearPattern[Day], cap=9998):
         )
 
 
-class WYear(Node[Week], cap=9998):
+class WYear(ISOYear[Week], cap=9998):
     def load_nodes(self, specs: List[SpecT]) -> Tuple[Week, ...]:
         return (
             WOYear(specs),
@@ -59,7 +160,7 @@ class WYear(Node[Week], cap=9998):
         )
 
     def which_node(self, n: int) -> Tuple[Week, int]:
-        x = weeks_in_year(n + 1)
+        x = YEARS.weeks[n + 1]
         return self.nodes[x], x
 
 
@@ -83,9 +184,38 @@ YEAR_PATTERN = (
 )
 
 
+def year_pattern_index(y: int, base: int = 0) -> int:
+    """index into YEAR_PATTERN"""
+    y += 1 - base
+    if 0 <= y < TABLE_YEARS:
+        return YEARS.pattern[y]
+    return 2 * d1_year(y - 1) + int(isleap(y))
+
+
 def year_pattern_of(y: int, base: int = 0) -> int:
-    x = 2 * d1_year(y - base) + int(isleap(y + 1 - base))
-    return YEAR_PATTERN[x]
+    return YEAR_PATTERN[year_pattern_index(y, base)]
+
+
+def load_week_tables(
+    pattern: int,
+) -> Tuple[Tuple[int, ...], Tuple[Tuple[int, int], ...]]:
+    """
+    iso weeks before each month (0 base month),
+    and (month, week of month) of each iso week of the year (1 base, 0 is padding)
+    """
+    offsets = [0]
+    weeks = [(0, 0)]
+    for m in range(1, 13):
+        wkm = 4 + (pattern >> (12 - m) & 1)
+        weeks.extend((m, w) for w in range(1, wkm + 1))
+        offsets.append(offsets[-1] + wkm)
+    return tuple(offsets), tuple(weeks)
+
+
+# YEAR_PATTERN index -> cumulative weeks before each month, (month, week of month) of each week
+WEEK_OFFSETS, MONTH_WEEKS = (
+    tuple(tables) for tables in zip(*(load_week_tables(pt) for pt in YEAR_PATTERN))
+)
 
 
 def load_wm_cls() -> Tuple[Dict[int, int], Tuple[WMC, ...]]:
@@ -98,15 +228,16 @@ def load_wm_cls() -> Tuple[Dict[int, int], Tuple[WMC, ...]]:
 
 
 PATTERN_INDEX, WM_CLS = load_wm_cls()
+# YEARS.pattern index -> index of its WM_CLS
+WM_INDEX = tuple(PATTERN_INDEX[pt] for pt in YEAR_PATTERN)
 
 
-class WMYear(Node[WM], cap=9998):
+class WMYear(ISOYear[WM], cap=9998):
     def load_nodes(self, specs: List[SpecT]) -> Tuple[WM, ...]:
         return tuple(c(specs) for c in WM_CLS)
 
     def which_node(self, n: int) -> Tuple[WM, int]:
-        x = year_pattern_of(n)
-        px = PATTERN_INDEX[x]
+        px = WM_INDEX[YEARS.pattern[n + 1]]
         return self.nodes[px], px
 
 
@@ -1,14 +1,28 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Protocol, Tuple, Union
-
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Protocol,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .batch import Batch, lost_day, to_seconds
+from .cache import compile_cache
 from .calendar.calendar import CMode, Calendar
-from .clock.clock import Clock, TimeT
+from .calendar.node import LinkMarkT, Node, StateT
+from .clock.clock import TimeT, load_clock
+from .parser.civil import DAY_SECONDS
 from .parser.calc import CalcDecD, CalcDecM, CalcDecMW, CalcDecW, CalcP
 from .parser.datetime import DTE, DTEncD, DTEncM, DTEncMW, DTEncW
-from .parser.specs.period import PeriodDecoder
-from .parser.specs.point import CronDecoder
+from .parser.specs.lexer import CronLexer, PeriodLexer
 from .calendar.calendar import CMode
-from .exceptions import Inadequate, Indecisive
+from .exceptions import Inadequate
+from .mark import SpecT
 
 _MODE_CALC_DEC: Dict[CMode, CalcP] = {
     CMode.D: CalcDecD,
@@ -27,6 +41,19 @@ _MODE_DT_ENC: Dict[CMode, DTE] = {
 
 MIN_DT_UNIT = timedelta(seconds=1)
 
+_EPOCH = datetime(1970, 1, 1)
+
+# [start, end) of a span window
+IntervalT = Tuple[datetime, datetime]
+
+
+def _cache_key(cron: str, mode: CMode) -> Tuple[str, CMode]:
+    """expression with normalized spacing and its resolved mode"""
+    crons = cron.split(";")
+    if len(crons) > 1:
+        mode = CMode(crons[1].strip())
+    return " ".join(crons[0].split()), CMode(mode)
+
 
 class ChronosT(Protocol):
     mode: CMode
@@ -37,78 +64,246 @@ class ChronosT(Protocol):
 
     def contains(self, now: Union[datetime, None] = None) -> bool: ...
 
+    def prev_ts(self, ts: int, leap: int = 1) -> int: ...
+
+    def next_ts(self, ts: int, leap: int = 1) -> int: ...
+
+    def contains_ts(self, ts: int) -> bool: ...
+
+    def iter_prev(self, now: Union[datetime, None] = None) -> Iterator[datetime]: ...
+
+    def count(self, start: datetime, end: datetime) -> int: ...
+
+    def rank(self, now: Union[datetime, None] = None) -> int: ...
+
+    def unrank(self, idx: int) -> datetime: ...
+
+    def iter_next(self, now: Union[datetime, None] = None) -> Iterator[datetime]: ...
+
     def __contains__(self, now: datetime) -> bool:
         return self.contains(now)
 
 
 class _ChronosFromSpecs(ChronosT):
-    __slots__ = ("_calendar", "_clock", "_mode", "_calc_dec", "_dt_enc")
+    __slots__ = ("_calendar", "_clock", "_mode", "_calc_dec", "_dt_enc", "_batch")
 
     def __init__(self, cal_specs, clock_specs, mode: CMode) -> None:
         self._mode = mode
         self._calendar = Calendar(cal_specs, self._mode)
-        self._clock = Clock(*clock_specs)
+        self._clock = load_clock(*clock_specs)
 
         self._calc_dec = _MODE_CALC_DEC[self._mode]
         self._dt_enc = _MODE_DT_ENC[self._mode]
+        self._batch = None
 
     @property
     def mode(self):
         return self._mode
 
-    def _reset(
-        self, pts: Tuple[int, ...], fn: str, tfn: str
-    ) -> Tuple[List[int], TimeT, int]:
-        cals = list(pts[-4::-1])
-        clocks = pts[-3], pts[-2], pts[-1]
-        try:
-            dts, ch, _ = getattr(self._calendar, fn)(cals)
-        except Indecisive:
+    def _reset(self, s: StateT, fn: str, tfn: str) -> Tuple[TimeT, int]:
+        """
+        reset s, the encoded time, in place for its calendar numbers,
+        return the reset clock and ch
+        """
+        k = len(s) - 3
+        ch = getattr(self._calendar, fn)(s)
+        if ch is None:
             raise Inadequate
 
-        clock_pts, ch, aux = getattr(self._clock, fn)(clocks, ch == 1)
+        clock_pts, ch, aux = getattr(self._clock, fn)(
+            (s[k], s[k + 1], s[k + 2]), ch == 1
+        )
         if aux > 0:
-            dts = list(getattr(self._calendar, tfn)(dts, aux))
+            getattr(self._calendar, tfn)(s, aux)
 
-        return dts, (clock_pts[0], clock_pts[1], clock_pts[2]), ch
+        return (clock_pts[0], clock_pts[1], clock_pts[2]), ch
 
-    def prev(self, now: Union[datetime, None] = None, leap: int = 1) -> datetime:
-        now = now or datetime.now()
-        encs = self._dt_enc.encode(now)
-        dts, clocks, ch = self._reset(encs, "reset_prev", "prev")
+    def _prev(self, s: StateT, leap: int) -> TimeT:
+        """move s to the prev occurrence in place, return its clock"""
+        clocks, ch = self._reset(s, "reset_prev", "prev")
         leap -= ch
         if leap == 0:
-            return self._calc_dec.decode(tuple(dts[::-1]), clocks)
+            return clocks
 
         clocks, borrow = self._clock.prev(clocks, leap)
-        dts = self._calendar.prev(dts, borrow)
-        return self._calc_dec.decode(dts[::-1], clocks)
+        # also without a borrow, a Seq across the base may move under a leap of 0
+        self._calendar.prev(s, borrow)
+        return clocks
 
-    def next(self, now: Union[datetime, None] = None, leap: int = 1) -> datetime:
-        now = now or datetime.now()
-        encs = self._dt_enc.encode(now)
-        dts, clocks, ch = self._reset(encs, "reset_next", "next")
+    def _next(self, s: StateT, leap: int) -> TimeT:
+        """move s to the next occurrence in place, return its clock"""
+        clocks, ch = self._reset(s, "reset_next", "next")
         leap -= ch
         if leap == 0:
-            return self._calc_dec.decode(tuple(dts[::-1]), clocks)
+            return clocks
         clocks, carry = self._clock.next(clocks, leap)
-        dts = self._calendar.next(dts, carry)
+        # also without a carry, a Seq across the base may move under a leap of 0
+        self._calendar.next(s, carry)
+        return clocks
 
-        return self._calc_dec.decode(dts[::-1], clocks)
+    def prev(self, now: Union[datetime, None] = None, leap: int = 1) -> datetime:
+        now = now or datetime.now()
+        s = list(self._dt_enc.encode(now))
+        return self._calc_dec.decode(s, self._prev(s, leap))
 
-    def contains(self, now: Union[datetime, None] = None) -> bool:
+    def next(self, now: Union[datetime, None] = None, leap: int = 1) -> datetime:
+        now = now or datetime.now()
+        s = list(self._dt_enc.encode(now))
+        return self._calc_dec.decode(s, self._next(s, leap))
+
+    def prev_ts(self, ts: int, leap: int = 1) -> int:
+        """prev in int epoch seconds, no datetime is built on the way"""
+        s = list(self._dt_enc.encode_ts(ts))
+        return self._calc_dec.decode_ts(s, self._prev(s, leap))
+
+    def next_ts(self, ts: int, leap: int = 1) -> int:
+        """next in int epoch seconds, no datetime is built on the way"""
+        s = list(self._dt_enc.encode_ts(ts))
+        return self._calc_dec.decode_ts(s, self._next(s, leap))
+
+    def iter_prev(self, now: Union[datetime, None] = None) -> Iterator[datetime]:
+        """yield prev(now, 1), prev(now, 2), ... leaping one step from the last state"""
         now = now or datetime.now()
-        encs = self._dt_enc.encode(now)
+        s = list(self._dt_enc.encode(now))
+        try:
+            clocks, ch = self._reset(s, "reset_prev", "prev")
+            if ch == 1:
+                yield self._calc_dec.decode(s, clocks)
+            while True:
+                clocks, borrow = self._clock.prev(clocks, 1)
+                if borrow > 0:
+                    self._calendar.prev(s, borrow)
+                yield self._calc_dec.decode(s, clocks)
+        except Inadequate:
+            return
+
+    def iter_next(self, now: Union[datetime, None] = None) -> Iterator[datetime]:
+        """yield next(now, 1), next(now, 2), ... leaping one step from the last state"""
+        now = now or datetime.now()
+        s = list(self._dt_enc.encode(now))
+        try:
+            clocks, ch = self._reset(s, "reset_next", "next")
+            if ch == 1:
+                yield self._calc_dec.decode(s, clocks)
+            while True:
+                clocks, carry = self._clock.next(clocks, 1)
+                if carry > 0:
+                    self._calendar.next(s, carry)
+                yield self._calc_dec.decode(s, clocks)
+        except Inadequate:
+            return
+
+    def aiter(self, now: Union[datetime, None] = None) -> AsyncIterator[datetime]:
+        """async iterate fire times after now as the wall clock reaches them"""
+        from .aio import aiter_next
+
+        return aiter_next(self, now)
+
+    @property
+    def total_count(self) -> int:
+        """# of all occurrences in the supported range of years"""
+        return self._calendar.total_count * self._clock.total_count
+
+    @property
+    def gaps(self) -> Union[Tuple[timedelta, timedelta], None]:
+        """
+        (min, max) gap between consecutive occurrences, None if it occurs once,
+        a search for the next occurrence never has to look further than max
+        """
+        days = self._calendar.layout
+        secs = self._clock.layout
+        gaps = []
+        if secs.min_gap is not None:
+            gaps += [secs.min_gap, secs.max_gap]
+        if days.min_gap is not None:
+            # from the last time of a date to the first time of the next one
+            wrap = secs.first - secs.last
+            gaps += [
+                days.min_gap * DAY_SECONDS + wrap,
+                days.max_gap * DAY_SECONDS + wrap,
+            ]
+        if not gaps:
+            return None
+        return timedelta(seconds=min(gaps)), timedelta(seconds=max(gaps))
+
+    def _rank(self, s: StateT) -> int:
+        try:
+            clocks, _ = self._reset(s, "reset_next", "next")
+        except Inadequate:
+            return self.total_count
+        return self._calendar.cost_behind(s) * self._clock.total_count + (
+            self._clock.cost_behind(clocks)
+        )
+
+    def rank(self, now: Union[datetime, None] = None) -> int:
+        """# of occurrences before now, i.e. index of the first occurrence from now on"""
+        now = now or datetime.now()
+        return self._rank(list(self._dt_enc.encode(now)))
+
+    def rank_ts(self, ts: int) -> int:
+        """rank for int epoch seconds"""
+        return self._rank(list(self._dt_enc.encode_ts(ts)))
+
+    def unrank(self, idx: int) -> datetime:
+        """the occurrence at index idx (0 base), inverse of rank"""
+        if idx < 0:
+            raise Inadequate
+        s = list(self._dt_enc.encode(datetime.min))
+        clocks, _ = self._reset(s, "reset_next", "next")
+        if idx == 0:
+            return self._calc_dec.decode(s, clocks)
+        clocks, carry = self._clock.next(clocks, idx)
+        if carry > 0:
+            self._calendar.next(s, carry)
+        return self._calc_dec.decode(s, clocks)
+
+    def count(self, start: datetime, end: datetime) -> int:
+        """# of occurrences in [start, end)"""
+        return max(self.rank(end) - self.rank(start), 0)
+
+    def count_ts(self, start: int, end: int) -> int:
+        """count for int epoch seconds"""
+        return max(self.rank_ts(end) - self.rank_ts(start), 0)
+
+    @property
+    def batch(self) -> Batch:
+        if self._batch is None:
+            self._batch = Batch(
+                self._calendar, self._clock, self._dt_enc, self._calc_dec
+            )
+        return self._batch
+
+    def prev_many(self, arr, leap: int = 1):
+        """prev of each element in a numpy datetime64 (or int epoch seconds) array"""
+        return self.batch.prev_many(arr, leap)
+
+    def next_many(self, arr, leap: int = 1):
+        """next of each element in a numpy datetime64 (or int epoch seconds) array"""
+        return self.batch.next_many(arr, leap)
+
+    def contains_many(self, arr):
+        """boolean mask of contains for a numpy datetime64 (or int epoch seconds) array"""
+        return self.batch.contains_many(arr)
+
+    def _contains(self, encs: Tuple[int, ...]) -> bool:
         return self._clock.contains(
             (encs[-3], encs[-2], encs[-1])
-        ) and self._calendar.contains(list(encs[-4::-1]))
+        ) and self._calendar.contains(encs)
+
+    def contains(self, now: Union[datetime, None] = None) -> bool:
+        now = now or datetime.now()
+        return self._contains(self._dt_enc.encode(now))
+
+    def contains_ts(self, ts: int) -> bool:
+        """contains for int epoch seconds"""
+        return self._contains(self._dt_enc.encode_ts(ts))
 
 
 class ChronoX(_ChronosFromSpecs):
     __slots__ = "_cron"
 
     def __init__(self, cron: str, mode: CMode = CMode.M) -> None:
-        crons = cron.replace("-", "~").replace("L", "-").split(";")
+        crons = cron.split(";")
         self._cron = crons[0].strip()
 
         if len(crons) > 1:
@@ -116,20 +311,167 @@ class ChronoX(_ChronosFromSpecs):
         else:
             _mode = mode
 
-        cal_specs, clock_specs = CronDecoder.decode(self._cron, _mode)
+        cal_specs, clock_specs = CronLexer.decode(self._cron, _mode)
 
         super().__init__(cal_specs, clock_specs, _mode)
 
+    @classmethod
+    def compile(cls, cron: str, mode: CMode = CMode.M) -> "ChronoX":
+        """instance shared by identical expressions through the compile cache"""
+        key = _cache_key(cron, mode)
+        return compile_cache.get((cls,) + key, lambda: cls(*key))
+
     @property
     def cron(self):
         return self._cron
 
 
+def _compare(s: Tuple[int, ...], j: int, node: LinkMarkT, ref: List[int]) -> int:
+    """
+    sign of s[j:] - ref[j:], node is the calendar node at depth j,
+    negative calendar numbers in ref resolve on the nodes s runs through
+    """
+    k = len(s) - 3
+    for t in range(j, len(s)):
+        v = ref[t]
+        if v < 0:
+            v += node.cap + 1
+        if s[t] != v:
+            return -1 if s[t] < v else 1
+        if t + 1 < k:
+            node, _ = node.which_node(v)
+    return 0
+
+
+def _ordered(lower: List[int], upper: List[int], split: int) -> Union[bool, None]:
+    """
+    if lower <= upper from split on in every unit, None if it depends on the unit,
+    a number and an L number compare differently by month
+    """
+    for t in range(split, len(lower)):
+        a, b = lower[t], upper[t]
+        if a != b:
+            return a < b if (a < 0) == (b < 0) else None
+    return True
+
+
+_T = TypeVar("_T", datetime, int)
+
+
+def _or_none(find: Callable[[_T], _T], now: _T) -> Union[_T, None]:
+    """occurrence found from now, None when none is left in the years of the pattern"""
+    try:
+        return find(now)
+    except Inadequate:
+        return None
+
+
+def _seq(a: int, b: int) -> SpecT:
+    return a if a == b else (a, b, 1)
+
+
+def _tails(
+    ref: List[int], j: int, lasts: List[int], upper: bool
+) -> Iterator[List[SpecT]]:
+    """
+    specs of the fields from j on, disjoint boxes that together cover
+    every number lexicographically >= ref[j:], <= when upper
+    """
+    n = len(ref)
+    edge = lasts if upper else [0] * n
+    if ref[j:] == edge[j:]:
+        yield [None] * (n - j)
+        return
+    v = ref[j]
+    if ref[j + 1 :] == edge[j + 1 :]:
+        yield [_seq(0, v) if upper else _seq(v, lasts[j])] + [None] * (n - j - 1)
+        return
+    for tail in _tails(ref, j + 1, lasts, upper):
+        yield [v] + tail
+    if v != (0 if upper else lasts[j]):
+        rest = _seq(0, v - 1) if upper else _seq(v + 1, lasts[j])
+        yield [rest] + [None] * (n - j - 1)
+
+
+def _span_boxes(
+    shared: List[SpecT],
+    lower: List[int],
+    upper: List[int],
+    split: int,
+    lasts: List[int],
+) -> List[List[SpecT]]:
+    """
+    specs of disjoint patterns whose occurrences are every second within [lower, upper]
+    from split on, lower > upper wraps around, which only holds without shared fields
+    """
+    n = len(lower)
+    if not _ordered(lower, upper, split):
+        tails = list(_tails(lower, split, lasts, False))
+        tails += _tails(upper, split, lasts, True)
+        return [shared[:split] + tail for tail in tails]
+
+    j = split
+    while j < n and lower[j] == upper[j]:
+        j += 1
+    head = shared[:split] + lower[split:j]
+    if j == n:
+        return [head]
+    # an edge of field j whose rest is all covered joins the numbers in between
+    lo, hi = lower[j] + 1, upper[j] - 1
+    boxes = []
+    if lower[j + 1 :] == [0] * (n - j - 1):
+        lo -= 1
+    else:
+        boxes += [head + [lo - 1] + tail for tail in _tails(lower, j + 1, lasts, False)]
+    if upper[j + 1 :] == lasts[j + 1 :]:
+        hi += 1
+    else:
+        boxes += [head + [hi + 1] + tail for tail in _tails(upper, j + 1, lasts, True)]
+    if lo <= hi:
+        boxes.append(head + [_seq(lo, hi)] + [None] * (n - j - 1))
+    return boxes
+
+
+def _level_caps(chronos: _ChronosFromSpecs) -> List[List[int]]:
+    """caps of every kind of node by depth from the top level down, then of the hands"""
+    levels = []
+    nodes: Dict[int, LinkMarkT] = {id(chronos._calendar.node): chronos._calendar.node}
+    while nodes:
+        levels.append(sorted({node.cap for node in nodes.values()}))
+        nodes = {
+            id(child): child
+            for node in nodes.values()
+            if isinstance(node, Node)
+            for child in node.nodes
+        }
+    return levels + [[hand.cap] for hand in chronos._clock.hands]
+
+
+def _in_caps(spec: SpecT, caps: List[int]) -> bool:
+    """if the numbers bounding a box spec are in range under every cap"""
+    if spec is None:
+        return True
+    bounds = spec[:2] if isinstance(spec, tuple) else (spec,)
+    return all(
+        0 <= (x + cap + 1 if x < 0 else x) <= cap for x in bounds for cap in caps
+    )
+
+
 class ChronoXSpan:
-    __slots__ = ("_start", "_end", "_mode", "_cron")
+    __slots__ = (
+        "_start",
+        "_end",
+        "_mode",
+        "_cron",
+        "_split",
+        "_lower",
+        "_upper",
+        "_box_specs",
+        "_boxes",
+    )
 
     def __init__(self, cron: str, mode: CMode = CMode.M) -> None:
-        crons = cron.replace("-", "~").replace("L", "-").split(";")
+        crons = cron.split(";")
         self._cron = crons[0].strip()
 
         if len(crons) > 1:
@@ -137,10 +479,81 @@ class ChronoXSpan:
         else:
             self._mode = mode
 
-        cal_specs, clock_specs = PeriodDecoder.decode(self._cron, self._mode)
+        cal_specs, clock_specs = PeriodLexer.decode(self._cron, self._mode)
 
         self._start = _ChronosFromSpecs(cal_specs[0], clock_specs[0], self._mode)
         self._end = _ChronosFromSpecs(cal_specs[1], clock_specs[1], self._mode)
+        self._load_bounds(
+            cal_specs[0][::-1] + clock_specs[0], cal_specs[1][::-1] + clock_specs[1]
+        )
+
+    def _load_bounds(self, starts: List[SpecT], ends: List[SpecT]) -> None:
+        """
+        specs from the top level down, fields from _split on are single numbers
+        in both patterns (the span rules), fields before it are shared,
+        within a unit of the shared fields the span is [_lower, _upper],
+        both None when it wraps across units and needs the search
+        """
+        split = len(starts)
+        while split > 0 and all(
+            isinstance(specs[split - 1], int) for specs in (starts, ends)
+        ):
+            split -= 1
+        self._split = split
+
+        k = len(starts) - 3
+        lower, upper = list(starts), list(ends)
+        for t in range(max(split, k), len(starts)):
+            cap = self._start._clock.hands[t - k].cap
+            lower[t], upper[t] = (
+                x + cap + 1 if x < 0 else x for x in (lower[t], upper[t])
+            )
+
+        ordered = _ordered(lower, upper, split)
+        if ordered:
+            self._lower, self._upper = lower, upper
+        else:
+            self._lower = self._upper = None
+
+        # a wrapping window ends in the unit after its start,
+        # which is the next shared unit only when every unit is shared
+        self._box_specs = None
+        self._boxes = None
+        if ordered or (
+            ordered is not None
+            and split > 0
+            and all(spec is None for spec in starts[:split])
+        ):
+            lasts = [-1] * k + [hand.cap for hand in self._start._clock.hands]
+            self._box_specs = _span_boxes(starts, lower, upper, split, lasts)
+
+    def _load_boxes(self) -> List[_ChronosFromSpecs]:
+        """
+        patterns of every covered second, built on first use,
+        empty when the bounds are unknown or out of range in some unit
+        """
+        if self._boxes is None:
+            self._boxes = []
+            box_specs = self._box_specs or []
+            levels = _level_caps(self._start)
+            split = self._split
+            if all(
+                _in_caps(spec, caps)
+                for specs in box_specs
+                for spec, caps in zip(specs[split:], levels[split:])
+            ):
+                for specs in box_specs:
+                    k = len(specs) - 3
+                    self._boxes.append(
+                        _ChronosFromSpecs(specs[k - 1 :: -1], specs[k:], self._mode)
+                    )
+        return self._boxes
+
+    @classmethod
+    def compile(cls, cron: str, mode: CMode = CMode.M) -> "ChronoXSpan":
+        """instance shared by identical expressions through the compile cache"""
+        key = _cache_key(cron, mode)
+        return compile_cache.get((cls,) + key, lambda: cls(*key))
 
     @property
     def mode(self):
@@ -158,8 +571,151 @@ class ChronoXSpan:
     def end(self) -> ChronosT:
         return self._end
 
+    def _contains(self, s: Tuple[int, ...]) -> bool:
+        """
+        compare the encoded fields of now against the shared fields
+        and the bounds of the span, no search involved
+        """
+        k = len(s) - 3
+        node = self._start._calendar.node
+        hands = self._start._clock.hands
+        for j in range(self._split):
+            if j >= k:
+                if s[j] not in hands[j - k]:
+                    return False
+            else:
+                if s[j] not in node.mark:
+                    return False
+                if j + 1 < k:
+                    node, _ = node.which_node(s[j])
+
+        j = self._split
+        return (
+            _compare(s, j, node, self._lower) >= 0
+            and _compare(s, j, node, self._upper) <= 0
+        )
+
     def contains(self, now: Union[datetime, None] = None) -> bool:
         now = now or datetime.now()
-        return self.start.next(now) > self.end.next(now - MIN_DT_UNIT)
+        if self._lower is not None:
+            return self._contains(self._start._dt_enc.encode(now))
+        return self._search(
+            _or_none(self._start.next, now), _or_none(self._end.next, now - MIN_DT_UNIT)
+        )
 
     __contains__ = contains
+
+    @staticmethod
+    def _search(st: Union[_T, None], end: Union[_T, None]) -> bool:
+        """
+        now is in the span when an end comes before the next start,
+        no start left counts as one after every end, no end left as outside the span
+        """
+        return end is not None and (st is None or st > end)
+
+    def _run(self, end: datetime) -> IntervalT:
+        """
+        [start, end) of the seconds contains accepts around the occurrence end of
+        the end pattern, back to the last start before it, or across the end before
+        it when no start comes between, and on across every later end with no start
+        before it, datetime.min when it runs back past the first start
+        """
+        hi = lo = end
+        while True:
+            last = _or_none(self._end.prev, lo)
+            st = _or_none(self._start.prev, lo + MIN_DT_UNIT)
+            if st is not None and (last is None or st > last):
+                lo = st
+                break
+            if last is None:
+                lo = datetime.min
+                break
+            lo = last
+        while True:
+            nxt = _or_none(self._end.next, hi)
+            if nxt is None:
+                break
+            st = _or_none(self._start.next, hi)
+            if st is not None and st <= nxt:
+                break
+            hi = nxt
+        return lo, hi + MIN_DT_UNIT
+
+    def next_interval(self, now: Union[datetime, None] = None) -> IntervalT:
+        """
+        [start, end) of the first piece of the span starting after now,
+        end is one second after the occurrence of the end pattern
+        """
+        now = now or datetime.now()
+        for st, end in self.iter_intervals(now, datetime.max):
+            if st > now:
+                return st, end
+        raise Inadequate
+
+    def prev_interval(self, now: Union[datetime, None] = None) -> IntervalT:
+        """[start, end) of the last piece of the span starting before now, it may not have ended"""
+        now = now or datetime.now()
+        end = _or_none(self._end.next, now - MIN_DT_UNIT)
+        if end is not None:
+            run = self._run(end)
+            if run[0] < now:
+                return run
+        end = self._end.prev(now)
+        return self._run(end)
+
+    def iter_intervals(self, a: datetime, b: datetime) -> Iterator[IntervalT]:
+        """
+        [start, end) of every piece of the span overlapping [a, b) in order, not clipped,
+        the pieces hold the seconds contains accepts, no more and no less,
+        so they start at datetime.min for a span wrapping in from before its years
+        and stop at the last end of its years
+        """
+        end = _or_none(self._end.next, a - MIN_DT_UNIT)
+        while end is not None:
+            st, hi = self._run(end)
+            if st >= b:
+                return
+            yield st, hi
+            end = _or_none(self._end.next, hi - MIN_DT_UNIT)
+
+    def coverage(self, a: datetime, b: datetime) -> timedelta:
+        """
+        total duration of the seconds contains accepts within [a, b), counted as the
+        occurrences of the patterns of covered seconds, walking the pieces when there are none
+        """
+        boxes = self._load_boxes()
+        if boxes:
+            return sum(box.count(a, b) for box in boxes) * MIN_DT_UNIT
+        total = timedelta()
+        for st, end in self.iter_intervals(a, b):
+            total += min(end, b) - max(st, a)
+        return total
+
+    def coverage_ts(self, a: int, b: int) -> int:
+        """coverage in int epoch seconds"""
+        boxes = self._load_boxes()
+        if boxes:
+            return sum(box.count_ts(a, b) for box in boxes)
+        total = self.coverage(_EPOCH + a * MIN_DT_UNIT, _EPOCH + b * MIN_DT_UNIT)
+        return total // MIN_DT_UNIT
+
+    def contains_ts(self, ts: int) -> bool:
+        """contains for int epoch seconds"""
+        if self._lower is not None:
+            return self._contains(self._start._dt_enc.encode_ts(ts))
+        return self._search(
+            _or_none(self._start.next_ts, ts), _or_none(self._end.next_ts, ts - 1)
+        )
+
+    def contains_many(self, arr):
+        """boolean mask of contains for a numpy datetime64 (or int epoch seconds) array"""
+        secs, _ = to_seconds(arr)
+        starts = self._start.batch.next_many(secs, strict=False)
+        ends = self._end.batch.next_many(secs - 1, strict=False)
+        mask = starts > ends
+        if self._lower is not None:
+            # past the years of the span, as for contains, the fields decide
+            past = lost_day() * DAY_SECONDS
+            lost = (starts >= past) | (ends >= past)
+            mask[lost] = [self.contains_ts(ts) for ts in secs[lost].tolist()]
+        return mask
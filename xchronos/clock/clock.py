@@ -1,6 +1,8 @@
 from typing import Callable, List, Tuple
 from .hand import Hour, Minute, Second
-from ..mark import SpecT
+from .table import SecondTable, split_seconds
+from ..mark import EnumM, Seq, SpecT
+from ..utils import POINT, Layout, join_layout
 
 TimeT = Tuple[int, int, int]
 MarkF = Callable[[int, int], Tuple[int, int]]
@@ -29,6 +31,28 @@ class Clock:
     def hour(self):
         return self.hands[0]
 
+    @property
+    def total_count(self) -> int:
+        return self.hour.count * self.minute.count * self.second.count
+
+    @property
+    def layout(self) -> Layout:
+        """layout of the day in seconds"""
+        second = join_layout((s, POINT) for s in self.second.marks)
+        minute = join_layout((60 * m, second) for m in self.minute.marks)
+        return join_layout((3600 * h, minute) for h in self.hour.marks)
+
+    def cost_ahead(self, now: TimeT) -> int:
+        """now should be reset already, # of leaps left in the day"""
+        return self.total_count - 1 - self.cost_behind(now)
+
+    def cost_behind(self, now: TimeT) -> int:
+        """now should be reset already, # of leaps from the start of the day"""
+        return (
+            self.hour.cost_behind(now[0]) * self.minute.count
+            + self.minute.cost_behind(now[1])
+        ) * self.second.count + self.second.cost_behind(now[2])
+
     def reset_prev(self, now: TimeT, reset: bool = False) -> Tuple[List[int], int, int]:
         if reset:
             return [x.last for x in self._hands], 1, 0
@@ -103,3 +127,88 @@ class Clock:
         return all(now[x] in self.hands[x] for x in range(len(self.hands) - 1, -1, -1))
 
     __contains__ = contains
+
+
+class TableClock(Clock):
+    """
+    Clock resolving every query on the SecondTable of its hands,
+    one or two lookups instead of a chain of carries through the hands
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self, hour: SpecT, mins: SpecT, sec: SpecT) -> None:
+        super().__init__(hour, mins, sec)
+        self._table = SecondTable(*self._hands)
+
+    @property
+    def table(self) -> SecondTable:
+        return self._table
+
+    @property
+    def total_count(self) -> int:
+        return self._table.count
+
+    def cost_behind(self, now: TimeT) -> int:
+        return self._table.rank(now[0] * 3600 + now[1] * 60 + now[2])
+
+    def reset_prev(self, now: TimeT, reset: bool = False) -> Tuple[List[int], int, int]:
+        table = self._table
+        if reset:
+            return list(split_seconds(table.select(table.count - 1))), 1, 0
+
+        x = now[0] * 3600 + now[1] * 60 + now[2]
+        if table.contains(x):
+            return list(now), 0, 0
+
+        r = table.rank(x)
+        if r == 0:
+            return list(split_seconds(table.select(table.count - 1))), 1, 1
+        return list(split_seconds(table.select(r - 1))), 1, 0
+
+    def reset_next(self, now: TimeT, reset: bool = False) -> Tuple[List[int], int, int]:
+        table = self._table
+        if reset:
+            return list(split_seconds(table.select(0))), 1, 0
+
+        x = now[0] * 3600 + now[1] * 60 + now[2]
+        if table.contains(x):
+            return list(now), 0, 0
+
+        r = table.rank(x)
+        if r == table.count:
+            return list(split_seconds(table.select(0))), 1, 1
+        return list(split_seconds(table.select(r))), 1, 0
+
+    def prev(self, now: TimeT, leap: int = 1) -> Tuple[TimeT, int]:
+        """now should be reset already"""
+        table = self._table
+        borrow, pos = divmod(self.cost_behind(now) - leap, table.count)
+        return split_seconds(table.select(pos)), -borrow
+
+    def next(self, now: TimeT, leap: int = 1) -> Tuple[TimeT, int]:
+        table = self._table
+        carry, pos = divmod(self.cost_behind(now) + leap, table.count)
+        return split_seconds(table.select(pos)), carry
+
+    def contains(self, now: TimeT) -> bool:
+        return self._table.contains(now[0] * 3600 + now[1] * 60 + now[2])
+
+    __contains__ = contains
+
+
+def load_clock(hour: SpecT, mins: SpecT, sec: SpecT) -> Clock:
+    """
+    TableClock when a hand enumerates its marks, as carrying through a list
+    costs a search per hand, Clock for regular hands and a single time of the day,
+    a Seq across the base keeps Clock, its contains and next disagree with its marks
+    """
+    clock = Clock(hour, mins, sec)
+    marks = [hand.mark for hand in clock.hands]
+    if (
+        clock.total_count > 1
+        and any(isinstance(mark, EnumM) for mark in marks)
+        and not any(isinstance(mark, Seq) and mark.cross_base for mark in marks)
+    ):
+        return TableClock(hour, mins, sec)
+    return clock
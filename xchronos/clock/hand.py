@@ -1,15 +1,19 @@
 from typing import Tuple
 from ..mark import MarkC, MarkT, SpecT, load_mark
-from ..utils import Meta
+from ..utils import InternMeta, Meta
 
 
-class Hand(MarkT, metaclass=Meta, cap=59):
+class Hand(MarkT, metaclass=InternMeta, cap=59):
     __slots__ = "_mark"
 
     def __init__(self, spec: SpecT) -> None:
         cap = getattr(self, Meta.field_name("cap"))
         self._mark: MarkT = load_mark(spec, cap=cap)
 
+    @property
+    def mark(self) -> MarkT:
+        return self._mark
+
     @property
     def marks(self) -> Tuple[int, ...]:
         return self._mark.marks
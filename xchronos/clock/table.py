@@ -0,0 +1,82 @@
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Tuple
+
+from .hand import Hand
+from ..parser.civil import DAY_SECONDS
+from ..utils import InternMeta
+
+try:
+    _popcount = int.bit_count
+except AttributeError:
+
+    def _popcount(n: int) -> int:
+        return bin(n).count("1")
+
+
+# 64 bit words covering the day
+_WORDS = -(-DAY_SECONDS // 64)
+
+
+class SecondTable(metaclass=InternMeta):
+    """
+    seconds of the day a clock occurs at, as an 86,400 bit bitmap
+    with the # of occurrences before each 64 bit word,
+    rank is a lookup and a popcount, select a bisect over the words and a bit scan,
+    tables are interned by their hands
+    """
+
+    __slots__ = ("_words", "_ranks", "__weakref__")
+
+    def __init__(self, hour: Hand, minute: Hand, second: Hand) -> None:
+        row = 0
+        for s in second.marks:
+            row |= 1 << s
+        hour_row = 0
+        for m in minute.marks:
+            hour_row |= row << 60 * m
+        day = 0
+        for h in hour.marks:
+            day |= hour_row << 3600 * h
+
+        self._words = array("Q")
+        self._words.frombytes(day.to_bytes(_WORDS * 8, sys.byteorder))
+
+        # ranks[w]: # of occurrences before word w
+        self._ranks = array("I", bytes(4 * (_WORDS + 1)))
+        acc = 0
+        for w in range(_WORDS):
+            acc += _popcount(self._words[w])
+            self._ranks[w + 1] = acc
+
+    @property
+    def count(self) -> int:
+        return self._ranks[-1]
+
+    @property
+    def nbytes(self) -> int:
+        """memory held by the bitmap and its rank directory"""
+        words, ranks = self._words, self._ranks
+        return words.itemsize * len(words) + ranks.itemsize * len(ranks)
+
+    def contains(self, x: int) -> bool:
+        return self._words[x >> 6] >> (x & 63) & 1 == 1
+
+    def rank(self, x: int) -> int:
+        """# of occurrences before second x"""
+        w = x >> 6
+        return self._ranks[w] + _popcount(self._words[w] & ((1 << (x & 63)) - 1))
+
+    def select(self, k: int) -> int:
+        """second of the kth occurrence (0 base), k must be less than count"""
+        w = bisect_right(self._ranks, k) - 1
+        word = self._words[w]
+        for _ in range(k - self._ranks[w]):
+            word &= word - 1
+        return (w << 6) + (word & -word).bit_length() - 1
+
+
+def split_seconds(x: int) -> Tuple[int, int, int]:
+    """(hour, minute, second) of a second of the day"""
+    return x // 3600, x // 60 % 60, x % 60
@@ -1,10 +1,15 @@
-from typing import List, Protocol, Set, Tuple, Union
+from array import array
+from bisect import bisect_right
+from typing import Hashable, List, Protocol, Set, Tuple, Union
+from weakref import WeakValueDictionary
 
 try:
     from functools import cached_property
 except ImportError:
     from utils import cached_property
 
+from .utils import freeze
+
 # [mark value, # of leap for upper level, borrow/carry considered when across base point]
 MarkC = Tuple[int, int]
 
@@ -404,11 +409,8 @@ class EnumM(MarkT):
         cap: the max of the number in the cycle\n
 
         -------
-        resulting marks list will be sorted, repeated mark will be eliminated
-        TODO implement a binary search version of bin_of and dispatch with __new__,
-        for large list, just in case some input potentially slows system down
-
-
+        resulting marks list will be sorted, repeated mark will be eliminated,
+        for large or dense list, use BitsetM instead (load_mark dispatches it)
         """
         assert cap > 0, "cap must be positve"
         self._cap = cap
@@ -451,10 +453,7 @@ class EnumM(MarkT):
 
     def bin_of(self, n: int) -> int:
         """n must be within range, otherwise incorrect result"""
-        for x in range(1, len(self.marks)):
-            if self.marks[x] > n:
-                return x - 1
-        return self.count - 1
+        return bisect_right(self.marks, n) - 1
 
     def nth(self, n: int) -> int:
         n %= self.count
@@ -513,10 +512,89 @@ class EnumM(MarkT):
         return n in self._mark_set
 
 
-SpecT = Union[int, None, Tuple[int, int, int], List[int]]
+class BitsetM(EnumM):
+    """
+    EnumM keeping the cycle as a bitmask with a prefix popcount table,
+    positioning a number is O(1) regardless of # of marks
+    """
+
+    __slots__ = ("_bits", "_ranks")
+
+    def __init__(self, marks: List[int], cap: int) -> None:
+        super().__init__(marks, cap)
+        bits = 0
+        for m in self._marks:
+            bits |= 1 << m
+        self._bits = bits
+
+        # ranks[x]: # of marks <= x
+        ranks = array("H", bytes(2 * (cap + 1)))
+        acc = 0
+        for x in range(cap + 1):
+            acc += bits >> x & 1
+            ranks[x] = acc
+        self._ranks = ranks
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    def rank(self, n: int) -> int:
+        """# of marks less than or equal to n"""
+        if n < 0:
+            return 0
+        if n >= self.cap:
+            return self.count
+        return self._ranks[n]
+
+    def bin_of(self, n: int) -> int:
+        """n must be within range, otherwise incorrect result"""
+        return self.rank(n) - 1
+
+    def cost_ahead(self, n: int) -> int:
+        return self.count - self.rank(n)
+
+    def cost_behind(self, n: int) -> int:
+        return self.rank(n - 1)
+
+    def contains(self, n: int) -> bool:
+        return n >= 0 and self._bits >> n & 1 == 1
+
+
+SpecT = Union[
+    int, None, Tuple[int, int, int], List[Union[int, Tuple[int, int, int]]]
+]
+
+# enumerations longer than this, or covering more than 1/BITSET_DENSITY
+# of the cycle, are loaded as BitsetM
+BITSET_MIN_COUNT = 16
+BITSET_DENSITY = 4
+
+
+def _enum_marks(spec: List[Union[int, Tuple[int, int, int]]], cap: int) -> List[int]:
+    """merge list items into plain marks, sequence items expand to their marks"""
+    marks: List[int] = []
+    for s in spec:
+        if isinstance(s, tuple):
+            marks.extend(Seq(*s, cap=cap).marks)
+        else:
+            marks.append(s)
+    return marks
+
+
+# (frozen spec, args) -> live mark, marks are immutable so equal specs share one
+_MARKS: "WeakValueDictionary[Hashable, MarkT]" = WeakValueDictionary()
 
 
 def load_mark(spec: SpecT, *args, **kwargs):
+    key = (freeze(spec), args, tuple(sorted(kwargs.items())))
+    mark = _MARKS.get(key)
+    if mark is None:
+        mark = _MARKS.setdefault(key, _load_mark(spec, *args, **kwargs))
+    return mark
+
+
+def _load_mark(spec: SpecT, *args, **kwargs):
     if spec is None:
         return Every(*args, **kwargs)
 
@@ -524,7 +602,11 @@ def load_mark(spec: SpecT, *args, **kwargs):
         return Solo(spec, *args, **kwargs)
 
     if isinstance(spec, list):
-        return EnumM(spec, *args, **kwargs)
+        cap = kwargs.get("cap", args[0] if args else 0)
+        marks = _enum_marks(spec, cap)
+        if len(marks) >= BITSET_MIN_COUNT or len(marks) * BITSET_DENSITY > cap:
+            return BitsetM(marks, *args, **kwargs)
+        return EnumM(marks, *args, **kwargs)
 
     if isinstance(spec, tuple) and len(spec) == 3:
         return Seq(*spec, **kwargs)
@@ -0,0 +1,229 @@
+from datetime import datetime
+from typing import Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+from .calendar.calendar import Calendar, CMode
+from .calendar.node import LinkMarkT, Node
+from .chronos import ChronoX, ChronoXSpan, _ChronosFromSpecs
+from .exceptions import Inadequate
+from .mark import MarkT, Seq
+from .parser.datetime import DTE
+
+RuleT = Union[ChronoX, ChronoXSpan]
+
+# numbers a rule takes by depth and cap, None for every number up to the cap
+EntriesT = List[Dict[int, Union[Iterable[int], None]]]
+
+
+def _levels(chronos: _ChronosFromSpecs) -> List[Dict[int, MarkT]]:
+    """
+    mark of every kind of node by depth and cap, from the top level down,
+    a mark is loaded from its spec and cap only, so the cap tells it apart
+    """
+    levels = []
+    nodes: Dict[int, LinkMarkT] = {id(chronos._calendar.node): chronos._calendar.node}
+    while nodes:
+        levels.append({node.cap: node.mark for node in nodes.values()})
+        nodes = {
+            id(child): child
+            for node in nodes.values()
+            if isinstance(node, Node)
+            for child in node.nodes
+        }
+    return levels + [{hand.cap: hand.mark} for hand in chronos._clock.hands]
+
+
+def _marks(mark: MarkT) -> Union[Iterable[int], None]:
+    if mark.count == mark.cap + 1:
+        return None
+    if isinstance(mark, Seq) and mark.cross_base:
+        # as for contains, the ends of a wrap around Seq are not among its numbers
+        return [x for x in range(mark.cap + 1) if x in mark]
+    return mark.marks
+
+
+def _rule_entries(rule: RuleT) -> Tuple[EntriesT, bool]:
+    """numbers of each field the rule may take, and if they match exactly"""
+    if isinstance(rule, _ChronosFromSpecs):
+        levels = _levels(rule)
+        return [{c: _marks(m) for c, m in level.items()} for level in levels], True
+
+    levels = _levels(rule._start)
+    entries: EntriesT = [{c: _marks(m) for c, m in level.items()} for level in levels]
+    n, split = len(levels), rule._split
+    if rule._lower is None:
+        # a wrapping window runs on past the units of its start, no field narrows it
+        return [dict.fromkeys(level) for level in levels], False
+
+    lower, upper = rule._lower, rule._upper
+    j = split
+    while j < n and lower[j] == upper[j]:
+        j += 1
+    for t in range(split, n):
+        for cap in levels[t]:
+            lo, hi = (x + cap + 1 if x < 0 else x for x in (lower[t], upper[t]))
+            if t > j or (lo <= 0 and hi >= cap):
+                entries[t][cap] = None
+            else:
+                entries[t][cap] = range(max(lo, 0), min(hi, cap) + 1)
+
+    # the fields after j are free only when both bounds are at their edges
+    k = n - 3
+    lasts = [-1] * k + [hand.cap for hand in rule._start._clock.hands]
+    exact = j == n or (not any(lower[j + 1 :]) and upper[j + 1 :] == lasts[j + 1 :])
+    return entries, exact
+
+
+def _bit_ids(bits: int) -> List[int]:
+    """positions of the set bits, scanned in C rather than bit by bit"""
+    digits = bin(bits)[:1:-1]
+    ids = []
+    i = digits.find("1")
+    while i >= 0:
+        ids.append(i)
+        i = digits.find("1", i + 1)
+    return ids
+
+
+class _ModeIndex:
+    """
+    inverted bitsets of the rules in one mode, bit i stands for the rule of id i,
+    by depth, rules taking every number under a cap and rules taking a number
+    """
+
+    __slots__ = ("enc", "_node", "_clock_caps", "_full", "_values", "verify")
+
+    def __init__(self, chronos: _ChronosFromSpecs) -> None:
+        self.enc = chronos._dt_enc
+        depth = len(self.enc.encode(datetime.min))
+        # caps along a path are the same in every tree of the mode
+        self._node = Calendar([None] * (depth - 3), chronos.mode).node
+        self._clock_caps = [hand.cap for hand in chronos._clock.hands]
+        self._full: List[Dict[int, int]] = [{} for _ in range(depth)]
+        self._values: List[Dict[Tuple[int, int], int]] = [{} for _ in range(depth)]
+        # rules to check one by one after the fields match
+        self.verify = 0
+
+    def add(self, i: int, entries: EntriesT) -> List[Tuple[Dict, Hashable]]:
+        """set bit i in every bitset of entries, return where"""
+        bit = 1 << i
+        where: List[Tuple[Dict, Hashable]] = []
+        for t, level in enumerate(entries):
+            for cap, nums in level.items():
+                if nums is None:
+                    where.append((self._full[t], cap))
+                else:
+                    where += ((self._values[t], (cap, v)) for v in nums)
+        for bitsets, key in where:
+            bitsets[key] = bitsets.get(key, 0) | bit
+        return where
+
+    def caps(self, s: Tuple[int, ...]) -> List[int]:
+        k = len(s) - 3
+        node = self._node
+        caps = [node.cap]
+        for t in range(k - 1):
+            node, _ = node.which_node(s[t])
+            caps.append(node.cap)
+        return caps + self._clock_caps
+
+    def match(self, s: Tuple[int, ...]) -> int:
+        """bits of the rules whose fields all take s"""
+        bits = -1
+        for t, cap in enumerate(self.caps(s)):
+            bits &= self._full[t].get(cap, 0) | self._values[t].get((cap, s[t]), 0)
+            if not bits:
+                break
+        return bits
+
+
+class MatchIndex:
+    """
+    rules under keys, indexed by the numbers each field of their spec trees takes,
+    match ANDs one bitset per field for all rules of a mode at once,
+    spans that a field-wise match cannot decide are checked one by one afterwards
+    """
+
+    __slots__ = ("_ids", "_rules", "_where", "_free", "_modes")
+
+    def __init__(self) -> None:
+        self._ids: Dict[Hashable, int] = {}
+        self._rules: List[Union[Tuple[Hashable, RuleT], None]] = []
+        self._where: Dict[int, Tuple[_ModeIndex, List[Tuple[Dict, Hashable]]]] = {}
+        # ids of removed rules, reused so that bitsets do not keep growing
+        self._free: List[int] = []
+        self._modes: Dict[CMode, _ModeIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._ids
+
+    def _mode_index(self, rule: RuleT) -> _ModeIndex:
+        chronos = rule if isinstance(rule, _ChronosFromSpecs) else rule._start
+        idx = self._modes.get(rule.mode)
+        if idx is None:
+            idx = self._modes[rule.mode] = _ModeIndex(chronos)
+        return idx
+
+    def add(self, key: Hashable, rule: RuleT) -> None:
+        """index rule under key, replacing the rule under the same key"""
+        self.remove(key)
+        idx = self._mode_index(rule)
+        entries, exact = _rule_entries(rule)
+
+        i = self._free.pop() if self._free else len(self._rules)
+        if i == len(self._rules):
+            self._rules.append(None)
+        self._rules[i] = (key, rule)
+        self._ids[key] = i
+        self._where[i] = idx, idx.add(i, entries)
+        if not exact:
+            idx.verify |= 1 << i
+
+    def remove(self, key: Hashable) -> bool:
+        i = self._ids.pop(key, None)
+        if i is None:
+            return False
+        idx, where = self._where.pop(i)
+        mask = ~(1 << i)
+        for bitsets, k in where:
+            bits = bitsets.get(k, 0) & mask
+            if bits:
+                bitsets[k] = bits
+            else:
+                bitsets.pop(k, None)
+        idx.verify &= mask
+        self._rules[i] = None
+        self._free.append(i)
+        return True
+
+    def _match(
+        self, encode: Callable[[DTE], Tuple[int, ...]], check: Callable[[RuleT], bool]
+    ) -> List[Hashable]:
+        keys = []
+        for idx in self._modes.values():
+            bits = idx.match(encode(idx.enc))
+            if not bits:
+                continue
+            checks = bits & idx.verify
+            for i in _bit_ids(bits ^ checks):
+                keys.append(self._rules[i][0])
+            for i in _bit_ids(checks):
+                key, rule = self._rules[i]
+                try:
+                    if check(rule):
+                        keys.append(key)
+                except Inadequate:
+                    # past the years of the rule, it takes nothing
+                    continue
+        return keys
+
+    def match(self, now: Union[datetime, None] = None) -> List[Hashable]:
+        """keys of every rule that contains now"""
+        now = now or datetime.now()
+        return self._match(lambda enc: enc.encode(now), lambda r: r.contains(now))
+
+    def match_ts(self, ts: int) -> List[Hashable]:
+        """match for int epoch seconds"""
+        return self._match(lambda enc: enc.encode_ts(ts), lambda r: r.contains_ts(ts))
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta
 from typing import Protocol, Tuple
-from ..calendar.year import year_pattern_of
+from ..calendar.year import WEEK_OFFSETS, year_pattern_index
 
 from ..clock.clock import TimeT
 from ..utils import reload_1
+from .civil import civil_from_days, days_from_civil, days_from_iso, join_ts
 
 
 class CalcP(Protocol):
@@ -11,6 +12,11 @@ class CalcP(Protocol):
     def decode(date: Tuple[int, ...], clock: TimeT) -> datetime:
         ...
 
+    @staticmethod
+    def decode_ts(date: Tuple[int, ...], clock: TimeT) -> int:
+        """same as decode, to epoch seconds"""
+        ...
+
 
 class CalcDecM(CalcP):
     @staticmethod
@@ -22,6 +28,11 @@ class CalcDecM(CalcP):
             *clock,
         )
 
+    @staticmethod
+    def decode_ts(date: Tuple[int, ...], clock: TimeT) -> int:
+        days = days_from_civil(date[0] + 1, date[1] + 1, date[2] + 1)
+        return join_ts(days, *clock)
+
 
 class CalcDecD(CalcP):
     @staticmethod
@@ -29,23 +40,38 @@ class CalcDecD(CalcP):
         d1 = datetime(reload_1(date[0]), 1, 1, *clock)
         return d1 + timedelta(reload_1(date[1]) - 1)
 
+    @staticmethod
+    def decode_ts(date: Tuple[int, ...], clock: TimeT) -> int:
+        return join_ts(days_from_civil(date[0] + 1, 1, 1) + date[1], *clock)
+
 
 class CalcDecW(CalcP):
     @staticmethod
     def decode(date: Tuple[int, ...], clock: TimeT) -> datetime:
-        dt = datetime.fromisocalendar(*(reload_1(_) for _ in date))
-        return dt.replace(hour=clock[0], minute=clock[1], second=clock[2])
+        days = days_from_iso(date[0] + 1, date[1] + 1, date[2] + 1)
+        return datetime(*civil_from_days(days), *clock)
+
+    @staticmethod
+    def decode_ts(date: Tuple[int, ...], clock: TimeT) -> int:
+        days = days_from_iso(date[0] + 1, date[1] + 1, date[2] + 1)
+        return join_ts(days, *clock)
+
+
+def _week_of_year(year: int, month: int, wom: int) -> int:
+    """iso week of year of a week of month, 1 base"""
+    return WEEK_OFFSETS[year_pattern_index(year, 1)][month - 1] + wom
 
 
 class CalcDecMW(CalcP):
     @staticmethod
     def decode(date: Tuple[int, ...], clock: TimeT) -> datetime:
-        date = tuple(reload_1(_) for _ in date)
-        pt = year_pattern_of(date[0], 1)
-        woy = (
-            date[2]
-            + (date[1] - 1) * 4
-            + sum(pt >> (12 - m) & 1 for m in range(1, date[1]))
-        )
-        dt = datetime.fromisocalendar(date[0], woy, date[3])
-        return dt.replace(hour=clock[0], minute=clock[1], second=clock[2])
+        year = date[0] + 1
+        woy = _week_of_year(year, date[1] + 1, date[2] + 1)
+        days = days_from_iso(year, woy, date[3] + 1)
+        return datetime(*civil_from_days(days), *clock)
+
+    @staticmethod
+    def decode_ts(date: Tuple[int, ...], clock: TimeT) -> int:
+        year = date[0] + 1
+        woy = _week_of_year(year, date[1] + 1, date[2] + 1)
+        return join_ts(days_from_iso(year, woy, date[3] + 1), *clock)
@@ -0,0 +1,74 @@
+"""integer civil date arithmetic on days since the unix epoch, no datetime involved"""
+from typing import Tuple
+
+DAY_SECONDS = 86400
+
+# days from 0000-03-01 to 1970-01-01
+_EPOCH_SHIFT = 719468
+_ERA_DAYS = 146097
+
+
+def days_from_civil(y: int, m: int, d: int) -> int:
+    """days since 1970-01-01 of the proleptic gregorian date y-m-d"""
+    y -= m <= 2
+    era = y // 400
+    yoe = y - era * 400
+    doy = (153 * (m + (-3 if m > 2 else 9)) + 2) // 5 + d - 1
+    doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+    return era * _ERA_DAYS + doe - _EPOCH_SHIFT
+
+
+def civil_from_days(z: int) -> Tuple[int, int, int]:
+    """(year, month, day) of days since 1970-01-01"""
+    z += _EPOCH_SHIFT
+    era = z // _ERA_DAYS
+    doe = z - era * _ERA_DAYS
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    d = doy - (153 * mp + 2) // 5 + 1
+    m = mp + 3 if mp < 10 else mp - 9
+    return yoe + era * 400 + (m <= 2), m, d
+
+
+def iso_weekday(z: int) -> int:
+    """1 (monday) to 7 (sunday), 1970-01-01 is a thursday"""
+    return (z + 3) % 7 + 1
+
+
+def iso_from_days(z: int) -> Tuple[int, int, int]:
+    """(iso year, iso week, iso weekday) of days since 1970-01-01"""
+    wd = iso_weekday(z)
+    # the iso year is the year of the thursday in the same week
+    thursday = z - wd + 4
+    year = civil_from_days(thursday)[0]
+    return year, (thursday - days_from_civil(year, 1, 1)) // 7 + 1, wd
+
+
+def days_from_iso(year: int, week: int, wd: int) -> int:
+    """days since 1970-01-01 of an iso calendar date"""
+    jan4 = days_from_civil(year, 1, 4)
+    return jan4 - iso_weekday(jan4) + 1 + (week - 1) * 7 + wd - 1
+
+
+# datetime supported range, year 1 to 9999
+MIN_TS = days_from_civil(1, 1, 1) * DAY_SECONDS
+MAX_TS = days_from_civil(10000, 1, 1) * DAY_SECONDS - 1
+
+
+def split_ts(ts: int) -> Tuple[int, int, int, int]:
+    """(days since epoch, hour, minute, second) of epoch seconds"""
+    if not MIN_TS <= ts <= MAX_TS:
+        raise ValueError(f"timestamp {ts} out of range")
+    days, secs = divmod(ts, DAY_SECONDS)
+    hour, secs = divmod(secs, 3600)
+    minute, second = divmod(secs, 60)
+    return days, hour, minute, second
+
+
+def join_ts(days: int, hour: int, minute: int, second: int) -> int:
+    """epoch seconds, inverse of split_ts"""
+    ts = days * DAY_SECONDS + hour * 3600 + minute * 60 + second
+    if not MIN_TS <= ts <= MAX_TS:
+        raise ValueError(f"timestamp {ts} out of range")
+    return ts
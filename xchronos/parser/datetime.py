@@ -1,8 +1,9 @@
 from datetime import date, datetime
 from typing import Protocol, Tuple
 
-from ..calendar.year import year_pattern_of
+from ..calendar.year import MONTH_WEEKS, year_pattern_index
 from ..utils import shift_0
+from .civil import civil_from_days, days_from_civil, iso_from_days, split_ts
 
 
 class DTE(Protocol):
@@ -10,6 +11,11 @@ class DTE(Protocol):
     def encode(now: datetime) -> Tuple[int, ...]:
         ...
 
+    @staticmethod
+    def encode_ts(ts: int) -> Tuple[int, ...]:
+        """same as encode, from epoch seconds"""
+        ...
+
 
 class DTEncM(DTE):
     @staticmethod
@@ -23,22 +29,24 @@ class DTEncM(DTE):
             now.second,
         )
 
+    @staticmethod
+    def encode_ts(ts: int) -> Tuple[int, ...]:
+        days, hour, minute, second = split_ts(ts)
+        y, m, d = civil_from_days(days)
+        # all 1 base and positive, shift_0 is a plain decrement
+        return (y - 1, m - 1, d - 1, hour, minute, second)
+
+
+def _month_week(year: int, woy: int) -> Tuple[int, int]:
+    """(month, week of month) of an iso week of year, 1 base"""
+    return MONTH_WEEKS[year_pattern_index(year, 1)][woy]
+
 
 class DTEncMW(DTE):
     @staticmethod
     def encode(now: datetime) -> Tuple[int, ...]:
         year, woy, wd = now.isocalendar()
-        pt = year_pattern_of(year, 1)
-
-        wk_sum = 0
-        m = 0
-        wkm = 0
-        while wk_sum < woy:
-            m += 1
-            wkm = 4 + (pt >> (12 - m) & 1)
-            wk_sum += wkm
-
-        wom = woy - wk_sum + wkm
+        m, wom = _month_week(year, woy)
 
         return (
             shift_0(year),
@@ -50,6 +58,13 @@ class DTEncMW(DTE):
             now.second,
         )
 
+    @staticmethod
+    def encode_ts(ts: int) -> Tuple[int, ...]:
+        days, hour, minute, second = split_ts(ts)
+        year, woy, wd = iso_from_days(days)
+        m, wom = _month_week(year, woy)
+        return (year - 1, m - 1, wom - 1, wd - 1, hour, minute, second)
+
 
 class DTEncW(DTE):
     @staticmethod
@@ -64,6 +79,12 @@ class DTEncW(DTE):
             now.second,
         )
 
+    @staticmethod
+    def encode_ts(ts: int) -> Tuple[int, ...]:
+        days, hour, minute, second = split_ts(ts)
+        y, w, d = iso_from_days(days)
+        return (y - 1, w - 1, d - 1, hour, minute, second)
+
 
 class DTEncD(DTE):
     @staticmethod
@@ -77,3 +98,9 @@ class DTEncD(DTE):
             now.minute,
             now.second,
         )
+
+    @staticmethod
+    def encode_ts(ts: int) -> Tuple[int, ...]:
+        days, hour, minute, second = split_ts(ts)
+        y = civil_from_days(days)[0]
+        return (y - 1, days - days_from_civil(y, 1, 1), hour, minute, second)
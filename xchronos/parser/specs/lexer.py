@@ -0,0 +1,176 @@
+from typing import List, Tuple, Union
+from ...calendar.calendar import CMode
+from ...exceptions import ModeMismatch, NoMatch
+from ...mark import SpecT
+from ...utils import shift_0
+
+# (start, end) specs of a field of a span
+PSpectT = Tuple[SpecT, SpecT]
+
+_DIGITS = frozenset("0123456789")
+
+# field kinds, a span field forbids every, list and sequence fields after it
+_SOLO = 0
+_OTHER = 1
+_SPAN = 2
+
+# returned as index when nothing could be scanned
+_MISS = -1
+
+ItemT = Union[int, Tuple[int, int, int]]
+
+
+def _digits(s: str, i: int, n: int) -> Tuple[int, int]:
+    """unsigned number at i, and the index after it"""
+    j = i
+    while j < n and s[j] in _DIGITS:
+        j += 1
+    if j == i:
+        return 0, _MISS
+    return int(s[i:j]), j
+
+
+def _number(s: str, i: int, n: int) -> Tuple[int, int]:
+    """number at i, L marks it negative (counted from the last)"""
+    if i < n and s[i] == "L":
+        num, j = _digits(s, i + 1, n)
+        return -num, j
+    return _digits(s, i, n)
+
+
+def _item(s: str, i: int, n: int, base: int) -> Tuple[ItemT, int]:
+    """N, N-N, N-N/K or */K at i, and the index after it"""
+    if i < n and s[i] == "*":
+        if i + 1 < n and s[i + 1] == "/":
+            itv, j = _digits(s, i + 2, n)
+            return (0, -1, itv), j
+        return 0, _MISS
+
+    start, j = _number(s, i, n)
+    if j == _MISS:
+        return 0, _MISS
+    if base == 1:
+        start = shift_0(start)
+    if j == n or s[j] != "-":
+        return start, j
+
+    end, j = _number(s, j + 1, n)
+    if j == _MISS:
+        return 0, _MISS
+    if base == 1:
+        end = shift_0(end)
+    itv = 1
+    if j < n and s[j] == "/":
+        itv, j = _digits(s, j + 1, n)
+    return (start, end, itv), j
+
+
+def _span(s: str, dots: int, base: int) -> Tuple[int, int]:
+    """[N]..[N], both ends optional"""
+    st, end = 0, -1
+    if dots > 0:
+        st, j = _number(s, 0, dots)
+        if j != dots:
+            raise NoMatch
+        if base == 1:
+            st = shift_0(st)
+    n = len(s)
+    if dots + 2 < n:
+        end, j = _number(s, dots + 2, n)
+        if j != n:
+            raise NoMatch
+        if base == 1:
+            end = shift_0(end)
+    return st, end
+
+
+def scan_field(s: str, base: int = 0, period: bool = False) -> Tuple[SpecT, int]:
+    """spec of a single field in one pass, and its kind"""
+    if s == "*":
+        return None, _OTHER
+    if s.isdecimal():
+        num = int(s)
+        return (shift_0(num) if base == 1 else num), _SOLO
+
+    if period:
+        dots = s.find("..")
+        if dots >= 0:
+            return _span(s, dots, base), _SPAN
+
+    n = len(s)
+    item, i = _item(s, 0, n, base)
+    if i == n:
+        return item, _SOLO if isinstance(item, int) else _OTHER
+
+    items: List[ItemT] = [item]
+    while i != _MISS and i < n and s[i] == ",":
+        i += 1
+        if i == n:
+            break
+        item, i = _item(s, i, n, base)
+        items.append(item)
+
+    if i != n or len(items) < 2:
+        raise NoMatch
+    return items, _OTHER
+
+
+class CronLexer:
+    """
+    decode cronx in its raw syntax (- for ranges, L for counting from the last)
+    into specs in a single pass
+    """
+
+    mode_len = {CMode.D: 5, CMode.M: 6, CMode.W: 6, CMode.MW: 7}
+
+    @classmethod
+    def _scopes(cls, cron: str, mode: CMode) -> Tuple[List[str], int]:
+        scopes = cron.split()
+        mode_len = cls.mode_len[mode]
+        if len(scopes) < mode_len - 1 or len(scopes) > mode_len:
+            raise ModeMismatch
+        return scopes, mode_len
+
+    @classmethod
+    def decode(cls, cron: str, mode: CMode) -> Tuple[List[SpecT], List[SpecT]]:
+        scopes, mode_len = cls._scopes(cron, mode)
+        specs = [
+            scan_field(scopes[s], int(s < mode_len - 3))[0] for s in range(len(scopes))
+        ]
+        if len(scopes) == mode_len - 1:
+            specs.append(0)
+
+        return specs[-4::-1], specs[-3:]
+
+
+class PeriodLexer(CronLexer):
+    """decode periods, fields may be spans of a..b, into (start, end) specs"""
+
+    @classmethod
+    def decode(
+        cls, cron: str, mode: CMode
+    ) -> Tuple[Tuple[List[SpecT], List[SpecT]], Tuple[List[SpecT], List[SpecT]]]:
+        scopes, mode_len = cls._scopes(cron, mode)
+
+        spanned = False
+        codes: List[PSpectT] = []
+        for s in range(len(scopes)):
+            code, kind = scan_field(scopes[s], int(s < mode_len - 3), True)
+            if kind == _SPAN:
+                spanned = True
+                codes.append(code)
+            elif kind == _OTHER and spanned:
+                raise NoMatch
+            else:
+                codes.append((code, code))
+
+        if len(scopes) == mode_len - 1:
+            codes.append((0, -1))
+
+        calendar, clock = codes[-4::-1], codes[-3:]
+        calendar_st, calendar_end = zip(*calendar)
+        clock_st, clock_end = zip(*clock)
+        return (list(calendar_st), list(calendar_end)), (
+            list(clock_st),
+            list(clock_end),
+        )
@@ -132,8 +132,12 @@ class EveryDecoder(ScopeDecoder):
         return None
 
 
+# an item of a list: a single number, a range with optional step, or */step
+_ENUM_ITEM = r"(?:\*/\d+|-?\d+~-?\d+(?:/\d+)?|-?\d+)"
+
+
 class EnumDecoder(ScopeDecoder):
-    pattern = re.compile(r"^(?:-?\d+,)+-?\d+,?$")
+    pattern = re.compile(rf"^(?:{_ENUM_ITEM},)+{_ENUM_ITEM},?$")
     no_occur = (ScopeType.SPAN,)
 
     T = ScopeType.ENUM
@@ -145,10 +149,15 @@ class EnumDecoder(ScopeDecoder):
         prev_types: Union[Set[ScopeType], None] = None,
         follow: Union[ScopeType, None] = None,
         base: int = 0,
-    ) -> List[int]:
+    ) -> List[Union[int, Tuple[int, int, int]]]:
+        """plain numbers decode to int, ranges and steps to Seq specs"""
         cls.match(s, prev_types, follow)
         return [
-            shift_0(int(m)) if base == 1 else int(m) for m in s.split(",") if m != ""
+            SeqDecoder.decode(m, base=base)
+            if "~" in m or "/" in m
+            else SoloDecoder.decode(m, base=base)
+            for m in s.split(",")
+            if m != ""
         ]
 
 
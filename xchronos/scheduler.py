@@ -0,0 +1,127 @@
+from datetime import datetime
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Dict, Hashable, Iterator, List, Tuple, Union
+
+from .chronos import MIN_DT_UNIT, ChronosT
+
+# heap entry: [fire time, sequence #, key, occurrences, chronos],
+# key is _REMOVED once removed
+EntryT = List
+
+_REMOVED = object()
+
+
+class Scheduler:
+    """
+    next fire times of many ChronosT kept in a min-heap,
+    each job is advanced by one leap from its previous fire time when popped
+    """
+
+    __slots__ = ("_heap", "_entries", "_seq")
+
+    def __init__(self) -> None:
+        self._heap: List[EntryT] = []
+        self._entries: Dict[Hashable, EntryT] = {}
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def _push(
+        self, key: Hashable, occurs: Iterator[datetime], chronos: ChronosT
+    ) -> bool:
+        fire = next(occurs, None)
+        if fire is None:
+            return False
+        entry = [fire, next(self._seq), key, occurs, chronos]
+        self._entries[key] = entry
+        heappush(self._heap, entry)
+        return True
+
+    def add(
+        self, key: Hashable, chronos: ChronosT, now: Union[datetime, None] = None
+    ) -> Union[datetime, None]:
+        """
+        schedule chronos under key from now (exclusive), replacing the job under the same key,
+        return the first fire time, None if it never fires
+        """
+        self.remove(key)
+        if not self._push(key, chronos.iter_next(now or datetime.now()), chronos):
+            return None
+        return self._entries[key][0]
+
+    def remove(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        # lazy deletion, dropped when it reaches the top of the heap,
+        # or when removed entries outnumber scheduled ones
+        entry[2] = _REMOVED
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapify(self._heap)
+        return True
+
+    def reschedule(
+        self, key: Hashable, chronos: ChronosT, now: Union[datetime, None] = None
+    ) -> Union[datetime, None]:
+        return self.add(key, chronos, now)
+
+    def when(self, key: Hashable) -> datetime:
+        return self._entries[key][0]
+
+    def _clean(self) -> None:
+        while self._heap and self._heap[0][2] is _REMOVED:
+            heappop(self._heap)
+
+    def peek(self) -> Union[Tuple[datetime, Hashable], None]:
+        """the earliest (fire time, key), None if nothing is scheduled"""
+        self._clean()
+        if not self._heap:
+            return None
+        fire, _, key, _, _ = self._heap[0]
+        return fire, key
+
+    def pop_due(
+        self, now: Union[datetime, None] = None
+    ) -> List[Tuple[datetime, Hashable]]:
+        """
+        (fire time, key) of every firing up to now (inclusive) in time order,
+        popped jobs are scheduled again from their fire time
+        """
+        now = now or datetime.now()
+        due = []
+        self._clean()
+        while self._heap and self._heap[0][0] <= now:
+            fire, _, key, occurs, chronos = heappop(self._heap)
+            due.append((fire, key))
+            del self._entries[key]
+            self._push(key, occurs, chronos)
+            self._clean()
+        return due
+
+    def pop_latest(
+        self, now: Union[datetime, None] = None
+    ) -> List[Tuple[datetime, Hashable, int]]:
+        """
+        (latest fire time up to now, key, # of firings missed before it) of every due job,
+        missed firings are counted rather than replayed, jobs are scheduled again from now
+        """
+        now = now or datetime.now()
+        due = []
+        self._clean()
+        while self._heap and self._heap[0][0] <= now:
+            fire, _, key, occurs, chronos = heappop(self._heap)
+            del self._entries[key]
+            latest = chronos.prev(now + MIN_DT_UNIT)
+            missed = chronos.count(fire, latest)
+            if missed > 0:
+                occurs = chronos.iter_next(latest)
+            due.append((latest, key, missed))
+            self._push(key, occurs, chronos)
+            self._clean()
+        return due
@@ -0,0 +1,235 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from heapq import merge
+from typing import Iterable, Iterator, List, Tuple, Union
+
+from .chronos import MIN_DT_UNIT, ChronoXSpan, IntervalT, _or_none
+
+# [lo, hi) from the query time on, and if it is inside the set all along
+SegmentT = Tuple[datetime, datetime, bool]
+
+SpanLike = Union["SpanSet", ChronoXSpan]
+
+
+def _coalesce(intervals: Iterable[IntervalT]) -> Iterator[IntervalT]:
+    """join sorted intervals that overlap or touch"""
+    lo = hi = None
+    for st, end in intervals:
+        if hi is not None and st <= hi:
+            if end > hi:
+                hi = end
+            continue
+        if hi is not None:
+            yield lo, hi
+        lo, hi = st, end
+    if hi is not None:
+        yield lo, hi
+
+
+class SpanSet(ABC):
+    """
+    set of seconds composed of ChronoXSpan windows by union, intersection and difference,
+    members yield sorted disjoint intervals that are swept together lazily,
+    contains keeps the segment around the last query so a later query inside it
+    evaluates no member
+    """
+
+    __slots__ = ("_segment",)
+
+    def __init__(self) -> None:
+        self._segment: Union[SegmentT, None] = None
+
+    @abstractmethod
+    def _locate(self, now: datetime) -> SegmentT: ...
+
+    def _segment_at(self, now: datetime) -> SegmentT:
+        seg = self._segment
+        if seg is None or not seg[0] <= now < seg[1]:
+            seg = self._segment = self._locate(now)
+        return seg
+
+    def contains(self, now: Union[datetime, None] = None) -> bool:
+        now = now or datetime.now()
+        return self._segment_at(now)[2]
+
+    __contains__ = contains
+
+    @abstractmethod
+    def iter_intervals(self, a: datetime, b: datetime) -> Iterator[IntervalT]:
+        """[start, end) of every piece of the set within [a, b) in order, clipped"""
+        ...
+
+    def coverage(self, a: datetime, b: datetime) -> timedelta:
+        """total duration of the set within [a, b)"""
+        total = timedelta()
+        for st, end in self.iter_intervals(a, b):
+            total += end - st
+        return total
+
+    def __or__(self, other: SpanLike) -> "SpanSet":
+        return union(self, other)
+
+    def __and__(self, other: SpanLike) -> "SpanSet":
+        return intersection(self, other)
+
+    def __sub__(self, other: SpanLike) -> "SpanSet":
+        return difference(self, other)
+
+    def __ror__(self, other: SpanLike) -> "SpanSet":
+        return union(other, self)
+
+    def __rand__(self, other: SpanLike) -> "SpanSet":
+        return intersection(other, self)
+
+    def __rsub__(self, other: SpanLike) -> "SpanSet":
+        return difference(other, self)
+
+
+class SpanLeaf(SpanSet):
+    """windows of a single ChronoXSpan"""
+
+    __slots__ = ("_span",)
+
+    def __init__(self, span: ChronoXSpan) -> None:
+        super().__init__()
+        self._span = span
+
+    @property
+    def span(self) -> ChronoXSpan:
+        return self._span
+
+    def _locate(self, now: datetime) -> SegmentT:
+        # the same comparison as ChronoXSpan.contains, whose operands bound the segment
+        st = _or_none(self._span.start.next, now)
+        end = _or_none(self._span.end.next, now - MIN_DT_UNIT)
+        if end is None:
+            return now, datetime.max, False
+        if st is None or st > end:
+            return now, end + MIN_DT_UNIT, True
+        return now, st, False
+
+    def iter_intervals(self, a: datetime, b: datetime) -> Iterator[IntervalT]:
+        return _coalesce(
+            (max(st, a), min(end, b)) for st, end in self._span.iter_intervals(a, b)
+        )
+
+    def coverage(self, a: datetime, b: datetime) -> timedelta:
+        return self._span.coverage(a, b)
+
+
+class SpanUnion(SpanSet):
+    """seconds in any member"""
+
+    __slots__ = ("_members",)
+
+    def __init__(self, members: List[SpanSet]) -> None:
+        super().__init__()
+        self._members = members
+
+    def _locate(self, now: datetime) -> SegmentT:
+        hi = datetime.max
+        for member in self._members:
+            seg = member._segment_at(now)
+            if seg[2]:
+                return now, seg[1], True
+            hi = min(hi, seg[1])
+        return now, hi, False
+
+    def iter_intervals(self, a: datetime, b: datetime) -> Iterator[IntervalT]:
+        return _coalesce(merge(*(m.iter_intervals(a, b) for m in self._members)))
+
+
+class SpanIntersection(SpanSet):
+    """seconds in every member"""
+
+    __slots__ = ("_members",)
+
+    def __init__(self, members: List[SpanSet]) -> None:
+        super().__init__()
+        self._members = members
+
+    def _locate(self, now: datetime) -> SegmentT:
+        hi = datetime.max
+        for member in self._members:
+            seg = member._segment_at(now)
+            if not seg[2]:
+                return now, seg[1], False
+            hi = min(hi, seg[1])
+        return now, hi, True
+
+    def _sweep(self, a: datetime, b: datetime) -> Iterator[IntervalT]:
+        streams = [m.iter_intervals(a, b) for m in self._members]
+        heads = [next(s, None) for s in streams]
+        while None not in heads:
+            lo = max(st for st, _ in heads)
+            hi = min(end for _, end in heads)
+            if lo < hi:
+                yield lo, hi
+            # the intervals ending first cannot meet any later one
+            for i, (_, end) in enumerate(heads):
+                if end == hi:
+                    heads[i] = next(streams[i], None)
+
+    def iter_intervals(self, a: datetime, b: datetime) -> Iterator[IntervalT]:
+        return _coalesce(self._sweep(a, b))
+
+
+class SpanDifference(SpanSet):
+    """seconds in the first member but not in the second"""
+
+    __slots__ = ("_keep", "_drop")
+
+    def __init__(self, keep: SpanSet, drop: SpanSet) -> None:
+        super().__init__()
+        self._keep = keep
+        self._drop = drop
+
+    def _locate(self, now: datetime) -> SegmentT:
+        keep = self._keep._segment_at(now)
+        if not keep[2]:
+            return now, keep[1], False
+        drop = self._drop._segment_at(now)
+        if drop[2]:
+            return now, drop[1], False
+        return now, min(keep[1], drop[1]), True
+
+    def iter_intervals(self, a: datetime, b: datetime) -> Iterator[IntervalT]:
+        drops = self._drop.iter_intervals(a, b)
+        drop = next(drops, None)
+        for st, end in self._keep.iter_intervals(a, b):
+            while st < end:
+                while drop is not None and drop[1] <= st:
+                    drop = next(drops, None)
+                if drop is None or drop[0] >= end:
+                    yield st, end
+                    break
+                if drop[0] > st:
+                    yield st, drop[0]
+                st = drop[1]
+
+
+def _as_set(x: SpanLike) -> SpanSet:
+    return x if isinstance(x, SpanSet) else SpanLeaf(x)
+
+
+def union(*xs: SpanLike) -> SpanSet:
+    """seconds in any of xs, nested unions are flattened into one sweep"""
+    assert xs, "union of nothing"
+    members: List[SpanSet] = []
+    for x in map(_as_set, xs):
+        members += x._members if isinstance(x, SpanUnion) else [x]
+    return SpanUnion(members)
+
+
+def intersection(*xs: SpanLike) -> SpanSet:
+    """seconds in all of xs, nested intersections are flattened into one sweep"""
+    assert xs, "intersection of nothing"
+    members: List[SpanSet] = []
+    for x in map(_as_set, xs):
+        members += x._members if isinstance(x, SpanIntersection) else [x]
+    return SpanIntersection(members)
+
+
+def difference(keep: SpanLike, drop: SpanLike) -> SpanSet:
+    """seconds in keep but not in drop"""
+    return SpanDifference(_as_set(keep), _as_set(drop))
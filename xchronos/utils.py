@@ -1,6 +1,7 @@
 from abc import ABCMeta
 from threading import RLock
-from typing import _ProtocolMeta
+from typing import Hashable, Iterable, NamedTuple, Tuple, Union, _ProtocolMeta
+from weakref import WeakValueDictionary
 
 
 class Meta(_ProtocolMeta, ABCMeta):
@@ -15,6 +16,76 @@ class Meta(_ProtocolMeta, ABCMeta):
         return f"__meta_{name}__"
 
 
+def freeze(spec) -> Hashable:
+    """hashable form of a spec, lists kept apart from tuples"""
+    if isinstance(spec, list):
+        return (list, tuple(freeze(s) for s in spec))
+    if isinstance(spec, tuple):
+        return tuple(freeze(s) for s in spec)
+    return spec
+
+
+# (class, frozen args) -> live instance
+_INTERNED: "WeakValueDictionary[Hashable, object]" = WeakValueDictionary()
+
+
+class InternMeta(Meta):
+    """
+    instances are interned by (class, spec), building an equal spec again
+    returns the live instance along with its cached tables,
+    instances must not be mutated after __init__
+    """
+
+    def __call__(cls, *args, **kwargs):
+        key = (cls, freeze(args), freeze(tuple(sorted(kwargs.items()))))
+        inst = _INTERNED.get(key)
+        if inst is None:
+            inst = _INTERNED.setdefault(key, super().__call__(*args, **kwargs))
+        return inst
+
+
+class Layout(NamedTuple):
+    """
+    offsets of the first and the last occurrence from the start of a unit,
+    min and max gap between consecutive occurrences, None with a single one
+    """
+
+    first: int
+    last: int
+    min_gap: Union[int, None]
+    max_gap: Union[int, None]
+
+
+# a unit with a single occurrence at its start
+POINT = Layout(0, 0, None, None)
+
+
+def _lower(a: Union[int, None], b: int) -> int:
+    return b if a is None or b < a else a
+
+
+def _upper(a: Union[int, None], b: int) -> int:
+    return b if a is None or b > a else a
+
+
+def join_layout(parts: Iterable[Tuple[int, Layout]]) -> Union[Layout, None]:
+    """layout of (offset, layout) parts in increasing offsets, None if there is no part"""
+    first = last = lo = hi = None
+    for offset, part in parts:
+        if last is None:
+            first = offset + part.first
+        else:
+            gap = offset + part.first - last
+            lo, hi = _lower(lo, gap), _upper(hi, gap)
+        if part.min_gap is not None:
+            lo, hi = _lower(lo, part.min_gap), _upper(hi, part.max_gap)
+        last = offset + part.last
+
+    if first is None:
+        return None
+    return Layout(first, last, lo, hi)
+
+
 def shift_0(num: int):
     """convert the num from 1 to 0 base, 0 always means first number"""
     return num - 1 if num > 0 else num